@@ -7,22 +7,24 @@ This module provides centralized configuration management with:
 - Thread-safe access
 """
 
-import os
 import json
 import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Sequence
+from dataclasses import dataclass, field, fields, asdict
 
 from .validators import ConfigValidator
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration with default values.
 
     This dataclass defines all configurable options for the application.
     """
+    # Names of all configuration fields (populated after class creation)
+    _VALID_KEYS: ClassVar[FrozenSet[str]] = frozenset()
+
     # Download settings
     download_path: str = field(default_factory=lambda: str(Path.home() / "Downloads"))
     quality: str = "best"
@@ -35,7 +37,7 @@ class AppConfig:
 
     # Subtitle settings
     include_subtitles: bool = False
-    subtitle_langs: list = field(default_factory=lambda: ["en"])
+    subtitle_langs: Sequence[str] = ("en",)  # shared immutable default
     auto_translate_subtitles: bool = False
 
     # Post-processing
@@ -67,17 +69,57 @@ class AppConfig:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return asdict(self)
+        data = asdict(self)
+        data['subtitle_langs'] = list(data['subtitle_langs'])
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> 'AppConfig':
         """Create from dictionary."""
         # Filter only valid keys
-        valid_keys = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_keys = cls._VALID_KEYS
         filtered_data = {k: v for k, v in data.items() if k in valid_keys}
         return cls(**filtered_data)
 
 
+AppConfig._VALID_KEYS = frozenset(f.name for f in fields(AppConfig))
+
+
+def _is_ascii_only(data: dict) -> bool:
+    """Check whether every string value in a config dict is ASCII.
+
+    Args:
+        data: Configuration dictionary
+
+    Returns:
+        True if no string (or string list item) contains non-ASCII text
+    """
+    for value in data.values():
+        if isinstance(value, str):
+            if not value.isascii():
+                return False
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, str) and not item.isascii():
+                    return False
+    return True
+
+
+def _dump_config(data: dict, f) -> None:
+    """Write a config dict as JSON, using the fast ASCII encoder when possible.
+
+    Args:
+        data: Configuration dictionary
+        f: Open text file to write to
+    """
+    if _is_ascii_only(data):
+        # Output is identical, but the default encoder skips the
+        # per-string non-ASCII handling of ensure_ascii=False.
+        json.dump(data, f, indent=2)
+    else:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 class ConfigManager:
     """Manages application configuration with persistence.
 
@@ -125,26 +167,26 @@ class ConfigManager:
         """
         with self._lock:
             try:
-                if os.path.exists(self.config_file):
+                try:
                     with open(self.config_file, 'r', encoding='utf-8') as f:
                         data = json.load(f)
-
-                    # Validate configuration
-                    result = ConfigValidator.validate_config(data)
-                    if result.is_valid:
-                        self._config = AppConfig.from_dict(result.sanitized_value)
-                    else:
-                        # Use sanitized values even with errors
-                        self._config = AppConfig.from_dict(result.sanitized_value)
-
-                    self._dirty = False
-                    return True
-                else:
+                except FileNotFoundError:
                     # Create default config
                     self._config = AppConfig()
                     self.save()
                     return True
 
+                # Validate configuration
+                result = ConfigValidator.validate_config(data)
+                if result.is_valid:
+                    self._config = AppConfig.from_dict(result.sanitized_value)
+                else:
+                    # Use sanitized values even with errors
+                    self._config = AppConfig.from_dict(result.sanitized_value)
+
+                self._dirty = False
+                return True
+
             except Exception as e:
                 print(f"Error loading config: {e}")
                 self._config = AppConfig()
@@ -161,7 +203,7 @@ class ConfigManager:
                 data = self._config.to_dict()
 
                 with open(self.config_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    _dump_config(data, f)
 
                 self._dirty = False
                 return True
@@ -194,7 +236,7 @@ class ConfigManager:
             True if set successfully
         """
         with self._lock:
-            if not hasattr(self._config, key):
+            if key not in AppConfig._VALID_KEYS:
                 return False
 
             # Validate single value
@@ -224,22 +266,23 @@ class ConfigManager:
         Returns:
             True if all updates successful
         """
+        valid_keys = AppConfig._VALID_KEYS
+
         with self._lock:
-            changes = []
+            changed = False
 
             for key, value in updates.items():
-                if hasattr(self._config, key):
-                    old_value = getattr(self._config, key)
-                    setattr(self._config, key, value)
-                    changes.append((key, old_value, value))
+                if key not in valid_keys:
+                    continue
 
-            if changes:
-                self._dirty = True
+                old_value = getattr(self._config, key)
+                setattr(self._config, key, value)
+                self._dirty = changed = True
 
-                # Notify callbacks
-                for key, old_value, new_value in changes:
-                    self._notify_change(key, old_value, new_value)
+                # Notify callbacks as each key is applied
+                self._notify_change(key, old_value, value)
 
+            if changed:
                 # Auto-save if enabled
                 if self.auto_save:
                     self.save()
@@ -322,7 +365,7 @@ class ConfigManager:
         try:
             data = self.get_all()
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                _dump_config(data, f)
             return True
         except Exception:
             return False
@@ -7,18 +7,20 @@ URLs, file paths, and configuration values.
 import os
 import re
 import shutil
-from typing import Tuple, Optional, List, Any, Dict
+import stat
+from typing import Tuple, Optional, List, Any, Dict, Iterable, Set
 from dataclasses import dataclass
-from urllib.parse import urlparse, parse_qs
+from functools import lru_cache
 
 from src.exceptions import (
     URLValidationError,
     FileSystemError,
     ConfigurationError,
 )
+from src.utils.cache import CacheManager
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation operation.
 
@@ -26,21 +28,54 @@ class ValidationResult:
         is_valid: Whether validation passed
         error_message: Error message if validation failed
         sanitized_value: Cleaned/normalized value (if applicable)
-        warnings: Non-fatal warnings about the input
+        warnings: Non-fatal warnings about the input (None if there are none)
     """
     is_valid: bool
     error_message: Optional[str] = None
     sanitized_value: Any = None
-    warnings: List[str] = None
+    warnings: Optional[List[str]] = None
 
-    def __post_init__(self):
+    def add_warning(self, message: str):
+        """Add a warning, creating the list on first use."""
         if self.warnings is None:
             self.warnings = []
+        self.warnings.append(message)
 
     def __bool__(self) -> bool:
         return self.is_valid
 
 
+# Domains accepted as YouTube URLs
+_VALID_YT_DOMAINS = frozenset({
+    'youtube.com', 'www.youtube.com',
+    'youtu.be', 'www.youtu.be',
+    'm.youtube.com',
+    'music.youtube.com',
+})
+
+# scheme://netloc/path?query (fragment ignored); a minimal urlsplit
+_URL_PARTS_RE = re.compile(
+    r'([a-zA-Z][a-zA-Z0-9+.-]*)://([^/?#]*)([^?#]*)(?:\?([^#]*))?'
+)
+
+
+def _query_param(query: str, key: str) -> Optional[str]:
+    """Get the first non-empty value of a query string parameter.
+
+    Args:
+        query: Query string without the leading '?'
+        key: Parameter name
+
+    Returns:
+        Raw (undecoded) value, or None if absent or empty
+    """
+    prefix = key + '='
+    for part in query.split('&'):
+        if part.startswith(prefix) and len(part) > len(prefix):
+            return part[len(prefix):]
+    return None
+
+
 class URLValidator:
     """Validator for YouTube URLs.
 
@@ -58,50 +93,53 @@ class URLValidator:
     # Playlist ID pattern (variable length)
     PLAYLIST_ID_PATTERN = r'[a-zA-Z0-9_-]+'
 
-    # All supported URL patterns
+    # Path patterns for youtube.com URLs, matched against the URL path with
+    # the leading '/' removed. Watch and playlist URLs carry their IDs in the
+    # query string and are handled separately in validate().
     URL_PATTERNS = [
-        # Standard video URLs
-        (r'^https?://(?:www\.)?youtube\.com/watch\?.*v=(' + VIDEO_ID_PATTERN + r')',
-         'video'),
-
-        # Short URLs
-        (r'^https?://youtu\.be/(' + VIDEO_ID_PATTERN + r')',
-         'video'),
-
         # Embedded URLs
-        (r'^https?://(?:www\.)?youtube\.com/embed/(' + VIDEO_ID_PATTERN + r')',
+        (r'embed/(' + VIDEO_ID_PATTERN + r')',
          'video'),
 
         # Shorts
-        (r'^https?://(?:www\.)?youtube\.com/shorts/(' + VIDEO_ID_PATTERN + r')',
+        (r'shorts/(' + VIDEO_ID_PATTERN + r')',
          'video'),
 
         # Live
-        (r'^https?://(?:www\.)?youtube\.com/live/(' + VIDEO_ID_PATTERN + r')',
+        (r'live/(' + VIDEO_ID_PATTERN + r')',
          'video'),
 
-        # Playlist URLs
-        (r'^https?://(?:www\.)?youtube\.com/playlist\?.*list=(' + PLAYLIST_ID_PATTERN + r')',
-         'playlist'),
-
         # Channel URLs (various formats)
-        (r'^https?://(?:www\.)?youtube\.com/channel/([a-zA-Z0-9_-]+)',
+        (r'channel/([a-zA-Z0-9_-]+)',
          'channel'),
 
-        (r'^https?://(?:www\.)?youtube\.com/c/([a-zA-Z0-9_-]+)',
+        (r'c/([a-zA-Z0-9_-]+)',
          'channel'),
 
-        (r'^https?://(?:www\.)?youtube\.com/@([a-zA-Z0-9_.-]+)',
+        (r'@([a-zA-Z0-9_.-]+)',
          'channel'),
 
         # User URLs (legacy)
-        (r'^https?://(?:www\.)?youtube\.com/user/([a-zA-Z0-9_-]+)',
+        (r'user/([a-zA-Z0-9_-]+)',
          'channel'),
     ]
 
+    # Hosts using the youtube.com path layout
+    YOUTUBE_HOSTS = frozenset({'youtube.com', 'www.youtube.com'})
+
+    # Hosts serving short links (youtu.be/<id>)
+    SHORT_LINK_HOSTS = frozenset({'youtu.be'})
+
     # Compiled patterns for efficiency
     _compiled_patterns = None
 
+    # Single alternation of all URL_PATTERNS and its group lookup table
+    _combined_pattern = None
+    _combined_groups = None
+
+    _video_id_re = re.compile(VIDEO_ID_PATTERN)
+    _playlist_id_re = re.compile(PLAYLIST_ID_PATTERN)
+
     @classmethod
     def _get_patterns(cls):
         """Get compiled regex patterns (lazy initialization)."""
@@ -112,68 +150,187 @@ class URLValidator:
             ]
         return cls._compiled_patterns
 
+    @classmethod
+    def _get_combined_pattern(cls):
+        """Get all URL patterns compiled into one alternation (lazy initialization).
+
+        Each pattern is wrapped in a named group ``<type>_<index>``; the
+        pattern's own ID group directly follows it. Alternatives are tried
+        in URL_PATTERNS order, so the first matching pattern wins just as
+        with the per-pattern loop.
+
+        Returns:
+            Tuple of (compiled pattern, {group name: (url type, id group index)})
+        """
+        if cls._combined_pattern is None:
+            names = [
+                f"{url_type}_{index}"
+                for index, (_, url_type) in enumerate(cls.URL_PATTERNS)
+            ]
+            combined = re.compile(
+                '|'.join(
+                    f"(?P<{name}>{pattern})"
+                    for name, (pattern, _) in zip(names, cls.URL_PATTERNS)
+                ),
+                re.IGNORECASE
+            )
+            cls._combined_groups = {
+                name: (url_type, combined.groupindex[name] + 1)
+                for name, (_, url_type) in zip(names, cls.URL_PATTERNS)
+            }
+            cls._combined_pattern = combined
+        return cls._combined_pattern, cls._combined_groups
+
     @classmethod
     def validate(cls, url: str) -> ValidationResult:
         """Validate a YouTube URL.
 
+        Results are memoized per URL string, so repeated validation of
+        the same URL (UI refreshes, ID extraction) is a dict lookup.
+
         Args:
             url: The URL to validate
 
         Returns:
             ValidationResult with validation status and details
         """
-        if not url:
+        return cls._to_result(_validate_url_cached(url))
+
+    @classmethod
+    def validate_batch(cls, urls: Iterable[str]) -> List[ValidationResult]:
+        """Validate many URLs at once (playlist ingestion, bulk paste).
+
+        Each distinct URL is checked once per batch. Batch results are kept
+        in a local table rather than the shared cache, so a large import
+        does not evict entries used by interactive validation.
+
+        Args:
+            urls: URLs to validate
+
+        Returns:
+            List of ValidationResult, in the same order as the input
+        """
+        checked: Dict[str, tuple] = {}
+        results = []
+
+        for url in urls:
+            info = checked.get(url)
+            if info is None:
+                info = checked[url] = cls._check_url(url)
+            results.append(cls._to_result(info))
+
+        return results
+
+    @staticmethod
+    def _to_result(info: tuple) -> ValidationResult:
+        """Build a ValidationResult from a _check_url() tuple."""
+        is_valid, error_message, url_type, url_id, full_url = info
+
+        if not is_valid:
             return ValidationResult(
                 is_valid=False,
-                error_message="URL cannot be empty"
+                error_message=error_message
             )
 
+        return ValidationResult(
+            is_valid=True,
+            sanitized_value={
+                'url': full_url,
+                'type': url_type,
+                'id': url_id
+            }
+        )
+
+    @classmethod
+    def _check_url(cls, url: str) -> Tuple[bool, Optional[str], Optional[str], Optional[str], Optional[str]]:
+        """Validate a URL without caching.
+
+        Args:
+            url: The URL to validate
+
+        Returns:
+            Tuple of (is_valid, error_message, url_type, url_id, url)
+        """
+        if not url:
+            return False, "URL cannot be empty", None, None, None
+
         url = url.strip()
 
+        # Cheap pre-filter: every supported domain contains "youtu" near
+        # the start of the URL, so skip parsing for anything else
+        if 'youtu' not in url[:40].lower():
+            return False, "Not a YouTube URL", None, None, None
+
         # Basic URL structure check
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme:
-                # Try adding https://
-                url = f"https://{url}"
-                parsed = urlparse(url)
-        except Exception as e:
-            return ValidationResult(
-                is_valid=False,
-                error_message=f"Invalid URL format: {str(e)}"
-            )
+        parts = _URL_PARTS_RE.match(url)
+        if parts is None:
+            # Try adding https://
+            url = f"https://{url}"
+            parts = _URL_PARTS_RE.match(url)
+            if parts is None:
+                return False, "Invalid URL format", None, None, None
+
+        scheme, raw_netloc, path, query = parts.groups()
 
         # Check if it's a YouTube domain
-        valid_domains = [
-            'youtube.com', 'www.youtube.com',
-            'youtu.be', 'www.youtu.be',
-            'm.youtube.com',
-            'music.youtube.com'
-        ]
-
-        if parsed.netloc.lower() not in valid_domains:
-            return ValidationResult(
-                is_valid=False,
-                error_message=f"Not a YouTube URL. Domain: {parsed.netloc}"
-            )
+        netloc = raw_netloc.lower()
+        if netloc not in _VALID_YT_DOMAINS:
+            return False, f"Not a YouTube URL. Domain: {raw_netloc}", None, None, None
+
+        # Match the path (and query) against the known URL layouts
+        matched = None
+        if scheme.lower() in ('http', 'https'):
+            matched = cls._match_path(netloc, path, query or '')
+
+        if matched:
+            url_type, url_id = matched
+            return True, None, url_type, url_id, url
+
+        return (
+            False,
+            "URL format not recognized. Please provide a valid YouTube video, playlist, or channel URL.",
+            None, None, None
+        )
 
-        # Match against patterns
-        for pattern, url_type in cls._get_patterns():
-            match = pattern.match(url)
-            if match:
-                return ValidationResult(
-                    is_valid=True,
-                    sanitized_value={
-                        'url': url,
-                        'type': url_type,
-                        'id': match.group(1)
-                    }
-                )
+    @classmethod
+    def _match_path(cls, host: str, path: str, query: str) -> Optional[Tuple[str, str]]:
+        """Match a split YouTube URL without re-scanning scheme and host.
 
-        return ValidationResult(
-            is_valid=False,
-            error_message="URL format not recognized. Please provide a valid YouTube video, playlist, or channel URL."
-        )
+        Args:
+            host: Lowercased network location of the URL
+            path: URL path, including the leading '/'
+            query: Query string without the leading '?'
+
+        Returns:
+            Tuple of (url type, id) if recognized, None otherwise
+        """
+        path = path[1:]
+
+        if host in cls.SHORT_LINK_HOSTS:
+            match = cls._video_id_re.match(path)
+            return ('video', match.group()) if match else None
+
+        if host not in cls.YOUTUBE_HOSTS:
+            return None
+
+        lowered = path.lower()
+        if lowered == 'watch':
+            value = _query_param(query, 'v')
+            match = cls._video_id_re.match(value) if value else None
+            return ('video', match.group()) if match else None
+
+        if lowered == 'playlist':
+            value = _query_param(query, 'list')
+            match = cls._playlist_id_re.match(value) if value else None
+            return ('playlist', match.group()) if match else None
+
+        pattern, groups = cls._get_combined_pattern()
+        match = pattern.match(path)
+        if match:
+            url_type, id_group = groups[match.lastgroup]
+            return url_type, match.group(id_group)
+
+        return None
 
     @classmethod
     def extract_video_id(cls, url: str) -> Optional[str]:
@@ -185,9 +342,9 @@ class URLValidator:
         Returns:
             Video ID if found, None otherwise
         """
-        result = cls.validate(url)
-        if result.is_valid and result.sanitized_value.get('type') == 'video':
-            return result.sanitized_value.get('id')
+        is_valid, _, url_type, url_id, _ = _validate_url_cached(url)
+        if is_valid and url_type == 'video':
+            return url_id
         return None
 
     @classmethod
@@ -200,28 +357,27 @@ class URLValidator:
         Returns:
             Playlist ID if found, None otherwise
         """
-        result = cls.validate(url)
-        if result.is_valid and result.sanitized_value.get('type') == 'playlist':
-            return result.sanitized_value.get('id')
+        if not url:
+            return None
 
-        # Also check query params for list= in video URLs
-        try:
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query)
-            if 'list' in query_params:
-                return query_params['list'][0]
-        except Exception:
-            pass
+        is_valid, _, url_type, url_id, full_url = _validate_url_cached(url)
+        if is_valid and url_type == 'playlist':
+            return url_id
 
-        return None
+        # Also check query params for list= in video URLs
+        if is_valid:
+            url = full_url
+        start = url.find('?')
+        if start < 0:
+            return None
+        end = url.find('#', start)
+        return _query_param(url[start + 1:end if end >= 0 else None], 'list')
 
     @classmethod
     def is_playlist(cls, url: str) -> bool:
         """Check if URL is a playlist."""
-        result = cls.validate(url)
-        if result.is_valid:
-            return result.sanitized_value.get('type') == 'playlist'
-        return False
+        is_valid, _, url_type, _, _ = _validate_url_cached(url)
+        return is_valid and url_type == 'playlist'
 
     @classmethod
     def normalize_url(cls, url: str) -> Optional[str]:
@@ -233,23 +389,29 @@ class URLValidator:
         Returns:
             Normalized URL or None if invalid
         """
-        result = cls.validate(url)
-        if not result.is_valid:
+        is_valid, _, url_type, url_id, full_url = _validate_url_cached(url)
+        if not is_valid:
             return None
 
-        info = result.sanitized_value
-        url_type = info.get('type')
-        url_id = info.get('id')
-
         if url_type == 'video':
             return f"https://www.youtube.com/watch?v={url_id}"
         elif url_type == 'playlist':
             return f"https://www.youtube.com/playlist?list={url_id}"
-        elif url_type == 'channel':
-            # Keep original format for channels
-            return info.get('url')
 
-        return info.get('url')
+        # Keep original format for channels
+        return full_url
+
+
+@lru_cache(maxsize=4096)
+def _validate_url_cached(url: str) -> tuple:
+    """Memoized URLValidator._check_url (results depend only on the URL)."""
+    return URLValidator._check_url(url)
+
+
+@lru_cache(maxsize=128)
+def _normalize_path(path: str) -> str:
+    """Memoized expanduser + abspath for cwd-independent paths."""
+    return os.path.abspath(os.path.expanduser(path))
 
 
 class PathValidator:
@@ -267,13 +429,72 @@ class PathValidator:
         'LPT6', 'LPT7', 'LPT8', 'LPT9'
     }
 
+    # Translation tables for sanitize_filename, keyed by replacement string
+    _sanitize_tables: Dict[str, dict] = {}
+
+    # bytes.translate tables for ASCII filenames, keyed by replacement char
+    _sanitize_byte_tables: Dict[str, bytes] = {}
+
+    # Directories that passed a write probe (see _probe_write)
+    _write_probe_cache: Set[tuple] = set()
+
+    # Runs of the default replacement character
+    _COLLAPSE_RE = re.compile(r'_{2,}')
+
+    # Collapse patterns for sanitize_filename, keyed by replacement string
+    _collapse_patterns: Dict[str, re.Pattern] = {'_': _COLLAPSE_RE}
+
+    @classmethod
+    def _get_sanitize_table(cls, replacement: str) -> dict:
+        """Get a str.translate table for filename sanitization.
+
+        The table deletes null bytes and maps reserved and control
+        characters (1-31) to the replacement string.
+
+        Args:
+            replacement: String substituted for invalid characters
+
+        Returns:
+            Translation table for str.translate
+        """
+        table = cls._sanitize_tables.get(replacement)
+        if table is None:
+            mapping = {c: replacement for c in cls.WINDOWS_RESERVED_CHARS}
+            mapping.update({chr(i): replacement for i in range(1, 32)})
+            mapping['\x00'] = None
+            table = str.maketrans(mapping)
+            cls._sanitize_tables[replacement] = table
+        return table
+
+    @classmethod
+    def _get_sanitize_byte_table(cls, replacement: str) -> bytes:
+        """Get a bytes.translate table for sanitizing ASCII filenames.
+
+        Args:
+            replacement: Single ASCII character substituted for invalid ones
+
+        Returns:
+            256-byte translation table
+        """
+        table = cls._sanitize_byte_tables.get(replacement)
+        if table is None:
+            invalid = {ord(c) for c in cls.WINDOWS_RESERVED_CHARS}
+            repl = ord(replacement)
+            table = bytes(
+                repl if b < 32 or b in invalid else b
+                for b in range(256)
+            )
+            cls._sanitize_byte_tables[replacement] = table
+        return table
+
     @classmethod
     def validate_directory(
         cls,
         path: str,
         check_writable: bool = True,
         check_space: bool = True,
-        min_space_bytes: int = 100 * 1024 * 1024  # 100 MB
+        min_space_bytes: int = 100 * 1024 * 1024,  # 100 MB
+        probe_write: bool = False
     ) -> ValidationResult:
         """Validate a directory path.
 
@@ -282,30 +503,36 @@ class PathValidator:
             check_writable: Whether to check write permissions
             check_space: Whether to check available disk space
             min_space_bytes: Minimum required space in bytes
+            probe_write: Also create and delete a test file to confirm
+                writability (successful probes are cached per directory)
 
         Returns:
             ValidationResult with validation status
         """
-        warnings = []
-
         if not path:
             return ValidationResult(
                 is_valid=False,
                 error_message="Path cannot be empty"
             )
 
-        path = os.path.expanduser(path)
-        path = os.path.abspath(path)
+        # Absolute and home-relative paths don't depend on the working
+        # directory, so their normalized form can be cached
+        if path.startswith('~') or os.path.isabs(path):
+            path = _normalize_path(path)
+        else:
+            path = os.path.abspath(path)
 
         # Check if path exists
-        if not os.path.exists(path):
+        try:
+            path_stat = os.stat(path)
+        except OSError:
             return ValidationResult(
                 is_valid=False,
                 error_message=f"Directory does not exist: {path}"
             )
 
         # Check if it's a directory
-        if not os.path.isdir(path):
+        if not stat.S_ISDIR(path_stat.st_mode):
             return ValidationResult(
                 is_valid=False,
                 error_message=f"Path is not a directory: {path}"
@@ -320,16 +547,15 @@ class PathValidator:
                 )
 
             # Try to actually create a test file
-            try:
-                test_file = os.path.join(path, '.write_test_temp')
-                with open(test_file, 'w') as f:
-                    f.write('test')
-                os.remove(test_file)
-            except Exception as e:
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"Cannot write to directory: {str(e)}"
-                )
+            if probe_write:
+                error = cls._probe_write(path, path_stat)
+                if error:
+                    return ValidationResult(
+                        is_valid=False,
+                        error_message=f"Cannot write to directory: {error}"
+                    )
+
+        result = ValidationResult(is_valid=True, sanitized_value=path)
 
         # Check disk space
         if check_space:
@@ -345,16 +571,46 @@ class PathValidator:
 
                 # Warn if space is low (less than 1 GB)
                 if free < 1024 * 1024 * 1024:
-                    warnings.append(f"Low disk space warning: {free / (1024**3):.1f} GB remaining")
+                    result.add_warning(f"Low disk space warning: {free / (1024**3):.1f} GB remaining")
 
             except Exception as e:
-                warnings.append(f"Could not check disk space: {str(e)}")
+                result.add_warning(f"Could not check disk space: {str(e)}")
 
-        return ValidationResult(
-            is_valid=True,
-            sanitized_value=path,
-            warnings=warnings
+        return result
+
+    @classmethod
+    def _probe_write(cls, path: str, path_stat: os.stat_result) -> Optional[str]:
+        """Create and delete a test file in a directory.
+
+        Successful probes are cached by directory identity and permission
+        bits, so repeated validation of the same directory skips the probe.
+
+        Args:
+            path: Absolute directory path
+            path_stat: Result of os.stat() for the directory
+
+        Returns:
+            Error message if the directory is not writable, None otherwise
+        """
+        key = (
+            path, path_stat.st_dev, path_stat.st_ino,
+            path_stat.st_mode, path_stat.st_uid, path_stat.st_gid
         )
+        if key in cls._write_probe_cache:
+            return None
+
+        try:
+            test_file = os.path.join(path, '.write_test_temp')
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.remove(test_file)
+        except Exception as e:
+            return str(e)
+
+        if len(cls._write_probe_cache) >= 64:
+            cls._write_probe_cache.clear()
+        cls._write_probe_cache.add(key)
+        return None
 
     @classmethod
     def sanitize_filename(
@@ -376,18 +632,14 @@ class PathValidator:
         if not filename:
             return "untitled"
 
-        # Remove null bytes
-        filename = filename.replace('\x00', '')
-
-        # Replace invalid characters (for all OS)
-        for char in cls.WINDOWS_RESERVED_CHARS:
-            filename = filename.replace(char, replacement)
-
-        # Remove control characters (0-31)
-        filename = ''.join(
-            c if ord(c) >= 32 else replacement
-            for c in filename
-        )
+        # Remove null bytes, replace invalid (all OS) and control characters
+        if filename.isascii() and len(replacement) == 1 and replacement.isascii():
+            # Byte-level translation is much faster for the common ASCII title
+            filename = filename.encode('ascii').translate(
+                cls._get_sanitize_byte_table(replacement), b'\x00'
+            ).decode('ascii')
+        else:
+            filename = filename.translate(cls._get_sanitize_table(replacement))
 
         # Remove leading/trailing spaces and dots
         filename = filename.strip(' .')
@@ -396,9 +648,10 @@ class PathValidator:
         if not filename:
             return "untitled"
 
-        # Handle Windows reserved names
-        name_without_ext = filename.rsplit('.', 1)[0].upper()
-        if name_without_ext in cls.WINDOWS_RESERVED_NAMES:
+        # Handle Windows reserved names (none is longer than 4 characters,
+        # and Windows reserves them regardless of extension: "CON.tar.gz")
+        head = filename.partition('.')[0]
+        if len(head) <= 4 and head.upper() in cls.WINDOWS_RESERVED_NAMES:
             filename = f"_{filename}"
 
         # Truncate if too long (preserve extension)
@@ -411,8 +664,12 @@ class PathValidator:
                 filename = filename[:max_length]
 
         # Replace multiple consecutive replacement chars
-        while replacement * 2 in filename:
-            filename = filename.replace(replacement * 2, replacement)
+        if replacement:
+            pattern = cls._collapse_patterns.get(replacement)
+            if pattern is None:
+                pattern = re.compile(f"(?:{re.escape(replacement)}){{2,}}")
+                cls._collapse_patterns[replacement] = pattern
+            filename = pattern.sub(replacement, filename)
 
         return filename
 
@@ -433,11 +690,22 @@ class PathValidator:
         filename = os.path.basename(path)
         name, ext = os.path.splitext(filename)
 
+        # Snapshot the directory once instead of stat()ing every candidate.
+        # Names are casefolded so case-insensitive filesystems are handled.
+        try:
+            with os.scandir(directory or '.') as entries:
+                existing = {entry.name.casefold() for entry in entries}
+        except OSError:
+            existing = None
+
         counter = 1
         while True:
             new_filename = f"{name} ({counter}){ext}"
             new_path = os.path.join(directory, new_filename)
-            if not os.path.exists(new_path):
+            if existing is not None:
+                if new_filename.casefold() not in existing:
+                    return new_path
+            elif not os.path.exists(new_path):
                 return new_path
             counter += 1
 
@@ -526,10 +794,120 @@ class ConfigValidator:
         }
     }
 
+    # CONFIG_SCHEMA flattened into rule tuples (built on first use)
+    _rules = None
+    _rules_by_key = None
+
+    # Recent validate_config results keyed by config content. The short TTL
+    # bounds how long a filesystem check (download_path) can be reused.
+    _results_cache: CacheManager = CacheManager(max_size=32, default_ttl=5.0)
+
+    @classmethod
+    def _get_rules(cls) -> tuple:
+        """Get CONFIG_SCHEMA as pre-resolved rule tuples (lazy initialization).
+
+        Each rule is (key, type, required, allowed, min, max, default,
+        validator), with 'allowed' converted to a frozenset, so validation
+        does no per-call schema dict lookups.
+        """
+        if cls._rules is None:
+            cls._rules = tuple(
+                (
+                    key,
+                    schema.get('type'),
+                    schema.get('required', False),
+                    frozenset(schema['allowed']) if schema.get('allowed') else None,
+                    schema.get('min'),
+                    schema.get('max'),
+                    schema.get('default'),
+                    schema.get('validator'),
+                )
+                for key, schema in cls.CONFIG_SCHEMA.items()
+            )
+        return cls._rules
+
+    @classmethod
+    def _get_rules_by_key(cls) -> Dict[str, tuple]:
+        """Get the rule tuples indexed by config key (lazy initialization)."""
+        if cls._rules_by_key is None:
+            cls._rules_by_key = {rule[0]: rule for rule in cls._get_rules()}
+        return cls._rules_by_key
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget cached rules and results (call after changing CONFIG_SCHEMA)."""
+        cls._rules = None
+        cls._rules_by_key = None
+        cls._results_cache.clear()
+
+    @staticmethod
+    def _config_key(config: Dict[str, Any]) -> Optional[tuple]:
+        """Build a hashable snapshot of a config dict for result caching.
+
+        Values are paired with their type so that e.g. True and 1 do not
+        share a cache entry; unhashable values are represented by repr().
+
+        Returns:
+            Hashable key, or None if the config cannot be keyed
+        """
+        items = []
+        for key, value in config.items():
+            try:
+                hash(value)
+            except TypeError:
+                value = (type(value), repr(value))
+            items.append((key, type(value), value))
+
+        try:
+            return tuple(sorted(items, key=lambda item: item[0]))
+        except TypeError:
+            return None
+
     @classmethod
     def validate_config(cls, config: Dict[str, Any]) -> ValidationResult:
         """Validate an entire configuration dictionary.
 
+        Results for identical configs are reused for a few seconds, so
+        settings UIs re-validating unchanged values skip the schema walk.
+
+        Args:
+            config: Configuration dictionary to validate
+
+        Returns:
+            ValidationResult with validated/sanitized config
+        """
+        key = cls._config_key(config)
+        if key is not None:
+            key = (cls, key)
+            cached = cls._results_cache.get(key)
+            if cached is not None:
+                return cls._copy_result(cached)
+
+        result = cls._validate_config_uncached(config)
+
+        if key is not None:
+            cls._results_cache.set(key, result)
+            return cls._copy_result(result)
+        return result
+
+    @staticmethod
+    def _copy_result(result: ValidationResult) -> ValidationResult:
+        """Copy a result so cached entries cannot be mutated by callers."""
+        sanitized = {
+            key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in result.sanitized_value.items()
+        }
+        return ValidationResult(
+            is_valid=result.is_valid,
+            error_message=result.error_message,
+            sanitized_value=sanitized,
+            warnings=list(result.warnings) if result.warnings else None
+        )
+
+    @classmethod
+    def _validate_config_uncached(cls, config: Dict[str, Any]) -> ValidationResult:
+        """Validate a configuration dictionary without caching.
+
         Args:
             config: Configuration dictionary to validate
 
@@ -540,62 +918,10 @@ class ConfigValidator:
         warnings = []
         sanitized = {}
 
-        for key, schema in cls.CONFIG_SCHEMA.items():
-            value = config.get(key)
-
-            # Check required fields
-            if schema.get('required', False) and value is None:
-                errors.append(f"Missing required config: {key}")
-                continue
-
-            # Use default if not provided
-            if value is None:
-                sanitized[key] = schema.get('default')
-                continue
-
-            # Type validation
-            expected_type = schema.get('type')
-            if expected_type and not isinstance(value, expected_type):
-                try:
-                    value = expected_type(value)
-                except (ValueError, TypeError):
-                    errors.append(
-                        f"Invalid type for {key}: expected {expected_type.__name__}"
-                    )
-                    sanitized[key] = schema.get('default')
-                    continue
-
-            # Allowed values
-            allowed = schema.get('allowed')
-            if allowed and value not in allowed:
-                warnings.append(
-                    f"Invalid value for {key}: {value}. Using default."
-                )
-                sanitized[key] = schema.get('default')
-                continue
-
-            # Range validation for numbers
-            if isinstance(value, (int, float)):
-                min_val = schema.get('min')
-                max_val = schema.get('max')
-                if min_val is not None and value < min_val:
-                    value = min_val
-                    warnings.append(f"{key} was below minimum, set to {min_val}")
-                if max_val is not None and value > max_val:
-                    value = max_val
-                    warnings.append(f"{key} was above maximum, set to {max_val}")
-
-            # Custom validator
-            custom_validator = schema.get('validator')
-            if custom_validator:
-                result = custom_validator(value)
-                if not result.is_valid:
-                    errors.append(f"{key}: {result.error_message}")
-                    continue
-                if result.warnings:
-                    warnings.extend(result.warnings)
-
-            sanitized[key] = value
+        for rule in cls._get_rules():
+            keep, value = cls._apply_rule(rule, config.get(rule[0]), errors, warnings)
+            if keep:
+                sanitized[rule[0]] = value
 
         # Add any extra keys from original config
         for key, value in config.items():
@@ -607,15 +933,83 @@ class ConfigValidator:
                 is_valid=False,
                 error_message="; ".join(errors),
                 sanitized_value=sanitized,
-                warnings=warnings
+                warnings=warnings or None
             )
 
         return ValidationResult(
             is_valid=True,
             sanitized_value=sanitized,
-            warnings=warnings
+            warnings=warnings or None
         )
 
+    @staticmethod
+    def _apply_rule(
+        rule: tuple,
+        value: Any,
+        errors: List[str],
+        warnings: List[str]
+    ) -> Tuple[bool, Any]:
+        """Validate one value against a pre-resolved schema rule.
+
+        Args:
+            rule: Rule tuple from _get_rules()
+            value: Value to validate (None if not provided)
+            errors: List that validation errors are appended to
+            warnings: List that warnings are appended to
+
+        Returns:
+            Tuple of (keep, value); keep is False when the key should be
+            left out of the sanitized config
+        """
+        (key, expected_type, required, allowed,
+         min_val, max_val, default, custom_validator) = rule
+
+        # Check required fields
+        if required and value is None:
+            errors.append(f"Missing required config: {key}")
+            return False, None
+
+        # Use default if not provided
+        if value is None:
+            return True, default
+
+        # Type validation
+        if expected_type and not isinstance(value, expected_type):
+            try:
+                value = expected_type(value)
+            except (ValueError, TypeError):
+                errors.append(
+                    f"Invalid type for {key}: expected {expected_type.__name__}"
+                )
+                return True, default
+
+        # Allowed values
+        if allowed and value not in allowed:
+            warnings.append(
+                f"Invalid value for {key}: {value}. Using default."
+            )
+            return True, default
+
+        # Range validation for numbers
+        if isinstance(value, (int, float)):
+            if min_val is not None and value < min_val:
+                value = min_val
+                warnings.append(f"{key} was below minimum, set to {min_val}")
+            if max_val is not None and value > max_val:
+                value = max_val
+                warnings.append(f"{key} was above maximum, set to {max_val}")
+
+        # Custom validator
+        if custom_validator:
+            result = custom_validator(value)
+            if not result.is_valid:
+                errors.append(f"{key}: {result.error_message}")
+                return False, None
+            if result.warnings:
+                warnings.extend(result.warnings)
+
+        return True, value
+
     @classmethod
     def validate_single(
         cls,
@@ -624,21 +1018,34 @@ class ConfigValidator:
     ) -> ValidationResult:
         """Validate a single configuration value.
 
+        Only the rule for ``key`` is checked; other (possibly required)
+        keys are not considered.
+
         Args:
             key: Configuration key
             value: Value to validate
 
         Returns:
-            ValidationResult
+            ValidationResult with the sanitized value
         """
-        if key not in cls.CONFIG_SCHEMA:
+        rule = cls._get_rules_by_key().get(key)
+        if rule is None:
             return ValidationResult(
                 is_valid=True,
                 sanitized_value=value,
                 warnings=[f"Unknown config key: {key}"]
             )
 
-        return cls.validate_config({key: value})
+        errors = []
+        warnings = []
+        _, sanitized = cls._apply_rule(rule, value, errors, warnings)
+
+        return ValidationResult(
+            is_valid=not errors,
+            error_message="; ".join(errors) or None,
+            sanitized_value=sanitized,
+            warnings=warnings or None
+        )
 
 
 class InputValidator:
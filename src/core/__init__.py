@@ -1,36 +1,53 @@
-"""Core business logic modules."""
-
-from .queue_manager import QueueManager, VideoItem, VideoStatus
-from .download_manager import DownloadManager, DownloadState
-from .update_manager import UpdateManager, UpdateInfo
-from .format_selector import FormatSelector, FormatInfo, VideoFormats, FormatType
-from .playlist_filter import PlaylistFilter, PlaylistInfo, PlaylistVideoInfo
-from .session_manager import DownloadSession, SessionData
-from .rate_limiter import RateLimiter, RateLimitConfig, AdaptiveRateLimiter
-from .post_processor import PostProcessor, PostProcessingOptions, AudioFormat, VideoFormat
-
-__all__ = [
-    'QueueManager',
-    'VideoItem',
-    'VideoStatus',
-    'DownloadManager',
-    'DownloadState',
-    'UpdateManager',
-    'UpdateInfo',
-    'FormatSelector',
-    'FormatInfo',
-    'VideoFormats',
-    'FormatType',
-    'PlaylistFilter',
-    'PlaylistInfo',
-    'PlaylistVideoInfo',
-    'DownloadSession',
-    'SessionData',
-    'RateLimiter',
-    'RateLimitConfig',
-    'AdaptiveRateLimiter',
-    'PostProcessor',
-    'PostProcessingOptions',
-    'AudioFormat',
-    'VideoFormat',
-]
+"""Core business logic modules.
+
+Submodules are imported lazily (PEP 562) on first access to one of their
+public names, so importing ``src.core`` does not pull in yt-dlp, FFmpeg
+helpers, etc. until they are actually used.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'QueueManager': 'queue_manager',
+    'VideoItem': 'queue_manager',
+    'VideoStatus': 'queue_manager',
+    'DownloadManager': 'download_manager',
+    'DownloadState': 'download_manager',
+    'UpdateManager': 'update_manager',
+    'UpdateInfo': 'update_manager',
+    'FormatSelector': 'format_selector',
+    'FormatInfo': 'format_selector',
+    'VideoFormats': 'format_selector',
+    'FormatType': 'format_selector',
+    'FetchHandle': 'format_selector',
+    'PlaylistFilter': 'playlist_filter',
+    'PlaylistInfo': 'playlist_filter',
+    'PlaylistVideoInfo': 'playlist_filter',
+    'DownloadSession': 'session_manager',
+    'SessionData': 'session_manager',
+    'RateLimiter': 'rate_limiter',
+    'RateLimitConfig': 'rate_limiter',
+    'AdaptiveRateLimiter': 'rate_limiter',
+    'PostProcessor': 'post_processor',
+    'PostProcessingOptions': 'post_processor',
+    'AudioFormat': 'post_processor',
+    'VideoFormat': 'post_processor',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
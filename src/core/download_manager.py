@@ -9,13 +9,18 @@ This module provides the core download functionality including:
 """
 
 import os
+import random
+import re
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, Future
-from dataclasses import dataclass, field
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, InvalidStateError, ThreadPoolExecutor, wait
+)
+from queue import Empty, SimpleQueue
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, Sequence
 from pathlib import Path
 
 import yt_dlp
@@ -42,6 +47,10 @@ class DownloadState(Enum):
 class DownloadProgress:
     """Download progress information.
 
+    The manager reuses one instance per download slot and updates it in place, so
+    ``on_progress`` callbacks must copy any values they keep after the
+    call returns.
+
     Attributes:
         video_id: ID of the video being downloaded
         status: Current status
@@ -71,29 +80,39 @@ class DownloadOptions:
         quality: Video quality setting
         format_selector: Custom format selector for yt-dlp
         include_subtitles: Download subtitles
-        subtitle_langs: List of subtitle languages
+        subtitle_langs: Sequence of subtitle languages
         embed_subtitles: Embed subtitles in video
         embed_thumbnail: Embed thumbnail as cover art
         add_metadata: Add metadata to file
         bandwidth_limit: Max bandwidth in bytes/second (0 = unlimited)
         max_retries: Maximum retry attempts
         retry_delay: Initial delay between retries in seconds
+        retry_delay_max: Upper bound for the backoff delay in seconds
         cookies_file: Path to cookies file
         proxy: Proxy URL
+        http_chunk_size: Bytes requested per HTTP range request (0 = yt-dlp default)
+        buffer_size: Download buffer size in bytes (0 = yt-dlp default)
+        auto_concurrency: Tune the number of parallel downloads to throughput
+        max_auto_concurrent: Upper bound for auto-tuned parallel downloads
     """
     output_path: str
     quality: str = "best"
     format_selector: Optional[str] = None
     include_subtitles: bool = False
-    subtitle_langs: List[str] = field(default_factory=lambda: ["en"])
+    subtitle_langs: Sequence[str] = ("en",)  # shared immutable default
     embed_subtitles: bool = False
     embed_thumbnail: bool = False
     add_metadata: bool = True
     bandwidth_limit: int = 0
     max_retries: int = 3
     retry_delay: float = 2.0
+    retry_delay_max: float = 60.0
     cookies_file: Optional[str] = None
     proxy: Optional[str] = None
+    http_chunk_size: int = 10 * 1024 * 1024
+    buffer_size: int = 1024 * 1024
+    auto_concurrency: bool = False
+    max_auto_concurrent: int = 16
 
 
 class DownloadManager:
@@ -125,6 +144,29 @@ class DownloadManager:
         'audio_only': 'bestaudio[ext=m4a]/bestaudio/best[acodec!=none]',
     }
 
+    # Download errors that will not go away by retrying
+    _NON_RETRYABLE_RE = re.compile(
+        r'private video|video unavailable|copyright|removed|terminated',
+        re.IGNORECASE
+    )
+
+    # Maximum concurrent info extractions (network bound)
+    EXTRACT_WORKERS = 8
+
+    # Seconds between progress reports from the emitter thread
+    PROGRESS_INTERVAL = 0.1
+
+    # Same, when no progress or queue listener is attached
+    HEADLESS_PROGRESS_INTERVAL = 1.0
+
+    # Seconds stop() waits for running downloads to wind down
+    STOP_DRAIN_TIMEOUT = 2.0
+
+    # Auto concurrency: seconds per throughput sample, and the relative
+    # change that counts as better/worse
+    TUNE_INTERVAL = 5.0
+    TUNE_THRESHOLD = 0.1
+
     def __init__(
         self,
         queue: QueueManager,
@@ -143,46 +185,102 @@ class DownloadManager:
         self.queue = queue
         self.options = options
         self.logger = logger
-        self.max_concurrent = max_concurrent
+        self._max_concurrent = max_concurrent
 
         # State management
         self._state = DownloadState.IDLE
-        self._state_lock = threading.Lock()
+        self._state_lock = threading.Lock()  # Writers only
         self._pause_event = threading.Event()
         self._pause_event.set()  # Not paused initially
         self._stop_event = threading.Event()
 
-        # Thread pool
+        # Wakes the download loop when a slot frees up or work arrives
+        self._cv = threading.Condition()
+
+        # Thread pool, kept across start/stop cycles (see close())
         self._executor: Optional[ThreadPoolExecutor] = None
-        self._active_futures: Dict[str, Future] = {}
-        self._futures_lock = threading.Lock()
+        self._executor_workers = 0
+        self._pp_executor: Optional[ThreadPoolExecutor] = None
+
+        # Running future -> (video ID, slot queue, slot), reaped in
+        # _reap_loop; _reaper_wakeup is resolved when a future is added
+        self._active_futures: Dict[Future, tuple] = {}
+        self._reaper_wakeup: Future = Future()
 
         # Download tracking
         self._download_thread: Optional[threading.Thread] = None
         self._active_downloads: Dict[str, VideoItem] = {}
 
+        # Free download slots and per-slot progress state (see _init_slots)
+        self._slots: SimpleQueue = SimpleQueue()
+        self._slot_progress: List[DownloadProgress] = []
+        self._tune_lock = threading.Lock()
+        self._spare_slots: List[int] = []
+        self._slots_to_retire = 0
+        self._active_limit = 0
+        self._init_slots()
+
+        # Reports progress at a fixed rate (see _progress_emitter)
+        self._emitter_thread: Optional[threading.Thread] = None
+
+        # Handles finished downloads (see _reap_loop)
+        self._reaper_thread: Optional[threading.Thread] = None
+
+        # Set while no stop is winding down, and callbacks for when the
+        # current one is done (see stop())
+        self._stopped = threading.Event()
+        self._stopped.set()
+        self._stop_callbacks: List[Callable[[], None]] = []
+
+        # (output path, playlist title) -> created playlist folder
+        self._playlist_dir_cache: Dict[tuple, str] = {}
+
+        # yt-dlp options shared by every video (see update_options)
+        self._ydl_opts_template: Optional[dict] = None
+        self._pp_opts: Optional[dict] = None
+        self._opts_generation = 0
+
+        # One reusable YoutubeDL per pool thread (see _get_thread_ydl)
+        self._tls = threading.local()
+        self._ydl_instances: list = []
+        self._ydl_lock = threading.Lock()
+
         # Callbacks
+        # Progress callbacks run on the emitter thread and receive reused
+        # objects; copy them to keep values
         self.on_progress: Optional[Callable[[DownloadProgress], None]] = None
+        self.on_progress_batch: Optional[
+            Callable[[List[DownloadProgress]], None]
+        ] = None
         self.on_complete: Optional[Callable[[VideoItem, bool], None]] = None
         self.on_state_change: Optional[Callable[[DownloadState], None]] = None
         self.on_all_complete: Optional[Callable[[], None]] = None
 
+        self.queue.add_queued_callback(self.notify_new_item)
+
     @property
     def state(self) -> DownloadState:
         """Get current download state."""
-        with self._state_lock:
-            return self._state
+        # A single attribute read is atomic; no lock needed
+        return self._state
 
     def _set_state(self, new_state: DownloadState):
         """Set download state and notify callback."""
+        if self._state is new_state:
+            return
+
+        # The lock only serializes transitions so each one is reported
+        # exactly once and in order
         with self._state_lock:
-            if self._state != new_state:
-                self._state = new_state
-                if self.on_state_change:
-                    try:
-                        self.on_state_change(new_state)
-                    except Exception:
-                        pass
+            if self._state is new_state:
+                return
+            self._state = new_state
+            callback = self.on_state_change
+            if callback:
+                try:
+                    callback(new_state)
+                except Exception:
+                    pass
 
     def start(self):
         """Start processing downloads."""
@@ -194,8 +292,24 @@ class DownloadManager:
         self._stop_event.clear()
         self._pause_event.set()
 
-        # Create thread pool
-        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent)
+        self.update_options()
+
+        # Reuse the thread pool unless the concurrency setting changed
+        workers = self._slot_capacity()
+        if self._executor is None or self._executor_workers != workers:
+            if self._executor:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+
+        # FFmpeg post-processing is CPU bound, so it gets its own pool sized
+        # to the machine rather than taking download slots
+        if self._pp_executor is None:
+            self._pp_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+        # Fresh slots per run so late finishers from a previous run
+        # cannot hand out extra tokens
+        self._init_slots()
 
         # Start download processing thread
         self._download_thread = threading.Thread(
@@ -204,6 +318,163 @@ class DownloadManager:
         )
         self._download_thread.start()
 
+        self._emitter_thread = threading.Thread(
+            target=self._progress_emitter,
+            daemon=True
+        )
+        self._emitter_thread.start()
+
+        self._reaper_thread = threading.Thread(
+            target=self._reap_loop,
+            daemon=True
+        )
+        self._reaper_thread.start()
+
+    def update_options(self):
+        """Apply changes made to self.options to the next downloads.
+
+        start() calls this; call it again after changing options during a
+        run. Downloads already in progress keep their options, and each
+        pool thread rebuilds its YoutubeDL before its next video.
+        """
+        # Template first, so a thread that sees the new generation also
+        # sees the new options
+        self._ydl_opts_template = self._build_ydl_options_template()
+        self._pp_opts = self._build_pp_options()
+        self._opts_generation += 1
+
+    def _init_slots(self):
+        """Create the download slots for a run.
+
+        Each concurrent download owns a slot index for its lifetime. The
+        index is handed out through a queue (blocking the loop while all
+        slots are busy) and used by the progress hook to reach its state
+        in parallel lists instead of dicts keyed by video ID.
+        """
+        count = self._slot_capacity()
+        limit = max(1, min(self.max_concurrent, count))
+        self._slots = SimpleQueue()
+        for slot in range(limit):
+            self._slots.put(slot)
+
+        # Slots beyond the current limit, usable by auto concurrency
+        with self._tune_lock:
+            self._spare_slots = list(range(count - 1, limit - 1, -1))
+            self._slots_to_retire = 0
+            self._active_limit = limit
+
+        # Throughput sampling for auto concurrency
+        self._slot_seen_bytes: List[int] = [0] * count
+        self._bytes_total = 0
+        self._tune_last_ts = time.monotonic()
+        self._tune_last_bytes = 0
+        self._tune_prev_rate: Optional[float] = None
+        self._tune_direction = 1
+        self._tune_probed = False
+        self._tune_resuming = False
+
+        # Latest raw values written by the progress hook
+        self._slot_video_id: List[str] = [''] * count
+        self._slot_downloaded: List[int] = [0] * count
+        self._slot_total: List[int] = [0] * count
+        self._slot_speed: List[float] = [0.0] * count
+        self._slot_eta: List[int] = [0] * count
+        self._slot_filename: List[Optional[str]] = [None] * count
+        self._slot_dirty: List[bool] = [False] * count
+
+        # Reused objects handed to the progress callbacks
+        self._slot_progress = [
+            DownloadProgress(video_id='', status='downloading')
+            for _ in range(count)
+        ]
+
+    def _slot_capacity(self) -> int:
+        """Get the number of slots (and pool threads) to allocate per run.
+
+        Returns:
+            max_concurrent, or the auto-tuning upper bound if enabled
+        """
+        count = max(1, self.max_concurrent)
+        if self.options.auto_concurrency:
+            count = max(count, self.options.max_auto_concurrent)
+        return count
+
+    def _add_slots(self, count: int):
+        """Allocate more slots mid-run (caller holds _tune_lock).
+
+        The new slots start out spare. The download loop grows the thread
+        pool to match before it starts the next download.
+
+        Args:
+            count: Number of slots to add
+        """
+        first = len(self._slot_progress)
+        self._slot_seen_bytes.extend([0] * count)
+        self._slot_video_id.extend([''] * count)
+        self._slot_downloaded.extend([0] * count)
+        self._slot_total.extend([0] * count)
+        self._slot_speed.extend([0.0] * count)
+        self._slot_eta.extend([0] * count)
+        self._slot_filename.extend([None] * count)
+        self._slot_progress.extend(
+            DownloadProgress(video_id='', status='downloading')
+            for _ in range(count)
+        )
+        # Last, since the emitter walks this list
+        self._slot_dirty.extend([False] * count)
+
+        # Spare slots are popped from the end; hand out the new ones last
+        self._spare_slots[:0] = range(first + count - 1, first - 1, -1)
+
+    def _set_active_limit(self, limit: int):
+        """Hand out or withhold slots to reach a limit (caller holds _tune_lock).
+
+        Free slots are withheld at once and busy ones as they finish.
+
+        Args:
+            limit: Number of downloads allowed to run at once
+        """
+        while self._active_limit < limit:
+            if self._slots_to_retire:
+                self._slots_to_retire -= 1
+            elif self._spare_slots:
+                self._slots.put(self._spare_slots.pop())
+            else:
+                break
+            self._active_limit += 1
+
+        while self._active_limit > limit:
+            try:
+                self._spare_slots.append(self._slots.get_nowait())
+            except Empty:
+                self._slots_to_retire += 1
+            self._active_limit -= 1
+
+    @property
+    def max_concurrent(self) -> int:
+        """Get the configured number of concurrent downloads."""
+        return self._max_concurrent
+
+    @max_concurrent.setter
+    def max_concurrent(self, value: int):
+        """Set the number of concurrent downloads.
+
+        Takes effect at once on a running queue: slots are handed out or
+        withheld as auto concurrency does, and allocated if the run has
+        too few.
+        """
+        self._max_concurrent = value
+        limit = max(1, value)
+        with self._tune_lock:
+            if limit > len(self._slot_progress):
+                self._add_slots(limit - len(self._slot_progress))
+            self._set_active_limit(limit)
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Get the number of downloads currently allowed to run at once."""
+        return self._active_limit
+
     def pause(self):
         """Pause all downloads."""
         if self.state != DownloadState.RUNNING:
@@ -221,36 +492,126 @@ class DownloadManager:
         self._log("Resuming downloads")
         self._set_state(DownloadState.RUNNING)
         self._pause_event.set()
+        self._wake_loop()
 
-    def stop(self):
-        """Stop all downloads."""
-        if self.state == DownloadState.IDLE:
-            return
+    def stop(self, block: bool = True, on_stopped: Optional[Callable[[], None]] = None):
+        """Stop all downloads.
 
-        self._log("Stopping downloads")
-        self._set_state(DownloadState.STOPPING)
-        self._stop_event.set()
-        self._pause_event.set()  # Release any paused threads
+        Running downloads are given a moment to wind down on a background
+        thread; the state becomes IDLE once they have.
 
-        # Cancel active futures
-        with self._futures_lock:
-            for future in self._active_futures.values():
-                future.cancel()
+        Args:
+            block: Wait until the manager is IDLE. Pass False on a UI thread.
+            on_stopped: Optional callback run on the background thread once
+                the manager is IDLE (not called if it already is)
+        """
+        with self._state_lock:
+            if self._state is DownloadState.IDLE:
+                return
+            if on_stopped:
+                self._stop_callbacks.append(on_stopped)
+            first = not self._stop_event.is_set()
+            if first:
+                self._stop_event.set()
+                self._stopped.clear()
+
+        if first:
+            self._log("Stopping downloads")
+            self._set_state(DownloadState.STOPPING)
+            self._pause_event.set()  # Release any paused threads
+            self._slots.put(None)  # Release the loop if it is waiting for a slot
+            self._wake_loop()
+            self._wake_reaper()
+
+            threading.Thread(
+                target=self._finish_stop,
+                name="download-stop",
+                daemon=True
+            ).start()
+
+        if block:
+            self._stopped.wait()
+
+    def _finish_stop(self):
+        """Wind down a stopping run and go IDLE (runs on the stop thread)."""
+        # Let the old threads finish before a later start() spawns new ones
+        threads = (self._download_thread, self._emitter_thread, self._reaper_thread)
+        for thread in threads:
+            if thread:
+                thread.join(timeout=5.0)
+        self._download_thread = None
+        self._emitter_thread = None
+        self._reaper_thread = None
+
+        # The reaper has exited, so this thread now owns the futures.
+        # Cancel the ones that have not started; running ones exit via
+        # _stop_event and the pool itself stays alive for the next start()
+        futures = dict(self._active_futures)
+        self._active_futures.clear()
+        for future in futures:
+            future.cancel()
+
+        # Give running downloads a moment to wind down, then record the
+        # ones that actually finished instead of re-queueing them
+        if futures:
+            wait(list(futures), timeout=self.STOP_DRAIN_TIMEOUT)
+
+            # Follow downloads that have moved on to post-processing
+            handed_off = False
+            for future in list(futures):
+                pp_future = self._get_pp_future(future)
+                if pp_future is not None:
+                    futures[pp_future] = futures.pop(future)
+                    handed_off = True
+            if handed_off:
+                wait(list(futures), timeout=self.STOP_DRAIN_TIMEOUT)
+        for future, (video_id, _, _) in futures.items():
+            if future.done() and not future.cancelled() \
+                    and future.exception() is None and future.result() is True:
+                self._on_download_done(video_id, future)
+
+        # Everything else goes back to the queue
+        for video_id in dict(self._active_downloads):
+            self.queue.update_status(video_id, VideoStatus.QUEUED)
+
+        self._active_downloads.clear()
+        self._playlist_dir_cache.clear()
+
+        self._set_state(DownloadState.IDLE)
+        self._stopped.set()
+        with self._state_lock:
+            callbacks, self._stop_callbacks = self._stop_callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def close(self):
+        """Stop downloads and release the thread pool.
+
+        Call once at application exit; blocks until worker threads finish.
+        """
+        self.stop()
 
-        # Shutdown executor
         if self._executor:
-            self._executor.shutdown(wait=False)
+            self._executor.shutdown(wait=True)
             self._executor = None
+            self._executor_workers = 0
 
-        # Update queue status
-        for video_id in list(self._active_downloads.keys()):
-            self.queue.update_status(video_id, VideoStatus.QUEUED)
+        if self._pp_executor:
+            self._pp_executor.shutdown(wait=True)
+            self._pp_executor = None
 
-        self._active_downloads.clear()
-        self._set_state(DownloadState.IDLE)
+        # Workers are gone, so their YoutubeDL instances are idle
+        with self._ydl_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+        for ydl in instances:
+            self._close_ydl(ydl)
 
     def _download_loop(self):
         """Main download processing loop."""
+        slots = self._slots
         try:
             while not self._stop_event.is_set():
                 # Wait if paused
@@ -259,59 +620,240 @@ class DownloadManager:
                 if self._stop_event.is_set():
                     break
 
-                # Check if we can start more downloads
-                with self._futures_lock:
-                    active_count = len(self._active_downloads)
+                # Wait for a free download slot
+                slot = slots.get()
+                if slot is None:
+                    break
 
-                if active_count >= self.max_concurrent:
-                    time.sleep(0.5)
-                    continue
+                # Wait for a queued video while holding the condition, so a
+                # notify cannot slip in between the check and wait()
+                with self._cv:
+                    video = self.queue.get_next_queued()
+                    while not self._stop_event.is_set() and (
+                        video is None or not self._pause_event.is_set()
+                    ):
+                        # The timeout only guards against a missed signal
+                        self._cv.wait(timeout=5.0)
+                        video = self.queue.get_next_queued()
 
-                # Get next queued video
-                video = self.queue.get_next_queued()
-                if not video:
-                    # Check if all downloads are complete
-                    if active_count == 0:
-                        time.sleep(0.5)
-                        continue
-                    else:
-                        time.sleep(0.5)
-                        continue
+                if self._stop_event.is_set():
+                    break
+
+                # The limit may have been lowered while this slot waited
+                if self._retire_slot(slots, slot):
+                    continue
 
                 # Start download
-                self._start_download(video)
+                self._start_download(video, slots, slot)
 
         except Exception as e:
             self._log(f"Download loop error: {e}", "ERROR")
         finally:
-            self._set_state(DownloadState.IDLE)
+            # When stopping, the stop thread goes IDLE once it is done
+            if not self._stop_event.is_set():
+                self._set_state(DownloadState.IDLE)
             if self.on_all_complete and not self._stop_event.is_set():
                 try:
                     self.on_all_complete()
                 except Exception:
                     pass
 
-    def _start_download(self, video: VideoItem):
-        """Start downloading a single video."""
+    def _start_download(self, video: VideoItem, slots: SimpleQueue, slot: int):
+        """Start downloading a single video.
+
+        Args:
+            video: Video to download
+            slots: Slot queue the slot is returned to when done
+            slot: Slot index taken from slots
+        """
+        # max_concurrent may have added slots since the pool was sized
+        workers = len(self._slot_progress)
+        if self._executor_workers < workers:
+            self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+
         self.queue.update_status(video.id, VideoStatus.DOWNLOADING)
         self._active_downloads[video.id] = video
+        self._slot_dirty[slot] = False
+        self._slot_seen_bytes[slot] = 0
 
         # Submit to thread pool
-        future = self._executor.submit(self._download_video, video)
+        future = self._executor.submit(self._download_video, video, slot)
 
-        with self._futures_lock:
-            self._active_futures[video.id] = future
+        # Register before waking the reaper so its next wait includes it
+        self._active_futures[future] = (video.id, slots, slot)
+        self._wake_reaper()
 
-        # Add callback for completion
-        future.add_done_callback(
-            lambda f, vid=video.id: self._on_download_done(vid, f)
-        )
+    def _reap_loop(self):
+        """Handle finished downloads on one thread until stopped.
+
+        Blocks on the running futures plus a wakeup future that
+        _start_download and stop() resolve, so there is no polling.
+        """
+        while True:
+            wakeup = self._reaper_wakeup
+            if wakeup.done():
+                wakeup = self._reaper_wakeup = Future()
+
+            if self._stop_event.is_set():
+                break
+
+            pending = [wakeup]
+            pending.extend(list(self._active_futures))
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if self._stop_event.is_set():
+                    # Downloads aborted by stop() are re-queued there,
+                    # not reported as failures here
+                    break
+
+                info = self._active_futures.pop(future, None)
+                if info is None:
+                    continue
+
+                video_id, slots, slot = info
+                try:
+                    pp_future = self._get_pp_future(future)
+                    if pp_future is not None:
+                        # Downloaded; keep tracking it without a slot
+                        self.queue.update_status(video_id, VideoStatus.POST_PROCESSING)
+                        self._active_futures[pp_future] = (video_id, None, None)
+                    else:
+                        self._on_download_done(video_id, future)
+                except Exception as e:
+                    self._log(f"Completion handler error: {e}", "ERROR")
+                finally:
+                    # Hand the slot to the next video
+                    if slots is not None:
+                        self._release_slot(slots, slot)
+
+    def _get_pp_future(self, future: Future) -> Optional[Future]:
+        """Get the post-processing future a finished download handed off to.
+
+        Args:
+            future: Completed download future
+
+        Returns:
+            The post-processing future, or None if the download is final
+        """
+        if not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        result = future.result()
+        return result if isinstance(result, Future) else None
+
+    def _release_slot(self, slots: SimpleQueue, slot: int):
+        """Return a finished download's slot, or retire it.
+
+        Args:
+            slots: Slot queue the slot was taken from
+            slot: Slot index
+        """
+        if not self._retire_slot(slots, slot):
+            slots.put(slot)
+
+    def _retire_slot(self, slots: SimpleQueue, slot: int) -> bool:
+        """Retire a taken slot if the limit was lowered meanwhile.
+
+        Args:
+            slots: Slot queue the slot was taken from
+            slot: Slot index
+
+        Returns:
+            True if the slot was retired
+        """
+        with self._tune_lock:
+            if slots is self._slots and self._slots_to_retire:
+                # The limit was lowered while this slot was taken
+                self._slots_to_retire -= 1
+                self._spare_slots.append(slot)
+                return True
+        return False
+
+    def _autotune(self, now: float):
+        """Adjust the concurrency limit from measured throughput.
+
+        Hill climbing: keep moving in the same direction while throughput
+        improves by more than TUNE_THRESHOLD, reverse when it drops by
+        more than that, and hold otherwise.
+
+        Args:
+            now: Current time.monotonic() value
+        """
+        elapsed = now - self._tune_last_ts
+        if elapsed < self.TUNE_INTERVAL:
+            return
+
+        rate = (self._bytes_total - self._tune_last_bytes) / elapsed
+        self._tune_last_ts = now
+        self._tune_last_bytes = self._bytes_total
+
+        if not self._pause_event.is_set():
+            # Paused intervals say nothing about the link
+            self._tune_prev_rate = None
+            self._tune_resuming = True
+            return
+
+        if self._tune_resuming:
+            # This interval straddles the resume; measure afresh from here
+            self._tune_resuming = False
+            return
+
+        prev = self._tune_prev_rate
+        self._tune_prev_rate = rate
+
+        if prev is None:
+            if self._tune_probed:
+                return  # First rate after a pause only re-seeds the baseline
+            self._tune_probed = True
+            step = 1  # Probe upwards from the configured value
+        elif rate > prev * (1 + self.TUNE_THRESHOLD):
+            step = self._tune_direction
+        elif rate < prev * (1 - self.TUNE_THRESHOLD):
+            step = self._tune_direction = -self._tune_direction
+        else:
+            return
+
+        if step > 0:
+            # Only worth another connection if there is work waiting
+            if self.queue.get_next_queued() is not None:
+                self._grow_slots()
+        else:
+            self._shrink_slots()
+
+    def _grow_slots(self):
+        """Allow one more concurrent download, if capacity remains."""
+        with self._tune_lock:
+            if self._slots_to_retire:
+                self._slots_to_retire -= 1
+            elif self._spare_slots:
+                self._slots.put(self._spare_slots.pop())
+            else:
+                return
+            self._active_limit += 1
+        self._log(f"Concurrent downloads raised to {self._active_limit}", "DEBUG")
+
+    def _shrink_slots(self):
+        """Allow one fewer concurrent download (never below one)."""
+        with self._tune_lock:
+            if self._active_limit <= 1:
+                return
+            self._slots_to_retire += 1
+            self._active_limit -= 1
+        self._log(f"Concurrent downloads lowered to {self._active_limit}", "DEBUG")
+
+    def _wake_reaper(self):
+        """Make the reaper re-read the set of running futures."""
+        wakeup = self._reaper_wakeup
+        if not wakeup.done():
+            try:
+                wakeup.set_result(None)
+            except InvalidStateError:
+                pass  # Already woken by another thread
 
     def _on_download_done(self, video_id: str, future: Future):
         """Handle download completion."""
-        with self._futures_lock:
-            self._active_futures.pop(video_id, None)
-
         video = self._active_downloads.pop(video_id, None)
         if not video:
             return
@@ -341,14 +883,29 @@ class DownloadManager:
             self.queue.update_status(video_id, VideoStatus.ERROR, str(e))
             self._log(f"Download error: {video.title} - {e}", "ERROR")
 
-    def _download_video(self, video: VideoItem) -> bool:
+    def notify_new_item(self):
+        """Wake the download loop because a video was queued.
+
+        Registered with the queue manager, so callers normally do not
+        need to call this directly.
+        """
+        self._wake_loop()
+
+    def _wake_loop(self):
+        """Wake the download loop if it is waiting for work."""
+        with self._cv:
+            self._cv.notify_all()
+
+    def _download_video(self, video: VideoItem, slot: int = 0) -> bool:
         """Download a single video with retry logic.
 
         Args:
             video: Video item to download
+            slot: Download slot owned by this video
 
         Returns:
-            True if successful, error message otherwise
+            True if successful, a Future for the post-processing step if
+            one is needed, error message otherwise
         """
         retry_count = 0
         delay = self.options.retry_delay
@@ -361,23 +918,28 @@ class DownloadManager:
             self._pause_event.wait()
 
             try:
-                # Build yt-dlp options
-                ydl_opts = self._build_ydl_options(video)
+                ydl = self._get_thread_ydl()
+                ydl.params['outtmpl']['default'] = self._get_output_template(video)
+                self._tls.video_id = video.id
+                self._tls.slot = slot
 
                 # Execute download
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([video.url])
+                info = ydl.extract_info(video.url, download=True)
+
+                pp_opts = self._pp_opts
+                if pp_opts and info and self._pp_executor:
+                    downloads = info.get('requested_downloads') or [info]
+                    return self._pp_executor.submit(
+                        self._post_process, pp_opts, downloads
+                    )
 
                 return True
 
             except yt_dlp.utils.DownloadError as e:
-                error_str = str(e).lower()
+                self._discard_thread_ydl()
 
                 # Check for non-retryable errors
-                if any(x in error_str for x in [
-                    'private video', 'video unavailable',
-                    'copyright', 'removed', 'terminated'
-                ]):
+                if self._NON_RETRYABLE_RE.search(str(e)):
                     return str(e)
 
                 retry_count += 1
@@ -386,37 +948,125 @@ class DownloadManager:
                         f"Retry {retry_count}/{self.options.max_retries} for {video.title}",
                         "WARNING"
                     )
-                    time.sleep(delay)
-                    delay *= 2  # Exponential backoff
+                    time.sleep(self._jittered(delay))
+                    # Exponential backoff, capped
+                    delay = min(self.options.retry_delay_max, delay * 2)
                 else:
                     return str(e)
 
             except Exception as e:
+                self._discard_thread_ydl()
+
                 retry_count += 1
                 if retry_count <= self.options.max_retries:
                     self._log(
                         f"Retry {retry_count}/{self.options.max_retries} for {video.title}",
                         "WARNING"
                     )
-                    time.sleep(delay)
-                    delay *= 2
+                    time.sleep(self._jittered(delay))
+                    delay = min(self.options.retry_delay_max, delay * 2)
                 else:
                     return str(e)
 
         return "Max retries exceeded"
 
-    def _build_ydl_options(self, video: VideoItem) -> dict:
-        """Build yt-dlp options dictionary.
+    def _post_process(self, pp_opts: dict, downloads: List[dict]):
+        """Run the FFmpeg post-processors for a downloaded video.
 
         Args:
-            video: Video being downloaded
+            pp_opts: yt-dlp options holding the postprocessors
+            downloads: Info dicts of the downloaded files
 
         Returns:
-            yt-dlp options dictionary
+            True if successful, error message otherwise
         """
-        # Determine output template
-        output_template = self._get_output_template(video)
+        try:
+            with yt_dlp.YoutubeDL(pp_opts) as ydl:
+                for info in downloads:
+                    ydl.post_process(info['filepath'], info)
+            return True
+        except Exception as e:
+            return str(e)
+
+    def _jittered(self, delay: float) -> float:
+        """Spread a retry delay so parallel failures do not retry in lockstep.
+
+        Args:
+            delay: Nominal delay in seconds
+
+        Returns:
+            Delay scaled by a random factor in [0.5, 1.5), at most retry_delay_max
+        """
+        return min(self.options.retry_delay_max, delay * (0.5 + random.random()))
+
+    def _get_thread_ydl(self):
+        """Get the calling worker thread's YoutubeDL instance.
+
+        Each pool thread keeps one instance across videos and rebuilds it
+        only when update_options() has produced new options. Per-video settings
+        are applied by the caller (outtmpl) or looked up per call from
+        thread-local state (progress hook).
+
+        Returns:
+            yt_dlp.YoutubeDL instance owned by this thread
+        """
+        tls = self._tls
+        ydl = getattr(tls, 'ydl', None)
+        if ydl is not None and tls.generation == self._opts_generation:
+            return ydl
+
+        if ydl is not None:
+            self._discard_thread_ydl()
+
+        template = self._ydl_opts_template
+        if template is None:
+            template = self._build_ydl_options_template()
+
+        ydl = yt_dlp.YoutubeDL({
+            **template,
+            'outtmpl': {},
+            'progress_hooks': [self._thread_progress_hook],
+        })
+        tls.ydl = ydl
+        tls.generation = self._opts_generation
+        with self._ydl_lock:
+            self._ydl_instances.append(ydl)
+        return ydl
+
+    def _discard_thread_ydl(self):
+        """Close and forget the calling thread's YoutubeDL instance."""
+        ydl = getattr(self._tls, 'ydl', None)
+        if ydl is None:
+            return
+
+        self._tls.ydl = None
+        with self._ydl_lock:
+            if ydl in self._ydl_instances:
+                self._ydl_instances.remove(ydl)
+        self._close_ydl(ydl)
+
+    def _close_ydl(self, ydl):
+        """Close a YoutubeDL instance, ignoring errors."""
+        try:
+            ydl.close()
+        except Exception:
+            pass
 
+    def _thread_progress_hook(self, d: dict):
+        """Progress hook shared by a thread's downloads.
+
+        Args:
+            d: Progress dictionary from yt-dlp
+        """
+        tls = self._tls
+        self._progress_hook(d, tls.video_id, tls.slot)
+
+    def _build_ydl_options_template(self) -> dict:
+        """Build the yt-dlp options that do not depend on the video.
+
+        Returns:
+            yt-dlp options dictionary without outtmpl/progress_hooks
+        """
         # Get format selector
         format_selector = self.options.format_selector
         if not format_selector:
@@ -427,8 +1077,6 @@ class DownloadManager:
 
         opts = {
             'format': format_selector,
-            'outtmpl': output_template,
-            'progress_hooks': [lambda d: self._progress_hook(d, video.id)],
             'ignoreerrors': False,
             'no_warnings': False,
             'quiet': True,
@@ -443,13 +1091,39 @@ class DownloadManager:
         if self.options.bandwidth_limit > 0:
             opts['ratelimit'] = self.options.bandwidth_limit
 
+        # Larger reads/writes mean fewer syscalls per MiB on fast links
+        if self.options.http_chunk_size > 0:
+            opts['http_chunk_size'] = self.options.http_chunk_size
+        if self.options.buffer_size > 0:
+            opts['buffersize'] = self.options.buffer_size
+
         # Subtitles
         if self.options.include_subtitles:
             opts['writesubtitles'] = True
             opts['writeautomaticsub'] = True
-            opts['subtitleslangs'] = self.options.subtitle_langs
+            opts['subtitleslangs'] = list(self.options.subtitle_langs)
 
-        # Post-processors
+        # Post-processors run separately (see _build_pp_options); the
+        # thumbnail still has to be fetched with the download
+        if self.options.embed_thumbnail:
+            opts['writethumbnail'] = True
+
+        # Authentication
+        if self.options.cookies_file and os.path.exists(self.options.cookies_file):
+            opts['cookiefile'] = self.options.cookies_file
+
+        # Proxy
+        if self.options.proxy:
+            opts['proxy'] = self.options.proxy
+
+        return opts
+
+    def _build_pp_options(self) -> Optional[dict]:
+        """Build yt-dlp options for the post-processing pool.
+
+        Returns:
+            yt-dlp options dictionary, or None if nothing to post-process
+        """
         postprocessors = []
 
         if self.options.embed_subtitles:
@@ -461,25 +1135,20 @@ class DownloadManager:
             postprocessors.append({
                 'key': 'EmbedThumbnail',
             })
-            opts['writethumbnail'] = True
 
         if self.options.add_metadata:
             postprocessors.append({
                 'key': 'FFmpegMetadata',
             })
 
-        if postprocessors:
-            opts['postprocessors'] = postprocessors
-
-        # Authentication
-        if self.options.cookies_file and os.path.exists(self.options.cookies_file):
-            opts['cookiefile'] = self.options.cookies_file
-
-        # Proxy
-        if self.options.proxy:
-            opts['proxy'] = self.options.proxy
+        if not postprocessors:
+            return None
 
-        return opts
+        return {
+            'quiet': True,
+            'no_warnings': False,
+            'postprocessors': postprocessors,
+        }
 
     def _get_output_template(self, video: VideoItem) -> str:
         """Get output template for a video.
@@ -494,9 +1163,7 @@ class DownloadManager:
 
         # Handle playlist videos
         if video.playlist_title:
-            playlist_folder = PathValidator.sanitize_filename(video.playlist_title)
-            base_path = os.path.join(base_path, playlist_folder)
-            os.makedirs(base_path, exist_ok=True)
+            base_path = self._get_playlist_dir(base_path, video.playlist_title)
 
             if video.playlist_index:
                 return os.path.join(
@@ -506,65 +1173,147 @@ class DownloadManager:
 
         return os.path.join(base_path, '%(title)s.%(ext)s')
 
-    def _progress_hook(self, d: dict, video_id: str):
+    def _get_playlist_dir(self, base_path: str, playlist_title: str) -> str:
+        """Get (and create once) the output folder for a playlist.
+
+        Args:
+            base_path: Base output directory
+            playlist_title: Title of the playlist
+
+        Returns:
+            Path of the playlist folder
+        """
+        key = (base_path, playlist_title)
+        path = self._playlist_dir_cache.get(key)
+        if path is None:
+            playlist_folder = PathValidator.sanitize_filename(playlist_title)
+            path = os.path.join(base_path, playlist_folder)
+            os.makedirs(path, exist_ok=True)
+            self._playlist_dir_cache[key] = path
+        return path
+
+    def _progress_hook(self, d: dict, video_id: str, slot: int = 0):
         """Progress hook for yt-dlp.
 
+        'downloading' ticks only record the latest values for the slot;
+        the emitter thread reports them (see _emit_progress).
+
         Args:
             d: Progress dictionary from yt-dlp
             video_id: ID of video being downloaded
+            slot: Download slot owned by the video
         """
         if self._stop_event.is_set():
             raise Exception("Download stopped by user")
 
         if d['status'] == 'downloading':
-            total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-            downloaded = d.get('downloaded_bytes', 0)
+            self._slot_video_id[slot] = video_id
+            self._slot_downloaded[slot] = d.get('downloaded_bytes', 0)
+            self._slot_total[slot] = (
+                d.get('total_bytes') or d.get('total_bytes_estimate', 0)
+            )
+            self._slot_speed[slot] = d.get('speed', 0) or 0
+            self._slot_eta[slot] = d.get('eta', 0) or 0
+            self._slot_filename[slot] = d.get('filename')
+            self._slot_dirty[slot] = True
+
+        elif d['status'] == 'finished':
+            # Reported immediately so it is never lost to slot reuse
+            self._slot_dirty[slot] = False
+            self.queue.update_progress(video_id, progress=100.0)
 
-            progress = 0.0
-            if total > 0:
-                progress = (downloaded / total) * 100
+            info = DownloadProgress(
+                video_id=video_id,
+                status='finished',
+                progress=100.0,
+                filename=d.get('filename')
+            )
+            self._dispatch_progress([info])
+
+    def _progress_emitter(self):
+        """Report recorded progress periodically until stopped."""
+        while True:
+            # With no listener attached the queue only needs occasional updates
+            if self.on_progress is None and self.on_progress_batch is None \
+                    and self.queue.on_item_updated is None:
+                interval = self.HEADLESS_PROGRESS_INTERVAL
+            else:
+                interval = self.PROGRESS_INTERVAL
+
+            if self._stop_event.wait(interval):
+                break
+
+            try:
+                self._emit_progress()
+                if self.options.auto_concurrency:
+                    self._autotune(time.monotonic())
+            except Exception as e:
+                self._log(f"Progress emitter error: {e}", "ERROR")
+
+    def _emit_progress(self):
+        """Push the latest progress of every updated slot to listeners."""
+        batch = []
+        for slot, dirty in enumerate(self._slot_dirty):
+            if not dirty:
+                continue
+            self._slot_dirty[slot] = False
+
+            total = self._slot_total[slot]
+            downloaded = self._slot_downloaded[slot]
+
+            # Byte counts restart with each file (e.g. video then audio)
+            delta = downloaded - self._slot_seen_bytes[slot]
+            self._bytes_total += delta if delta >= 0 else downloaded
+            self._slot_seen_bytes[slot] = downloaded
+
+            info = self._slot_progress[slot]
+            info.video_id = self._slot_video_id[slot]
+            info.status = 'downloading'
+            info.progress = (downloaded / total) * 100 if total > 0 else 0.0
+            info.speed = self._slot_speed[slot]
+            info.eta = self._slot_eta[slot]
+            info.downloaded_bytes = downloaded
+            info.total_bytes = total
+            info.filename = self._slot_filename[slot]
 
-            # Update queue
             self.queue.update_progress(
-                video_id,
-                progress=progress,
-                speed=d.get('speed', 0) or 0,
-                eta=d.get('eta', 0) or 0
+                info.video_id,
+                progress=info.progress,
+                speed=info.speed,
+                eta=info.eta
             )
+            batch.append(info)
 
-            # Notify callback
-            if self.on_progress:
-                try:
-                    self.on_progress(DownloadProgress(
-                        video_id=video_id,
-                        status='downloading',
-                        progress=progress,
-                        speed=d.get('speed', 0) or 0,
-                        eta=d.get('eta', 0) or 0,
-                        downloaded_bytes=downloaded,
-                        total_bytes=total,
-                        filename=d.get('filename')
-                    ))
-                except Exception:
-                    pass
+        if batch:
+            self._dispatch_progress(batch)
 
-        elif d['status'] == 'finished':
-            self.queue.update_progress(video_id, progress=100.0)
+    def _dispatch_progress(self, batch: List[DownloadProgress]):
+        """Call the progress callbacks for a batch of updates.
 
-            if self.on_progress:
+        Args:
+            batch: Progress objects to report
+        """
+        on_progress = self.on_progress
+        if on_progress:
+            for info in batch:
                 try:
-                    self.on_progress(DownloadProgress(
-                        video_id=video_id,
-                        status='finished',
-                        progress=100.0,
-                        filename=d.get('filename')
-                    ))
+                    on_progress(info)
                 except Exception:
                     pass
 
+        on_progress_batch = self.on_progress_batch
+        if on_progress_batch:
+            try:
+                on_progress_batch(batch)
+            except Exception:
+                pass
+
     def extract_info(self, url: str) -> Optional[List[Dict[str, Any]]]:
         """Extract video information from URL.
 
+        Playlists are listed flat first, then their entries are resolved
+        concurrently, each on its own YoutubeDL instance.
+
         Args:
             url: Video or playlist URL
 
@@ -572,48 +1321,110 @@ class DownloadManager:
             List of video info dictionaries, or None if error
         """
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-                'ignoreerrors': True,
-            }
+            with yt_dlp.YoutubeDL(self._get_extract_options(flat=True)) as ydl:
+                info = ydl.extract_info(url, download=False)
 
-            # Add authentication if available
-            if self.options.cookies_file and os.path.exists(self.options.cookies_file):
-                ydl_opts['cookiefile'] = self.options.cookies_file
+            if not info:
+                return None
+
+            if 'entries' not in info:
+                # Single video
+                return [self._format_video_info(info)]
+
+            # Playlist
+            playlist_title = info.get('title', 'Playlist')
+            indexed = [
+                (i + 1, entry)
+                for i, entry in enumerate(info['entries'])
+                if entry
+            ]
+            if not indexed:
+                return []
+
+            workers = min(self.EXTRACT_WORKERS, len(indexed))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                resolved = list(pool.map(
+                    lambda item: self._resolve_entry(item[1]), indexed
+                ))
+
+            return [
+                self._format_video_info(
+                    entry,
+                    playlist_title=playlist_title,
+                    playlist_index=index
+                )
+                for (index, _), entry in zip(indexed, resolved)
+                if entry
+            ]
 
-            if self.options.proxy:
-                ydl_opts['proxy'] = self.options.proxy
+        except Exception as e:
+            self._log(f"Extraction error: {e}", "ERROR")
+            return None
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+    def extract_info_batch(
+        self,
+        urls: List[str]
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Extract video information for several URLs concurrently.
 
-                if not info:
-                    return None
-
-                videos = []
-
-                if 'entries' in info:
-                    # Playlist
-                    playlist_title = info.get('title', 'Playlist')
-                    for i, entry in enumerate(info['entries']):
-                        if entry:
-                            videos.append(self._format_video_info(
-                                entry,
-                                playlist_title=playlist_title,
-                                playlist_index=i + 1
-                            ))
-                else:
-                    # Single video
-                    videos.append(self._format_video_info(info))
+        Args:
+            urls: Video or playlist URLs
 
-                return videos
+        Returns:
+            One extract_info() result per URL, in input order
+        """
+        if not urls:
+            return []
+
+        workers = min(self.EXTRACT_WORKERS, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.extract_info, urls))
+
+    def _resolve_entry(self, entry: dict) -> Optional[dict]:
+        """Fully extract a flat playlist entry.
+
+        Args:
+            entry: Flat entry from a playlist listing
 
+        Returns:
+            Full info dictionary, or None if the entry is unavailable
+        """
+        entry_url = entry.get('webpage_url') or entry.get('url')
+        if not entry_url:
+            return None
+
+        try:
+            with yt_dlp.YoutubeDL(self._get_extract_options()) as ydl:
+                return ydl.extract_info(entry_url, download=False)
         except Exception as e:
             self._log(f"Extraction error: {e}", "ERROR")
             return None
 
+    def _get_extract_options(self, flat: bool = False) -> dict:
+        """Build yt-dlp options for info extraction.
+
+        Args:
+            flat: List playlist entries without resolving them
+
+        Returns:
+            yt-dlp options dictionary
+        """
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': 'in_playlist' if flat else False,
+            'ignoreerrors': True,
+        }
+
+        # Add authentication if available
+        if self.options.cookies_file and os.path.exists(self.options.cookies_file):
+            ydl_opts['cookiefile'] = self.options.cookies_file
+
+        if self.options.proxy:
+            ydl_opts['proxy'] = self.options.proxy
+
+        return ydl_opts
+
     def _format_video_info(
         self,
         info: dict,
@@ -3,10 +3,44 @@
 Provides functionality to fetch and filter available video formats.
 """
 
+import atexit
 import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import List, Optional, Callable
 from enum import Enum
+from queue import SimpleQueue
+
+from src.utils.cache import VideoInfoCache
+
+
+# Minimum heights for each named quality, ascending, and their labels
+_QUALITY_HEIGHTS = (360, 480, 720, 1080, 1440, 2160)
+_QUALITY_LABELS = ("360p", "480p", "720p", "1080p", "2K", "4K")
+
+
+def _quality_key(fmt: 'FormatInfo') -> tuple:
+    """Sort key ranking formats by height, then fps, then bitrate."""
+    return (fmt.height, fmt.fps or 0, fmt.tbr or 0)
+
+
+def _size_key(fmt: 'FormatInfo') -> int:
+    """Sort key ranking formats by (approximate) file size."""
+    return fmt.filesize or fmt.filesize_approx or 0
+
+
+def _bitrate_key(fmt: 'FormatInfo') -> float:
+    """Sort key ranking formats by total bitrate."""
+    return fmt.tbr or 0
+
+
+# sort_formats criteria -> key function
+_SORT_KEYS = {
+    "quality": _quality_key,
+    "size": _size_key,
+    "bitrate": _bitrate_key,
+}
 
 
 class FormatType(Enum):
@@ -16,7 +50,7 @@ class FormatType(Enum):
     AUDIO_ONLY = "audio"
 
 
-@dataclass
+@dataclass(slots=True)
 class FormatInfo:
     """Information about a video format.
 
@@ -55,6 +89,12 @@ class FormatInfo:
     has_video: bool = False
     has_audio: bool = False
 
+    # Display strings, computed on first access (fields are not expected
+    # to change once a format is listed)
+    _quality_label: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _size_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _bitrate_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def format_type(self) -> FormatType:
         """Get the type of this format."""
@@ -68,56 +108,67 @@ class FormatInfo:
     @property
     def quality_label(self) -> str:
         """Get human-readable quality label."""
+        if self._quality_label is not None:
+            return self._quality_label
+
         if self.has_video:
-            if self.height >= 2160:
-                return "4K"
-            elif self.height >= 1440:
-                return "2K"
-            elif self.height >= 1080:
-                return "1080p"
-            elif self.height >= 720:
-                return "720p"
-            elif self.height >= 480:
-                return "480p"
-            elif self.height >= 360:
-                return "360p"
+            i = bisect_right(_QUALITY_HEIGHTS, self.height) - 1
+            if i >= 0:
+                label = _QUALITY_LABELS[i]
             elif self.height > 0:
-                return f"{self.height}p"
+                label = f"{self.height}p"
             else:
-                return self.resolution or "Unknown"
+                label = self.resolution or "Unknown"
         else:
             # Audio only
             if self.abr:
-                return f"{int(self.abr)}kbps"
-            return "Audio"
+                label = f"{int(self.abr)}kbps"
+            else:
+                label = "Audio"
+
+        self._quality_label = label
+        return label
 
     @property
     def size_str(self) -> str:
         """Get formatted file size string."""
+        if self._size_str is not None:
+            return self._size_str
+
         size = self.filesize or self.filesize_approx
         if not size:
-            return "Unknown"
-
-        if size >= 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024 * 1024):.1f} GB"
+            text = "Unknown"
+        elif size >= 1024 * 1024 * 1024:
+            text = f"{size / (1024 * 1024 * 1024):.1f} GB"
         elif size >= 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
+            text = f"{size / (1024 * 1024):.1f} MB"
         elif size >= 1024:
-            return f"{size / 1024:.1f} KB"
-        return f"{size} B"
+            text = f"{size / 1024:.1f} KB"
+        else:
+            text = f"{size} B"
+
+        self._size_str = text
+        return text
 
     @property
     def bitrate_str(self) -> str:
         """Get formatted bitrate string."""
+        if self._bitrate_str is not None:
+            return self._bitrate_str
+
         br = self.tbr or (self.vbr or 0) + (self.abr or 0)
-        if br:
-            if br >= 1000:
-                return f"{br / 1000:.1f} Mbps"
-            return f"{int(br)} kbps"
-        return "Unknown"
+        if not br:
+            text = "Unknown"
+        elif br >= 1000:
+            text = f"{br / 1000:.1f} Mbps"
+        else:
+            text = f"{int(br)} kbps"
 
+        self._bitrate_str = text
+        return text
 
-@dataclass
+
+@dataclass(slots=True)
 class VideoFormats:
     """Container for video information and available formats.
 
@@ -137,6 +188,113 @@ class VideoFormats:
     error: Optional[str] = None
 
 
+class FetchHandle:
+    """Handle for an asynchronous format or playlist fetch.
+
+    Cancelling drops a fetch that has not started yet. A running fetch
+    cannot interrupt its current yt-dlp request, but stops at the next
+    check (e.g. between playlist entries) and never calls its callbacks.
+
+    Attributes:
+        event: Set once the fetch is cancelled
+        future: Future of the fetch task
+    """
+
+    __slots__ = ('event', 'future')
+
+    def __init__(self):
+        """Initialize an uncancelled handle."""
+        self.event = threading.Event()
+        self.future: Optional[Future] = None
+
+    def cancel(self):
+        """Cancel the fetch and suppress its callbacks."""
+        self.event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self.event.is_set()
+
+    def done(self) -> bool:
+        """Whether the fetch task has finished or was cancelled."""
+        return self.future is not None and self.future.done()
+
+    def result(self, timeout: Optional[float] = None):
+        """Wait for the fetch task to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+        """
+        return self.future.result(timeout)
+
+
+class FetchExecutor:
+    """Bounded pool of daemon threads for FetchHandle tasks.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so a fetch
+    blocked in a yt-dlp network call would keep the app from closing.
+    These fetches are fire-and-forget, so their workers are daemon
+    threads that are simply abandoned on exit, as the per-fetch threads
+    used to be.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        """Initialize the pool (threads are only started on first use).
+
+        Args:
+            max_workers: Maximum number of worker threads
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work = SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._num_threads = 0
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Run fn(*args) on a worker thread.
+
+        Args:
+            fn: Callable to run
+            *args: Arguments for fn
+
+        Returns:
+            Future of the call
+        """
+        future = Future()
+        self._work.put((future, fn, args))
+
+        # Start another worker unless an idle one will pick this up
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                if self._num_threads < self._max_workers:
+                    self._num_threads += 1
+                    threading.Thread(
+                        target=self._worker,
+                        name=f"{self._thread_name_prefix}_{self._num_threads - 1}",
+                        daemon=True
+                    ).start()
+        return future
+
+    def _worker(self):
+        """Run queued calls until the interpreter exits."""
+        while True:
+            future, fn, args = self._work.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del future, fn, args
+            self._idle.release()
+
+
 class FormatSelector:
     """Fetches and filters available video formats.
 
@@ -155,52 +313,107 @@ class FormatSelector:
         video_formats = selector.filter_formats(formats.formats, video_only=True)
     """
 
+    # How long fetched formats are reused, in seconds
+    CACHE_TTL = 600.0
+
+    # Successful fetches keyed by video ID. Shared by all instances so
+    # re-opening the format dialog for a URL does not refetch it.
+    _formats_cache: VideoInfoCache = VideoInfoCache(max_size=128, default_ttl=CACHE_TTL)
+
+    # yt-dlp options for format listing
+    YDL_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': False,
+        'skip_download': True,
+    }
+
+    # One YoutubeDL per thread, shared by all instances and created on the
+    # thread's first fetch, so extractor setup is paid once per thread and
+    # concurrent fetches do not wait on each other
+    _tls = threading.local()
+
+    # Worker threads for the *_async methods, shared by all instances
+    # (threads are only started on first use)
+    FETCH_WORKERS = 4
+    _executor = FetchExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="format-fetch")
+
     def __init__(self):
         """Initialize format selector."""
         self._fetch_lock = threading.Lock()
 
+    @classmethod
+    def _get_ydl(cls):
+        """Get the calling thread's YoutubeDL instance.
+
+        Returns:
+            yt_dlp.YoutubeDL configured with YDL_OPTS
+        """
+        ydl = getattr(cls._tls, 'ydl', None)
+        if ydl is None:
+            import yt_dlp
+
+            ydl = cls._tls.ydl = yt_dlp.YoutubeDL(dict(cls.YDL_OPTS))
+            atexit.register(ydl.close)
+        return ydl
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all cached format lists."""
+        cls._formats_cache.clear()
+
     def get_formats(self, url: str) -> VideoFormats:
         """Get available formats for a URL.
 
+        Results are cached for CACHE_TTL seconds; failed fetches are not.
+
         Args:
             url: YouTube video URL
 
         Returns:
             VideoFormats object with available formats
         """
-        try:
-            import yt_dlp
+        cached = self._formats_cache.get_by_url(url)
+        if cached is not None:
+            return cached
 
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-                'skip_download': True,
-            }
+        result = self._fetch_formats(url)
+        if not result.error:
+            self._formats_cache.set_by_url(url, result)
+        return result
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+    def _fetch_formats(self, url: str) -> VideoFormats:
+        """Fetch available formats for a URL from yt-dlp.
 
-                if not info:
-                    return VideoFormats(
-                        video_id="",
-                        error="Could not extract video information"
-                    )
+        Args:
+            url: YouTube video URL
 
-                formats = []
-                for fmt in info.get('formats', []):
-                    format_info = self._parse_format(fmt)
-                    if format_info:
-                        formats.append(format_info)
+        Returns:
+            VideoFormats object with available formats
+        """
+        try:
+            info = self._get_ydl().extract_info(url, download=False)
 
+            if not info:
                 return VideoFormats(
-                    video_id=info.get('id', ''),
-                    title=info.get('title', ''),
-                    duration=info.get('duration', 0),
-                    thumbnail=info.get('thumbnail', ''),
-                    formats=formats
+                    video_id="",
+                    error="Could not extract video information"
                 )
 
+            formats = []
+            for fmt in info.get('formats', []):
+                format_info = self._parse_format(fmt)
+                if format_info:
+                    formats.append(format_info)
+
+            return VideoFormats(
+                video_id=info.get('id', ''),
+                title=info.get('title', ''),
+                duration=info.get('duration', 0),
+                thumbnail=info.get('thumbnail', ''),
+                formats=formats
+            )
+
         except Exception as e:
             return VideoFormats(
                 video_id="",
@@ -216,12 +429,15 @@ class FormatSelector:
         Returns:
             FormatInfo object or None if format is invalid
         """
-        format_id = fmt.get('format_id')
+        # Bound once; called for every field of every format
+        get = fmt.get
+
+        format_id = get('format_id')
         if not format_id:
             return None
 
-        vcodec = fmt.get('vcodec', 'none')
-        acodec = fmt.get('acodec', 'none')
+        vcodec = get('vcodec', 'none')
+        acodec = get('acodec', 'none')
 
         has_video = vcodec and vcodec != 'none'
         has_audio = acodec and acodec != 'none'
@@ -230,28 +446,28 @@ class FormatSelector:
         if not has_video and not has_audio:
             return None
 
-        width = fmt.get('width') or 0
-        height = fmt.get('height') or 0
+        width = get('width') or 0
+        height = get('height') or 0
 
-        resolution = fmt.get('resolution', '')
+        resolution = get('resolution', '')
         if not resolution and width and height:
             resolution = f"{width}x{height}"
 
         return FormatInfo(
             format_id=format_id,
-            ext=fmt.get('ext', ''),
+            ext=get('ext', ''),
             resolution=resolution,
             width=width,
             height=height,
-            fps=fmt.get('fps'),
+            fps=get('fps'),
             vcodec=vcodec if has_video else "none",
             acodec=acodec if has_audio else "none",
-            filesize=fmt.get('filesize'),
-            filesize_approx=fmt.get('filesize_approx'),
-            tbr=fmt.get('tbr'),
-            vbr=fmt.get('vbr'),
-            abr=fmt.get('abr'),
-            format_note=fmt.get('format_note', ''),
+            filesize=get('filesize'),
+            filesize_approx=get('filesize_approx'),
+            tbr=get('tbr'),
+            vbr=get('vbr'),
+            abr=get('abr'),
+            format_note=get('format_note', ''),
             has_video=has_video,
             has_audio=has_audio,
         )
@@ -278,28 +494,17 @@ class FormatSelector:
         Returns:
             Filtered list of formats
         """
-        filtered = []
-
-        for fmt in formats:
-            # Type filter
-            if video_only and not fmt.has_video:
-                continue
-            if audio_only and not fmt.has_audio:
-                continue
-
-            # Height filter
-            if min_height > 0 and fmt.height < min_height:
-                continue
-            if max_height > 0 and fmt.height > max_height:
-                continue
-
-            # Extension filter
-            if extensions and fmt.ext not in extensions:
-                continue
-
-            filtered.append(fmt)
-
-        return filtered
+        # Heights are never negative, so an unset minimum needs no check
+        upper = max_height if max_height > 0 else float('inf')
+        allowed_ext = frozenset(extensions) if extensions else None
+
+        return [
+            fmt for fmt in formats
+            if (not video_only or fmt.has_video)
+            and (not audio_only or fmt.has_audio)
+            and min_height <= fmt.height <= upper
+            and (allowed_ext is None or fmt.ext in allowed_ext)
+        ]
 
     def sort_formats(
         self,
@@ -317,14 +522,10 @@ class FormatSelector:
         Returns:
             Sorted list of formats
         """
-        if by == "quality":
-            key = lambda f: (f.height, f.fps or 0, f.tbr or 0)
-        elif by == "size":
-            key = lambda f: f.filesize or f.filesize_approx or 0
-        elif by == "bitrate":
-            key = lambda f: f.tbr or 0
-        else:
-            key = lambda f: 0
+        key = _SORT_KEYS.get(by)
+        if key is None:
+            # Unknown criteria leave the order unchanged
+            return list(formats)
 
         return sorted(formats, key=key, reverse=descending)
 
@@ -353,13 +554,12 @@ class FormatSelector:
         if not formats:
             return None
 
-        # Sort by quality
-        sorted_formats = self.sort_formats(formats, by="quality", descending=True)
-
-        if quality == "best":
-            return sorted_formats[0]
-        elif quality == "worst":
-            return sorted_formats[-1]
+        # best/worst need a single linear pass, not a sort. Among equal
+        # keys, worst is the last one (as the tail of a stable sort would be).
+        if quality == "worst":
+            return min(reversed(formats), key=_quality_key)
+        elif quality == "best":
+            return max(formats, key=_quality_key)
 
         # Parse quality string (e.g., "1080p" -> 1080)
         target_height = 0
@@ -370,42 +570,56 @@ class FormatSelector:
                 pass
 
         if target_height > 0:
-            # Find closest match
-            best_match = None
-            best_diff = float('inf')
+            # Find closest match by binary search over ascending heights.
+            # Ties go to the higher resolution, and within one height to
+            # the best fps/bitrate, i.e. the last of its run.
+            video_formats = sorted(
+                (f for f in reversed(formats) if f.has_video), key=_quality_key
+            )
+            if not video_formats:
+                return None
+
+            heights = [f.height for f in video_formats]
+            i = bisect_left(heights, target_height)
 
-            for fmt in sorted_formats:
-                if fmt.has_video:
-                    diff = abs(fmt.height - target_height)
-                    if diff < best_diff:
-                        best_diff = diff
-                        best_match = fmt
+            candidates = []
+            if i < len(heights):
+                candidates.append(video_formats[bisect_right(heights, heights[i]) - 1])
+            if i > 0:
+                candidates.append(video_formats[i - 1])
 
-            return best_match
+            return min(candidates, key=lambda f: abs(f.height - target_height))
 
-        return sorted_formats[0]
+        return max(formats, key=_quality_key)
 
     def get_formats_async(
         self,
         url: str,
         on_complete: Callable[[VideoFormats], None],
         on_progress: Optional[Callable[[str], None]] = None
-    ) -> threading.Thread:
+    ) -> FetchHandle:
         """Get formats asynchronously.
 
         Args:
             url: YouTube video URL
-            on_complete: Callback when fetch completes
+            on_complete: Callback when fetch completes (not called if cancelled)
             on_progress: Optional progress callback
 
         Returns:
-            Thread running the fetch
+            FetchHandle for waiting on or cancelling the fetch
         """
+        handle = FetchHandle()
+
         def fetch_task():
+            if handle.cancelled:
+                return
+
             if on_progress:
                 on_progress("Fetching video information...")
 
             result = self.get_formats(url)
+            if handle.cancelled:
+                return
 
             if on_progress:
                 if result.error:
@@ -415,6 +629,5 @@ class FormatSelector:
 
             on_complete(result)
 
-        thread = threading.Thread(target=fetch_task, daemon=True)
-        thread.start()
-        return thread
+        handle.future = self._executor.submit(fetch_task)
+        return handle
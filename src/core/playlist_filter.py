@@ -3,14 +3,26 @@
 Provides functionality to fetch playlist info and filter videos.
 """
 
+import atexit
 import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, SimpleQueue
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable
-from datetime import datetime
+from datetime import date as _date
+from operator import attrgetter
+from typing import Iterator, List, Optional, Callable
 
+from src.utils.cache import CacheManager, canonical_url
+from .format_selector import FetchExecutor, FetchHandle
 
-@dataclass
+
+# Sort/search key for playlist position
+_video_index = attrgetter('index')
+
+
+@dataclass(slots=True)
 class PlaylistVideoInfo:
     """Information about a video in a playlist.
 
@@ -39,8 +51,18 @@ class PlaylistVideoInfo:
     thumbnail: str = ""
     is_available: bool = True
 
+    # Display strings, computed on first access
+    _formatted_date: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _formatted_views: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    # Case-folded title for case-insensitive search
+    _title_folded: str = field(default="", init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Format duration string if not set."""
+        """Format duration string if not set and fold the title for search."""
+        # yt-dlp can report a title of None
+        self._title_folded = (self.title or "").casefold()
+
         if not self.duration_str and self.duration:
             hours, remainder = divmod(self.duration, 3600)
             minutes, seconds = divmod(remainder, 60)
@@ -52,30 +74,46 @@ class PlaylistVideoInfo:
     @property
     def formatted_date(self) -> str:
         """Get formatted upload date."""
-        if self.upload_date and len(self.upload_date) == 8:
+        if self._formatted_date is not None:
+            return self._formatted_date
+
+        # YYYYMMDD is fixed-width, so slicing is enough (no strptime);
+        # yt-dlp reports None for some live/premiere entries
+        date = self.upload_date or ""
+        text = date or "Unknown"
+        if len(date) == 8 and date.isdigit():
             try:
-                date = datetime.strptime(self.upload_date, "%Y%m%d")
-                return date.strftime("%Y-%m-%d")
+                _date(int(date[:4]), int(date[4:6]), int(date[6:]))
             except ValueError:
                 pass
-        return self.upload_date or "Unknown"
+            else:
+                text = f"{date[:4]}-{date[4:6]}-{date[6:]}"
+
+        self._formatted_date = text
+        return text
 
     @property
     def formatted_views(self) -> str:
         """Get formatted view count."""
-        if not self.view_count:
-            return "Unknown"
+        if self._formatted_views is not None:
+            return self._formatted_views
 
-        if self.view_count >= 1_000_000_000:
-            return f"{self.view_count / 1_000_000_000:.1f}B"
+        if not self.view_count:
+            text = "Unknown"
+        elif self.view_count >= 1_000_000_000:
+            text = f"{self.view_count / 1_000_000_000:.1f}B"
         elif self.view_count >= 1_000_000:
-            return f"{self.view_count / 1_000_000:.1f}M"
+            text = f"{self.view_count / 1_000_000:.1f}M"
         elif self.view_count >= 1_000:
-            return f"{self.view_count / 1_000:.1f}K"
-        return str(self.view_count)
+            text = f"{self.view_count / 1_000:.1f}K"
+        else:
+            text = str(self.view_count)
+
+        self._formatted_views = text
+        return text
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistInfo:
     """Information about a YouTube playlist.
 
@@ -94,10 +132,19 @@ class PlaylistInfo:
     videos: List[PlaylistVideoInfo] = field(default_factory=list)
     error: Optional[str] = None
 
+    # Sum of video durations, computed on first access
+    _total_duration: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def total_duration(self) -> int:
         """Get total duration of all videos in seconds."""
-        return sum(v.duration for v in self.videos if v.duration)
+        if self._total_duration is None:
+            self._total_duration = sum(v.duration for v in self.videos if v.duration)
+        return self._total_duration
+
+    def invalidate_cache(self):
+        """Drop cached totals after videos has been modified."""
+        self._total_duration = None
 
     @property
     def total_duration_str(self) -> str:
@@ -119,7 +166,9 @@ class PlaylistFilter:
     - Filter by date
     - Filter by index range
     - Search by title
+    - Combined single-pass filtering
     - Async fetching with callback
+    - Parallel metadata hydration of flat listings
 
     Usage:
         filter = PlaylistFilter()
@@ -135,10 +184,76 @@ class PlaylistFilter:
         r'youtube\.com/playlist\?list=([a-zA-Z0-9_-]+)',
     ]
 
+    # PLAYLIST_PATTERNS as one precompiled alternation; exactly one group
+    # matches, so the ID is group(lastindex)
+    _PLAYLIST_RE = re.compile('|'.join(f'(?:{p})' for p in PLAYLIST_PATTERNS))
+
+    # How long fetched playlist info is reused, in seconds
+    CACHE_TTL = 600.0
+
+    # Successful fetches keyed by playlist ID (or canonical URL), shared by
+    # all instances
+    _info_cache: CacheManager = CacheManager(max_size=32, default_ttl=CACHE_TTL)
+
+    # yt-dlp options for playlist listing
+    YDL_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': 'in_playlist',
+        'skip_download': True,
+    }
+
+    # One YoutubeDL per thread, shared by all instances and created on the
+    # thread's first fetch, so extractor setup is paid once per thread and
+    # concurrent fetches do not wait on each other
+    _tls = threading.local()
+
+    # Redirects followed when a URL resolves to another URL
+    MAX_URL_HOPS = 3
+
+    # Async fetches report progress every this many listed videos
+    PROGRESS_EVERY = 100
+
+    # yt-dlp options for per-video lookups in hydrate_videos
+    # (process=False is passed per call to skip format selection)
+    HYDRATE_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True,
+    }
+
+    # Below this many videos, hydrate_videos looks them up sequentially
+    HYDRATE_MIN_PARALLEL = 4
+
+    # Worker threads for the *_async methods, shared by all instances
+    # (threads are only started on first use)
+    FETCH_WORKERS = 4
+    _executor = FetchExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="playlist-fetch")
+
     def __init__(self):
         """Initialize playlist filter."""
         self._fetch_lock = threading.Lock()
 
+    @classmethod
+    def _get_ydl(cls):
+        """Get the calling thread's YoutubeDL instance.
+
+        Returns:
+            yt_dlp.YoutubeDL configured with YDL_OPTS
+        """
+        ydl = getattr(cls._tls, 'ydl', None)
+        if ydl is None:
+            import yt_dlp
+
+            ydl = cls._tls.ydl = yt_dlp.YoutubeDL(dict(cls.YDL_OPTS))
+            atexit.register(ydl.close)
+        return ydl
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all cached playlist info."""
+        cls._info_cache.clear()
+
     @classmethod
     def is_playlist_url(cls, url: str) -> bool:
         """Check if URL is a playlist URL.
@@ -149,10 +264,7 @@ class PlaylistFilter:
         Returns:
             True if URL is a playlist
         """
-        for pattern in cls.PLAYLIST_PATTERNS:
-            if re.search(pattern, url):
-                return True
-        return False
+        return cls._PLAYLIST_RE.search(url) is not None
 
     @classmethod
     def extract_playlist_id(cls, url: str) -> Optional[str]:
@@ -164,86 +276,246 @@ class PlaylistFilter:
         Returns:
             Playlist ID or None
         """
-        for pattern in cls.PLAYLIST_PATTERNS:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = cls._PLAYLIST_RE.search(url)
+        return match.group(match.lastindex) if match else None
 
-    def get_playlist_info(self, url: str) -> PlaylistInfo:
+    def get_playlist_info(
+        self,
+        url: str,
+        on_video: Optional[Callable[[PlaylistVideoInfo], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> PlaylistInfo:
         """Get playlist information.
 
+        Results are cached for CACHE_TTL seconds; failed or cancelled
+        fetches are not.
+
         Args:
             url: YouTube playlist URL
+            on_video: Optional callback for each video as it is listed
+                (not called when the result comes from the cache)
+            cancel_event: Optional event that stops listing when set
 
         Returns:
             PlaylistInfo with video list
         """
-        try:
-            import yt_dlp
+        key = self.extract_playlist_id(url) or canonical_url(url)
+        cached = self._info_cache.get(key)
+        if cached is not None:
+            return cached
 
-            playlist_id = self.extract_playlist_id(url) or ""
+        result = self._fetch_playlist_info(url, on_video, cancel_event)
+        if not result.error:
+            self._info_cache.set(key, result)
+        return result
 
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': 'in_playlist',
-                'skip_download': True,
-            }
+    def _fetch_playlist_info(
+        self,
+        url: str,
+        on_video: Optional[Callable[[PlaylistVideoInfo], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> PlaylistInfo:
+        """Fetch playlist information from yt-dlp.
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+        Args:
+            url: YouTube playlist URL
+            on_video: Optional callback for each video as it is listed
+            cancel_event: Optional event that stops listing when set
 
-                if not info:
-                    return PlaylistInfo(
-                        playlist_id=playlist_id,
-                        error="Could not extract playlist information"
-                    )
-
-                videos = []
-                entries = info.get('entries', [])
-
-                for idx, entry in enumerate(entries, 1):
-                    if entry is None:
-                        # Private or unavailable video
-                        videos.append(PlaylistVideoInfo(
-                            index=idx,
-                            video_id="",
-                            url="",
-                            title="[Unavailable Video]",
-                            is_available=False
-                        ))
-                        continue
-
-                    video_id = entry.get('id', '')
-                    video_info = PlaylistVideoInfo(
-                        index=idx,
-                        video_id=video_id,
-                        url=entry.get('url', f"https://www.youtube.com/watch?v={video_id}"),
-                        title=entry.get('title', 'Unknown'),
-                        duration=entry.get('duration', 0) or 0,
-                        upload_date=entry.get('upload_date', ''),
-                        uploader=entry.get('uploader', entry.get('channel', '')),
-                        view_count=entry.get('view_count', 0) or 0,
-                        thumbnail=entry.get('thumbnail', ''),
-                        is_available=True
-                    )
-                    videos.append(video_info)
+        Returns:
+            PlaylistInfo with video list
+        """
+        try:
+            playlist_id = self.extract_playlist_id(url) or ""
+
+            info = self._open_playlist(self._get_ydl(), url)
 
+            if not info:
                 return PlaylistInfo(
                     playlist_id=playlist_id,
-                    title=info.get('title', 'Unknown Playlist'),
-                    uploader=info.get('uploader', info.get('channel', '')),
-                    video_count=len(videos),
-                    videos=videos
+                    error="Could not extract playlist information"
                 )
 
+            # Entries are lazy; later pages are fetched as they are consumed
+            videos = []
+            for idx, entry in enumerate(info.get('entries') or [], 1):
+                if cancel_event is not None and cancel_event.is_set():
+                    return PlaylistInfo(playlist_id=playlist_id, error="Cancelled")
+
+                video_info = self._make_video_info(idx, entry)
+                videos.append(video_info)
+                if on_video:
+                    try:
+                        on_video(video_info)
+                    except Exception:
+                        pass
+
+            return PlaylistInfo(
+                playlist_id=playlist_id,
+                title=info.get('title', 'Unknown Playlist'),
+                uploader=info.get('uploader', info.get('channel', '')),
+                video_count=len(videos),
+                videos=videos
+            )
+
         except Exception as e:
             return PlaylistInfo(
                 playlist_id=self.extract_playlist_id(url) or "",
                 error=str(e)
             )
 
+    def iter_playlist_info(self, url: str) -> Iterator[PlaylistVideoInfo]:
+        """Yield the videos of a playlist as yt-dlp lists them.
+
+        Unlike get_playlist_info, each page of a long playlist is yielded
+        as soon as it is fetched. The iterator uses its own YoutubeDL,
+        closed once it is exhausted or closed, so other fetches on the same
+        thread can run while it is suspended. Results are not cached.
+
+        Args:
+            url: YouTube playlist URL
+
+        Yields:
+            PlaylistVideoInfo for each entry, in playlist order
+        """
+        import yt_dlp
+
+        with yt_dlp.YoutubeDL(dict(self.YDL_OPTS)) as ydl:
+            info = self._open_playlist(ydl, url)
+            if not info:
+                return
+
+            for idx, entry in enumerate(info.get('entries') or [], 1):
+                yield self._make_video_info(idx, entry)
+
+    def _open_playlist(self, ydl, url: str) -> Optional[dict]:
+        """Extract a playlist without processing its entries.
+
+        With process=False, yt-dlp returns the entries as a lazy iterable,
+        so later pages are only fetched as they are consumed. URL results
+        (e.g. a watch page pointing at its playlist) are followed.
+
+        Args:
+            ydl: YoutubeDL instance to extract with
+            url: YouTube playlist URL
+
+        Returns:
+            Raw playlist info dictionary or None
+        """
+        info = ydl.extract_info(url, download=False, process=False)
+        for _ in range(self.MAX_URL_HOPS):
+            if not info or info.get('_type') not in ('url', 'url_transparent'):
+                break
+            info = ydl.extract_info(
+                info['url'], download=False, process=False, ie_key=info.get('ie_key')
+            )
+        return info
+
+    @staticmethod
+    def _make_video_info(index: int, entry: Optional[dict]) -> PlaylistVideoInfo:
+        """Build a PlaylistVideoInfo from a yt-dlp entry.
+
+        Args:
+            index: Position in playlist (1-based)
+            entry: Entry dictionary from yt-dlp (None if unavailable)
+
+        Returns:
+            PlaylistVideoInfo for the entry
+        """
+        if entry is None:
+            # Private or unavailable video
+            return PlaylistVideoInfo(
+                index=index,
+                video_id="",
+                url="",
+                title="[Unavailable Video]",
+                is_available=False
+            )
+
+        video_id = entry.get('id', '')
+        return PlaylistVideoInfo(
+            index=index,
+            video_id=video_id,
+            url=entry.get('url', f"https://www.youtube.com/watch?v={video_id}"),
+            title=entry.get('title', 'Unknown'),
+            duration=entry.get('duration', 0) or 0,
+            upload_date=entry.get('upload_date', ''),
+            uploader=entry.get('uploader', entry.get('channel', '')),
+            view_count=entry.get('view_count', 0) or 0,
+            thumbnail=entry.get('thumbnail', ''),
+            is_available=True
+        )
+
+    def hydrate_videos(
+        self,
+        videos: List[PlaylistVideoInfo],
+        max_workers: int = 8
+    ) -> List[PlaylistVideoInfo]:
+        """Fetch full metadata for videos from a flat playlist listing.
+
+        Flat listings often lack duration, upload date and view count.
+        Each available video is looked up individually; the lookups run
+        in parallel, each worker using its own YoutubeDL.
+
+        Args:
+            videos: Videos to hydrate
+            max_workers: Maximum parallel lookups
+
+        Returns:
+            New list in the same order, with hydrated entries replaced
+        """
+        targets = [i for i, v in enumerate(videos) if v.is_available and v.url]
+        if not targets:
+            return list(videos)
+
+        import yt_dlp
+
+        idle = SimpleQueue()
+        instances = []
+        instances_lock = threading.Lock()
+
+        def hydrate(i: int) -> Optional[PlaylistVideoInfo]:
+            try:
+                ydl = idle.get_nowait()
+            except Empty:
+                ydl = yt_dlp.YoutubeDL(dict(self.HYDRATE_OPTS))
+                with instances_lock:
+                    instances.append(ydl)
+            try:
+                video = videos[i]
+                info = ydl.extract_info(video.url, download=False, process=False)
+                if not info:
+                    return None
+                hydrated = self._make_video_info(video.index, info)
+                hydrated.url = video.url
+                return hydrated
+            except Exception:
+                return None
+            finally:
+                idle.put(ydl)
+
+        try:
+            if len(targets) < self.HYDRATE_MIN_PARALLEL or max_workers <= 1:
+                results = [hydrate(i) for i in targets]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(targets)),
+                    thread_name_prefix="playlist-hydrate"
+                ) as executor:
+                    results = list(executor.map(hydrate, targets))
+        finally:
+            for ydl in instances:
+                try:
+                    ydl.close()
+                except Exception:
+                    pass
+
+        hydrated_videos = list(videos)
+        for i, result in zip(targets, results):
+            if result is not None:
+                hydrated_videos[i] = result
+        return hydrated_videos
+
     def filter_by_duration(
         self,
         videos: List[PlaylistVideoInfo],
@@ -260,20 +532,12 @@ class PlaylistFilter:
         Returns:
             Filtered list of videos
         """
-        filtered = []
-
-        for video in videos:
-            if not video.is_available:
-                continue
-
-            if min_seconds > 0 and video.duration < min_seconds:
-                continue
-            if max_seconds > 0 and video.duration > max_seconds:
-                continue
-
-            filtered.append(video)
-
-        return filtered
+        # Durations are never negative, so an unset minimum needs no check
+        upper = max_seconds if max_seconds > 0 else float('inf')
+        return [
+            video for video in videos
+            if video.is_available and min_seconds <= video.duration <= upper
+        ]
 
     def filter_by_date(
         self,
@@ -291,25 +555,16 @@ class PlaylistFilter:
         Returns:
             Filtered list of videos
         """
-        filtered = []
-
-        for video in videos:
-            if not video.is_available:
-                continue
-
-            if not video.upload_date:
-                # Include videos with unknown date
-                filtered.append(video)
-                continue
-
-            if after and video.upload_date < after:
-                continue
-            if before and video.upload_date > before:
-                continue
-
-            filtered.append(video)
-
-        return filtered
+        # Videos with an unknown date are always included
+        return [
+            video for video in videos
+            if video.is_available and (
+                not video.upload_date or (
+                    (not after or video.upload_date >= after)
+                    and (not before or video.upload_date <= before)
+                )
+            )
+        ]
 
     def filter_by_index(
         self,
@@ -320,24 +575,17 @@ class PlaylistFilter:
         """Filter videos by playlist index.
 
         Args:
-            videos: List of videos to filter
+            videos: List of videos to filter, in playlist order (gaps allowed)
             start: Start index (1-based, default 1)
             end: End index (0 = no limit)
 
         Returns:
             Filtered list of videos
         """
-        filtered = []
-
-        for video in videos:
-            if video.index < start:
-                continue
-            if end > 0 and video.index > end:
-                continue
-
-            filtered.append(video)
-
-        return filtered
+        # Indices ascend, so the range is one slice found by binary search
+        lo = bisect_left(videos, start, key=_video_index)
+        hi = bisect_right(videos, end, key=_video_index) if end > 0 else len(videos)
+        return videos[lo:hi]
 
     def search_by_title(
         self,
@@ -358,14 +606,71 @@ class PlaylistFilter:
         if not query:
             return videos
 
-        if not case_sensitive:
-            query = query.lower()
+        if case_sensitive:
+            return [video for video in videos if query in video.title]
+
+        # Titles are folded once per video, at construction
+        query = query.casefold()
+        return [video for video in videos if query in video._title_folded]
+
+    def filter(
+        self,
+        videos: List[PlaylistVideoInfo],
+        *,
+        min_seconds: int = 0,
+        max_seconds: int = 0,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        start: int = 1,
+        end: int = 0,
+        query: Optional[str] = None,
+        case_sensitive: bool = False
+    ) -> List[PlaylistVideoInfo]:
+        """Apply several filters in a single pass.
+
+        Equivalent to chaining filter_by_index, filter_by_duration,
+        filter_by_date and search_by_title, skipping any whose arguments
+        are left at their defaults, without building intermediate lists.
+        As with the individual filters, unavailable videos are dropped
+        whenever a duration or date bound is set.
+
+        Args:
+            videos: List of videos to filter, in playlist order
+            min_seconds: Minimum duration (0 = no minimum)
+            max_seconds: Maximum duration (0 = no maximum)
+            after: Only include videos after this date (YYYYMMDD)
+            before: Only include videos before this date (YYYYMMDD)
+            start: Start index (1-based, default 1)
+            end: End index (0 = no limit)
+            query: Title search query (None or empty = no search)
+            case_sensitive: Whether the title search is case-sensitive
+
+        Returns:
+            Filtered list of videos
+        """
+        if start > 1 or end > 0:
+            videos = self.filter_by_index(videos, start, end)
+
+        available_only = min_seconds > 0 or max_seconds > 0 or bool(after) or bool(before)
+        upper = max_seconds if max_seconds > 0 else float('inf')
+        if query and not case_sensitive:
+            query = query.casefold()
 
         filtered = []
         for video in videos:
-            title = video.title if case_sensitive else video.title.lower()
-            if query in title:
-                filtered.append(video)
+            if available_only and not video.is_available:
+                continue
+            if not min_seconds <= video.duration <= upper:
+                continue
+
+            date = video.upload_date
+            if date and ((after and date < after) or (before and date > before)):
+                continue
+
+            if query and query not in (video.title if case_sensitive else video._title_folded):
+                continue
+
+            filtered.append(video)
 
         return filtered
 
@@ -388,22 +693,38 @@ class PlaylistFilter:
         url: str,
         on_complete: Callable[[PlaylistInfo], None],
         on_progress: Optional[Callable[[str], None]] = None
-    ) -> threading.Thread:
+    ) -> FetchHandle:
         """Get playlist info asynchronously.
 
         Args:
             url: YouTube playlist URL
-            on_complete: Callback when fetch completes
+            on_complete: Callback when fetch completes (not called if cancelled)
             on_progress: Optional progress callback
 
         Returns:
-            Thread running the fetch
+            FetchHandle for waiting on or cancelling the fetch
         """
+        handle = FetchHandle()
+        count = 0
+
+        def on_video(video: PlaylistVideoInfo):
+            nonlocal count
+            count += 1
+            if count % self.PROGRESS_EVERY == 0:
+                on_progress(f"Fetched {count} videos...")
+
         def fetch_task():
+            if handle.cancelled:
+                return
+
             if on_progress:
                 on_progress("Fetching playlist information...")
 
-            result = self.get_playlist_info(url)
+            result = self.get_playlist_info(
+                url, on_video if on_progress else None, handle.event
+            )
+            if handle.cancelled:
+                return
 
             if on_progress:
                 if result.error:
@@ -413,6 +734,5 @@ class PlaylistFilter:
 
             on_complete(result)
 
-        thread = threading.Thread(target=fetch_task, daemon=True)
-        thread.start()
-        return thread
+        handle.future = self._executor.submit(fetch_task)
+        return handle
@@ -8,14 +8,135 @@ This module provides post-processing options using FFmpeg:
 - Metadata addition
 """
 
+import glob
+import json
 import os
 import shutil
-from typing import Optional, List, Dict, Any
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from src.utils.cache import CacheManager
 
-class AudioFormat(Enum):
+
+# subprocess.run arguments for the FFmpeg/FFprobe queries. Only stdout
+# is read; skipping the stdin/stderr pipes and (on POSIX, where fds are
+# non-inheritable by default) the close_fds walk lets CPython start the
+# child with posix_spawn instead of fork+exec.
+_RUN_KWARGS = {
+    'stdin': subprocess.DEVNULL,
+    'stdout': subprocess.PIPE,
+    'stderr': subprocess.DEVNULL,
+    'close_fds': os.name != 'posix',
+}
+
+
+@lru_cache(maxsize=1)
+def _which_ffmpeg() -> Optional[str]:
+    """Memoized PATH lookup for FFmpeg."""
+    return shutil.which('ffmpeg')
+
+
+@lru_cache(maxsize=1)
+def _which_ffprobe() -> Optional[str]:
+    """Memoized PATH lookup for FFprobe."""
+    return shutil.which('ffprobe')
+
+
+@lru_cache(maxsize=8)
+def _ffmpeg_version(ffmpeg_path: str) -> Optional[str]:
+    """Run `ffmpeg -version` once per executable.
+
+    Args:
+        ffmpeg_path: Path to FFmpeg executable
+
+    Returns:
+        First line of the version output or None
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, '-version'],
+            **_RUN_KWARGS,
+            timeout=5
+        )
+        if result.returncode == 0:
+            # Parse first line for version (only that line is decoded)
+            return result.stdout.partition(b'\n')[0].decode('utf-8', 'replace').rstrip('\r')
+        return None
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _ffmpeg_hwaccels(ffmpeg_path: str) -> Tuple[str, ...]:
+    """Run `ffmpeg -hwaccels` once per executable.
+
+    Args:
+        ffmpeg_path: Path to FFmpeg executable
+
+    Returns:
+        Names of the hardware acceleration methods FFmpeg was built with
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, '-hide_banner', '-hwaccels'],
+            **_RUN_KWARGS,
+            text=True,
+            timeout=5
+        )
+        if result.returncode != 0:
+            return ()
+        # First line is the "Hardware acceleration methods:" header
+        return tuple(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+    except Exception:
+        return ()
+
+
+@lru_cache(maxsize=16)
+def _ffmpeg_test_encode(ffmpeg_path: str, input_args: Tuple[str, ...],
+                        output_args: Tuple[str, ...]) -> bool:
+    """Encode one blank frame once per executable and argument set.
+
+    `ffmpeg -hwaccels` lists the methods FFmpeg was built with, not the
+    hardware that is present, so an encoder is only used after this
+    succeeds on it.
+
+    Args:
+        ffmpeg_path: Path to FFmpeg executable
+        input_args: Device arguments placed before the input
+        output_args: Encoder arguments
+
+    Returns:
+        True if the encode succeeded
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, '-hide_banner', '-v', 'error', *input_args,
+             '-f', 'lavfi', '-i', 'nullsrc=s=256x256', '-frames:v', '1',
+             *output_args, '-f', 'null', '-'],
+            **_RUN_KWARGS,
+            timeout=10
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+class _StrEnum(str, Enum):
+    """Enum whose members are their own string values.
+
+    Members can be passed anywhere a plain string is expected and compare
+    equal to it.
+    """
+
+    def __str__(self) -> str:
+        return str.__str__(self)
+
+
+class AudioFormat(_StrEnum):
     """Supported audio extraction formats."""
     MP3 = "mp3"
     M4A = "m4a"
@@ -26,7 +147,7 @@ class AudioFormat(Enum):
     VORBIS = "vorbis"
 
 
-class VideoFormat(Enum):
+class VideoFormat(_StrEnum):
     """Supported video conversion formats."""
     MP4 = "mp4"
     MKV = "mkv"
@@ -36,7 +157,7 @@ class VideoFormat(Enum):
     FLV = "flv"
 
 
-class AudioQuality(Enum):
+class AudioQuality(_StrEnum):
     """Audio quality presets (kbps)."""
     LOW = "96"
     MEDIUM = "128"
@@ -46,7 +167,7 @@ class AudioQuality(Enum):
     BEST = "0"  # Best available
 
 
-@dataclass
+@dataclass(slots=True)
 class PostProcessingOptions:
     """Post-processing configuration options.
 
@@ -64,6 +185,9 @@ class PostProcessingOptions:
         normalize_audio: Normalize audio levels
         sponsorblock_remove: Remove sponsor segments
         sponsorblock_mark: Mark sponsor segments as chapters
+        hwaccel: Hardware encoder for conversions ("auto", "none",
+            "cuda", "vaapi" or "qsv"); only used once a test encode on
+            it succeeds
     """
     embed_subtitles: bool = False
     embed_thumbnail: bool = False
@@ -78,6 +202,7 @@ class PostProcessingOptions:
     normalize_audio: bool = False
     sponsorblock_remove: List[str] = field(default_factory=list)
     sponsorblock_mark: List[str] = field(default_factory=list)
+    hwaccel: str = "auto"
 
 
 class PostProcessor:
@@ -107,6 +232,102 @@ class PostProcessor:
             postprocessors = processor.get_ydl_postprocessors(options)
     """
 
+    # Choices for the option dropdowns, built once
+    _AUDIO_FORMATS = tuple(AudioFormat)
+    _VIDEO_FORMATS = tuple(VideoFormat)
+    _AUDIO_QUALITIES = (
+        ("Low (96 kbps)", "96"),
+        ("Medium (128 kbps)", "128"),
+        ("High (192 kbps)", "192"),
+        ("Very High (256 kbps)", "256"),
+        ("Maximum (320 kbps)", "320"),
+        ("Best Available", "0"),
+    )
+    _SPONSORBLOCK_CATEGORIES = (
+        ("Sponsor", "sponsor"),
+        ("Intro", "intro"),
+        ("Outro", "outro"),
+        ("Self Promotion", "selfpromo"),
+        ("Preview", "preview"),
+        ("Filler", "filler"),
+        ("Interaction Reminder", "interaction"),
+        ("Music (Non-Music)", "music_offtopic"),
+    )
+
+    # yt-dlp postprocessor entries. get_ydl_postprocessors copies these
+    # and fills in the option-dependent fields from _PP_RULES.
+    _EMBED_SUBTITLE_PP = {'key': 'FFmpegEmbedSubtitle', 'already_have_subtitle': False}
+    _EMBED_THUMBNAIL_PP = {'key': 'EmbedThumbnail', 'already_have_thumbnail': False}
+    _METADATA_PP = {'key': 'FFmpegMetadata', 'add_chapters': True, 'add_metadata': True}
+    _EXTRACT_AUDIO_PP = {'key': 'FFmpegExtractAudio', 'nopostoverwrites': False}
+    _CONVERT_PP = {'key': 'FFmpegVideoConvertor'}
+    _REMUX_PP = {'key': 'FFmpegVideoRemuxer'}
+    _SPONSORBLOCK_PP = {'key': 'SponsorBlock', 'when': 'after_filter'}
+    _SPONSORBLOCK_REMOVE_PP = {'key': 'ModifyChapters', 'force_keyframes': False}
+    _SPONSORBLOCK_MARK_PP = {
+        'key': 'ModifyChapters',
+        'sponsorblock_chapter_title': '[SponsorBlock]: %(category_names)l',
+        'force_keyframes': False,
+    }
+
+    # (applies, template, option-dependent fields) for each postprocessor,
+    # in the order yt-dlp should run them
+    _PP_RULES = (
+        (lambda o: o.embed_subtitles, _EMBED_SUBTITLE_PP, None),
+        (lambda o: o.embed_thumbnail, _EMBED_THUMBNAIL_PP, None),
+        (lambda o: o.add_metadata, _METADATA_PP, None),
+        (lambda o: o.extract_audio, _EXTRACT_AUDIO_PP,
+         lambda o: {'preferredcodec': o.audio_format, 'preferredquality': o.audio_quality}),
+        # Conversion and remux only apply to video output, and at most one runs
+        (lambda o: o.convert_to and not o.extract_audio, _CONVERT_PP,
+         lambda o: {'preferedformat': o.convert_to}),
+        (lambda o: o.remux_video and not o.extract_audio and not o.convert_to, _REMUX_PP,
+         lambda o: {'preferedformat': o.remux_video}),
+        # SponsorBlock - remove segments
+        (lambda o: o.sponsorblock_remove, _SPONSORBLOCK_PP,
+         lambda o: {'categories': o.sponsorblock_remove}),
+        (lambda o: o.sponsorblock_remove, _SPONSORBLOCK_REMOVE_PP,
+         lambda o: {'remove_sponsor_segments': o.sponsorblock_remove}),
+        # SponsorBlock - mark as chapters (removal takes precedence)
+        (lambda o: o.sponsorblock_mark and not o.sponsorblock_remove, _SPONSORBLOCK_PP,
+         lambda o: {'categories': o.sponsorblock_mark}),
+        (lambda o: o.sponsorblock_mark and not o.sponsorblock_remove, _SPONSORBLOCK_MARK_PP, None),
+    )
+
+    # Default options only add metadata; get_ydl_postprocessors returns
+    # copies of these without walking _PP_RULES
+    _DEFAULT_OPTIONS = PostProcessingOptions()
+    _DEFAULT_PP = (_METADATA_PP,)
+
+    # Hardware acceleration methods in order of preference, with the
+    # FFmpeg input/output args for an H.264 conversion on each. The
+    # -hwaccel_output_format input args keep decoded frames in GPU memory
+    # so they go straight to the encoder without a copy through the CPU.
+    _HWACCEL_PRIORITY = ('cuda', 'vaapi', 'qsv')
+    _HWACCEL_ARGS = {
+        'cuda': (
+            ('-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'),
+            ('-c:v', 'h264_nvenc', '-preset', 'p4'),
+        ),
+        'vaapi': (
+            ('-hwaccel', 'vaapi', '-hwaccel_output_format', 'vaapi'),
+            # Uploads frames that fell back to software decoding
+            ('-vf', 'format=nv12|vaapi,hwupload', '-c:v', 'h264_vaapi'),
+        ),
+        'qsv': (
+            ('-hwaccel', 'qsv', '-hwaccel_output_format', 'qsv'),
+            ('-c:v', 'h264_qsv'),
+        ),
+    }
+    # DRM render nodes tried for VAAPI, in order
+    _VAAPI_DEVICE_GLOB = '/dev/dri/renderD*'
+    # Conversion targets that take H.264 video (AVI is encoded with
+    # Xvid and WebM with VP9 by yt-dlp, so those stay on the CPU)
+    _H264_TARGETS = frozenset(('mp4', 'mkv', 'mov', 'flv'))
+
+    # Encoder threads for the conversion pass
+    CONVERT_THREADS = os.cpu_count() or 1
+
     def __init__(self, ffmpeg_path: Optional[str] = None):
         """Initialize post-processor.
 
@@ -114,6 +335,7 @@ class PostProcessor:
             ffmpeg_path: Custom path to FFmpeg executable
         """
         self.ffmpeg_path = ffmpeg_path or self._find_ffmpeg()
+        self.ffmpeg_dir = os.path.dirname(self.ffmpeg_path) if self.ffmpeg_path else None
         self.ffprobe_path = self._find_ffprobe()
 
     def _find_ffmpeg(self) -> Optional[str]:
@@ -122,7 +344,7 @@ class PostProcessor:
         Returns:
             Path to FFmpeg or None
         """
-        return shutil.which('ffmpeg')
+        return _which_ffmpeg()
 
     def _find_ffprobe(self) -> Optional[str]:
         """Find FFprobe in system PATH.
@@ -130,7 +352,19 @@ class PostProcessor:
         Returns:
             Path to FFprobe or None
         """
-        return shutil.which('ffprobe')
+        return _which_ffprobe()
+
+    @staticmethod
+    def invalidate_path_cache():
+        """Forget the FFmpeg/FFprobe locations found on PATH (and versions).
+
+        Call after installing FFmpeg or changing PATH at runtime.
+        """
+        _which_ffmpeg.cache_clear()
+        _which_ffprobe.cache_clear()
+        _ffmpeg_version.cache_clear()
+        _ffmpeg_hwaccels.cache_clear()
+        _ffmpeg_test_encode.cache_clear()
 
     def is_ffmpeg_available(self) -> bool:
         """Check if FFmpeg is available.
@@ -149,22 +383,91 @@ class PostProcessor:
         if not self.ffmpeg_path:
             return None
 
-        try:
-            import subprocess
-            result = subprocess.run(
-                [self.ffmpeg_path, '-version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                # Parse first line for version
-                first_line = result.stdout.split('\n')[0]
-                return first_line
+        return _ffmpeg_version(self.ffmpeg_path)
+
+    def _detect_hwaccel(self) -> List[str]:
+        """Get the hardware acceleration methods FFmpeg was built with.
+
+        Returns:
+            Compiled-in methods in order of preference
+        """
+        if not self.ffmpeg_path:
+            return []
+
+        available = _ffmpeg_hwaccels(self.ffmpeg_path)
+        return [name for name in self._HWACCEL_PRIORITY if name in available]
+
+    def _get_hwaccel_device_args(self, method: str) -> Optional[Tuple[str, ...]]:
+        """Find device arguments under which a method's encoder works.
+
+        Args:
+            method: Hardware acceleration method
+
+        Returns:
+            Input args selecting the device (empty if the method picks its
+            own), or None if no test encode succeeded
+        """
+        if method == 'vaapi':
+            candidates = [('-vaapi_device', node)
+                          for node in sorted(glob.glob(self._VAAPI_DEVICE_GLOB))]
+        else:
+            candidates = [()]
+
+        output_args = self._HWACCEL_ARGS[method][1]
+        for device_args in candidates:
+            if _ffmpeg_test_encode(self.ffmpeg_path, device_args, output_args):
+                return device_args
+        return None
+
+    def _get_hwaccel_args(self, options: PostProcessingOptions) -> Optional[Dict[str, List[str]]]:
+        """Get postprocessor_args that move a conversion onto the GPU.
+
+        Args:
+            options: Post-processing options
+
+        Returns:
+            yt-dlp postprocessor_args entries or None to encode on the CPU
+        """
+        if (options.hwaccel == "none" or options.extract_audio
+                or options.convert_to not in self._H264_TARGETS):
             return None
-        except Exception:
+
+        available = self._detect_hwaccel()
+        if options.hwaccel != "auto":
+            available = [options.hwaccel] if options.hwaccel in available else []
+
+        for method in available:
+            device_args = self._get_hwaccel_device_args(method)
+            if device_args is not None:
+                input_args, output_args = self._HWACCEL_ARGS[method]
+                return {
+                    'videoconvertor+ffmpeg_i': [*input_args, *device_args],
+                    'videoconvertor+ffmpeg_o': list(output_args),
+                }
+        return None
+
+    def _get_convert_args(self, options: PostProcessingOptions) -> Optional[Dict[str, List[str]]]:
+        """Get postprocessor_args for the VideoConvertor pass.
+
+        Args:
+            options: Post-processing options
+
+        Returns:
+            yt-dlp postprocessor_args entries or None if nothing is converted
+        """
+        if not options.convert_to or options.extract_audio:
             return None
 
+        args = self._get_hwaccel_args(options)
+        if args is None:
+            args = {'videoconvertor+ffmpeg_o': []}
+            if options.convert_to in self._H264_TARGETS:
+                # libx264 defaults to "medium"
+                args['videoconvertor+ffmpeg_o'] += ['-preset', 'veryfast']
+
+        args['videoconvertor+ffmpeg_o'][:0] = ['-threads', str(self.CONVERT_THREADS)]
+        return args
+
     def get_ydl_postprocessors(self, options: PostProcessingOptions) -> List[Dict[str, Any]]:
         """Get yt-dlp postprocessor configuration.
 
@@ -174,79 +477,13 @@ class PostProcessor:
         Returns:
             List of postprocessor dictionaries for yt-dlp
         """
-        postprocessors = []
-
-        # Embed subtitles
-        if options.embed_subtitles:
-            postprocessors.append({
-                'key': 'FFmpegEmbedSubtitle',
-                'already_have_subtitle': False,
-            })
-
-        # Embed thumbnail
-        if options.embed_thumbnail:
-            postprocessors.append({
-                'key': 'EmbedThumbnail',
-                'already_have_thumbnail': False,
-            })
-
-        # Add metadata
-        if options.add_metadata:
-            postprocessors.append({
-                'key': 'FFmpegMetadata',
-                'add_chapters': True,
-                'add_metadata': True,
-            })
-
-        # Extract audio
-        if options.extract_audio:
-            postprocessors.append({
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': options.audio_format,
-                'preferredquality': options.audio_quality,
-                'nopostoverwrites': False,
-            })
-
-        # Convert video format
-        if options.convert_to and not options.extract_audio:
-            postprocessors.append({
-                'key': 'FFmpegVideoConvertor',
-                'preferedformat': options.convert_to,
-            })
-
-        # Remux video
-        if options.remux_video and not options.extract_audio and not options.convert_to:
-            postprocessors.append({
-                'key': 'FFmpegVideoRemuxer',
-                'preferedformat': options.remux_video,
-            })
-
-        # SponsorBlock - remove segments
-        if options.sponsorblock_remove:
-            postprocessors.append({
-                'key': 'SponsorBlock',
-                'categories': options.sponsorblock_remove,
-                'when': 'after_filter',
-            })
-            postprocessors.append({
-                'key': 'ModifyChapters',
-                'remove_sponsor_segments': options.sponsorblock_remove,
-                'force_keyframes': False,
-            })
-
-        # SponsorBlock - mark as chapters
-        if options.sponsorblock_mark and not options.sponsorblock_remove:
-            postprocessors.append({
-                'key': 'SponsorBlock',
-                'categories': options.sponsorblock_mark,
-                'when': 'after_filter',
-            })
-            postprocessors.append({
-                'key': 'ModifyChapters',
-                'sponsorblock_chapter_title': '[SponsorBlock]: %(category_names)l',
-                'force_keyframes': False,
-            })
+        if options is self._DEFAULT_OPTIONS or options == self._DEFAULT_OPTIONS:
+            return [dict(pp) for pp in self._DEFAULT_PP]
 
+        postprocessors = []
+        for applies, template, fields in self._PP_RULES:
+            if applies(options):
+                postprocessors.append(dict(template, **fields(options)) if fields else dict(template))
         return postprocessors
 
     def get_ydl_opts(self, options: PostProcessingOptions) -> Dict[str, Any]:
@@ -264,7 +501,7 @@ class PostProcessor:
 
         # Set FFmpeg location if custom
         if self.ffmpeg_path:
-            opts['ffmpeg_location'] = os.path.dirname(self.ffmpeg_path)
+            opts['ffmpeg_location'] = self.ffmpeg_dir
 
         # Keep video when extracting audio
         if options.extract_audio and options.keep_original:
@@ -283,6 +520,11 @@ class PostProcessor:
         if options.merge_output_format:
             opts['merge_output_format'] = options.merge_output_format
 
+        # Encoder settings for conversions
+        convert_args = self._get_convert_args(options)
+        if convert_args:
+            opts['postprocessor_args'] = convert_args
+
         return opts
 
     @staticmethod
@@ -292,7 +534,7 @@ class PostProcessor:
         Returns:
             List of format names
         """
-        return [f.value for f in AudioFormat]
+        return list(PostProcessor._AUDIO_FORMATS)
 
     @staticmethod
     def get_video_formats() -> List[str]:
@@ -301,7 +543,7 @@ class PostProcessor:
         Returns:
             List of format names
         """
-        return [f.value for f in VideoFormat]
+        return list(PostProcessor._VIDEO_FORMATS)
 
     @staticmethod
     def get_audio_qualities() -> List[tuple]:
@@ -310,14 +552,7 @@ class PostProcessor:
         Returns:
             List of (label, value) tuples
         """
-        return [
-            ("Low (96 kbps)", "96"),
-            ("Medium (128 kbps)", "128"),
-            ("High (192 kbps)", "192"),
-            ("Very High (256 kbps)", "256"),
-            ("Maximum (320 kbps)", "320"),
-            ("Best Available", "0"),
-        ]
+        return list(PostProcessor._AUDIO_QUALITIES)
 
     @staticmethod
     def get_sponsorblock_categories() -> List[tuple]:
@@ -326,21 +561,42 @@ class PostProcessor:
         Returns:
             List of (label, value) tuples
         """
-        return [
-            ("Sponsor", "sponsor"),
-            ("Intro", "intro"),
-            ("Outro", "outro"),
-            ("Self Promotion", "selfpromo"),
-            ("Preview", "preview"),
-            ("Filler", "filler"),
-            ("Interaction Reminder", "interaction"),
-            ("Music (Non-Music)", "music_offtopic"),
-        ]
+        return list(PostProcessor._SPONSORBLOCK_CATEGORIES)
 
 
 class FFmpegHelper:
     """Helper utilities for FFmpeg operations."""
 
+    # Worker threads for probe_many (threads are only started on first use)
+    PROBE_WORKERS = min(8, os.cpu_count() or 1)
+    _pool = ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="ffprobe")
+
+    # Successful probes keyed by (path, mtime_ns, size[, query]), so a file
+    # that changes on disk is probed again
+    _probe_cache: CacheManager = CacheManager(max_size=256)
+
+    @staticmethod
+    def _probe_key(file_path: str, *query: str) -> Optional[tuple]:
+        """Build the probe cache key for a local file.
+
+        Args:
+            file_path: Path to media file
+            *query: Extra key parts identifying a narrow query
+
+        Returns:
+            Cache key, or None if the file cannot be stat'ed (e.g. a URL)
+        """
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
+            return None
+        return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, *query)
+
+    @staticmethod
+    def clear_probe_cache():
+        """Forget all cached probe results."""
+        FFmpegHelper._probe_cache.clear()
+
     @staticmethod
     def get_media_info(file_path: str) -> Optional[Dict[str, Any]]:
         """Get media file information using FFprobe.
@@ -349,16 +605,20 @@ class FFmpegHelper:
             file_path: Path to media file
 
         Returns:
-            Dictionary with media info or None
+            Dictionary with media info or None (cached results are shared,
+            so copy before modifying)
         """
-        ffprobe = shutil.which('ffprobe')
+        ffprobe = _which_ffprobe()
         if not ffprobe:
             return None
 
-        try:
-            import subprocess
-            import json
+        key = FFmpegHelper._probe_key(file_path)
+        if key is not None:
+            cached = FFmpegHelper._probe_cache.get(key)
+            if cached is not None:
+                return cached
 
+        try:
             result = subprocess.run([
                 ffprobe,
                 '-v', 'quiet',
@@ -366,10 +626,64 @@ class FFmpegHelper:
                 '-show_format',
                 '-show_streams',
                 file_path
-            ], capture_output=True, text=True, timeout=30)
+            ], **_RUN_KWARGS, timeout=30)
+
+            if result.returncode == 0:
+                # json.loads decodes the UTF-8 bytes itself
+                info = json.loads(result.stdout)
+                if key is not None:
+                    FFmpegHelper._probe_cache.set(key, info)
+                return info
+            return None
+        except Exception:
+            return None
+
+    @staticmethod
+    def probe_many(file_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get media information for several files in parallel.
+
+        Args:
+            file_paths: Paths to media files
+
+        Returns:
+            Media info (or None) for each path, in input order
+        """
+        if len(file_paths) < 2:
+            return [FFmpegHelper.get_media_info(path) for path in file_paths]
+        return list(FFmpegHelper._pool.map(FFmpegHelper.get_media_info, file_paths))
+
+    @staticmethod
+    def _run_ffprobe(file_path: str, args: List[str]) -> Optional[str]:
+        """Run FFprobe with the given query arguments.
+
+        Args:
+            file_path: Path to media file
+            args: FFprobe arguments selecting what to print
+
+        Returns:
+            Stripped stdout or None on failure
+        """
+        ffprobe = _which_ffprobe()
+        if not ffprobe:
+            return None
+
+        key = FFmpegHelper._probe_key(file_path, *args)
+        if key is not None:
+            cached = FFmpegHelper._probe_cache.get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            result = subprocess.run(
+                [ffprobe, '-v', 'error', *args, file_path],
+                **_RUN_KWARGS, text=True, timeout=30
+            )
 
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                output = result.stdout.strip()
+                if key is not None:
+                    FFmpegHelper._probe_cache.set(key, output)
+                return output
             return None
         except Exception:
             return None
@@ -378,36 +692,53 @@ class FFmpegHelper:
     def get_duration(file_path: str) -> Optional[float]:
         """Get media file duration in seconds.
 
+        Only the container duration is requested, so no JSON is produced
+        or parsed.
+
         Args:
             file_path: Path to media file
 
         Returns:
             Duration in seconds or None
         """
-        info = FFmpegHelper.get_media_info(file_path)
-        if info and 'format' in info:
-            try:
-                return float(info['format'].get('duration', 0))
-            except (ValueError, TypeError):
-                pass
-        return None
+        output = FFmpegHelper._run_ffprobe(file_path, [
+            '-show_entries', 'format=duration',
+            '-of', 'csv=p=0',
+        ])
+        if output is None:
+            return None
+        if not output or output == 'N/A':
+            # Unknown duration (the JSON probe reported 0 here too)
+            return 0.0
+        try:
+            return float(output)
+        except ValueError:
+            return None
 
     @staticmethod
     def get_video_resolution(file_path: str) -> Optional[tuple]:
         """Get video resolution.
 
+        Only the size of the first video stream is requested.
+
         Args:
             file_path: Path to video file
 
         Returns:
             Tuple of (width, height) or None
         """
-        info = FFmpegHelper.get_media_info(file_path)
-        if info and 'streams' in info:
-            for stream in info['streams']:
-                if stream.get('codec_type') == 'video':
-                    width = stream.get('width')
-                    height = stream.get('height')
-                    if width and height:
-                        return (width, height)
+        output = FFmpegHelper._run_ffprobe(file_path, [
+            '-select_streams', 'v:0',
+            '-show_entries', 'stream=width,height',
+            '-of', 'csv=s=x:p=0',
+        ])
+        if not output:
+            return None
+        try:
+            # Files with several programs repeat the stream on more lines
+            width, height = map(int, output.partition('\n')[0].split('x')[:2])
+        except ValueError:
+            return None
+        if width and height:
+            return (width, height)
         return None
@@ -4,13 +4,17 @@ This module provides a thread-safe queue system for managing video downloads,
 including adding, removing, reordering, and status tracking of videos.
 """
 
+import itertools
+import math
+import os
 import threading
-import uuid
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import List, Optional, Callable, Iterator, Dict, Any
+from typing import List, Optional, Callable, Iterator, Dict, Any, Set
 from collections import OrderedDict
+from itertools import islice
 
 
 class VideoStatus(Enum):
@@ -27,30 +31,65 @@ class VideoStatus(Enum):
 
     def is_active(self) -> bool:
         """Check if this status represents an active download."""
-        return self in (
-            VideoStatus.EXTRACTING,
-            VideoStatus.DOWNLOADING,
-            VideoStatus.POST_PROCESSING
-        )
+        return self in _ACTIVE_STATUSES
 
     def is_final(self) -> bool:
         """Check if this status represents a final state."""
-        return self in (
-            VideoStatus.COMPLETED,
-            VideoStatus.ERROR,
-            VideoStatus.CANCELLED
-        )
+        return self in _FINAL_STATUSES
 
     def can_start(self) -> bool:
         """Check if download can be started from this status."""
-        return self in (
-            VideoStatus.QUEUED,
-            VideoStatus.WAITING,
-            VideoStatus.PAUSED
-        )
+        return self in _STARTABLE_STATUSES
+
+
+# Status groups for the VideoStatus predicates (built once, not per call)
+_ACTIVE_STATUSES = frozenset((
+    VideoStatus.EXTRACTING,
+    VideoStatus.DOWNLOADING,
+    VideoStatus.POST_PROCESSING,
+))
+_FINAL_STATUSES = frozenset((
+    VideoStatus.COMPLETED,
+    VideoStatus.ERROR,
+    VideoStatus.CANCELLED,
+))
+_STARTABLE_STATUSES = frozenset((
+    VideoStatus.QUEUED,
+    VideoStatus.WAITING,
+    VideoStatus.PAUSED,
+))
+
+
+# Queue item IDs: a random per-process prefix plus a counter, so IDs are
+# unique within the process and unlikely to clash with restored items
+_ID_PREFIX = os.urandom(2).hex()
+_ID_COUNTER = itertools.count()
+
+# 1024-based display units, indexed by _unit_index()
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s', 'TB/s')
+_UNIT_DIVISORS = tuple(1024.0 ** i for i in range(5))
+
+
+def _unit_index(value: float) -> int:
+    """Get the display unit index for a value of at least 1024.
+
+    Reads the binary exponent instead of dividing by 1024 in a loop.
+    """
+    return min(4, (math.frexp(value)[1] - 1) // 10)
+
+
+def _ts_to_datetime(ts: Optional[float]) -> Optional[datetime]:
+    """Convert an optional epoch time to a local datetime."""
+    return datetime.fromtimestamp(ts) if ts else None
+
 
+def _ts_to_iso(ts: Optional[float]) -> Optional[str]:
+    """Format an optional epoch time as a local ISO 8601 string."""
+    return datetime.fromtimestamp(ts).isoformat() if ts else None
 
-@dataclass
+
+@dataclass(slots=True)
 class VideoItem:
     """Represents a video item in the download queue.
 
@@ -70,13 +109,13 @@ class VideoItem:
         playlist_title: Title of parent playlist (if any)
         playlist_index: Index in playlist (if any)
         output_path: Final output file path
-        created_at: Timestamp when added to queue
-        started_at: Timestamp when download started
-        completed_at: Timestamp when download completed
+        created_ts: Epoch time when added to queue
+        started_ts: Epoch time when download started
+        completed_ts: Epoch time when download completed
         metadata: Additional metadata from extraction
     """
     url: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: f"{_ID_PREFIX}{next(_ID_COUNTER):04x}")
     title: str = "Extracting..."
     duration: int = 0
     filesize: int = 0
@@ -91,11 +130,16 @@ class VideoItem:
     playlist_title: Optional[str] = None
     playlist_index: Optional[int] = None
     output_path: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_ts: float = field(default_factory=time.time)
+    started_ts: Optional[float] = None
+    completed_ts: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # When and at what progress on_item_updated last reported this item
+    # (managed by QueueManager.update_progress)
+    _notified_at: float = field(default=0.0, init=False, repr=False, compare=False)
+    _notified_progress: float = field(default=-1.0, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
@@ -114,9 +158,9 @@ class VideoItem:
             'playlist_title': self.playlist_title,
             'playlist_index': self.playlist_index,
             'output_path': self.output_path,
-            'created_at': self.created_at.isoformat(),
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'created_at': _ts_to_iso(self.created_ts),
+            'started_at': _ts_to_iso(self.started_ts),
+            'completed_at': _ts_to_iso(self.completed_ts),
         }
 
     @classmethod
@@ -137,14 +181,29 @@ class VideoItem:
         item.output_path = data.get('output_path')
 
         if data.get('created_at'):
-            item.created_at = datetime.fromisoformat(data['created_at'])
+            item.created_ts = datetime.fromisoformat(data['created_at']).timestamp()
         if data.get('started_at'):
-            item.started_at = datetime.fromisoformat(data['started_at'])
+            item.started_ts = datetime.fromisoformat(data['started_at']).timestamp()
         if data.get('completed_at'):
-            item.completed_at = datetime.fromisoformat(data['completed_at'])
+            item.completed_ts = datetime.fromisoformat(data['completed_at']).timestamp()
 
         return item
 
+    @property
+    def created_at(self) -> datetime:
+        """Time the item was added to the queue."""
+        return datetime.fromtimestamp(self.created_ts)
+
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """Time the download started, if it has."""
+        return _ts_to_datetime(self.started_ts)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """Time the download completed, if it has."""
+        return _ts_to_datetime(self.completed_ts)
+
     def can_retry(self) -> bool:
         """Check if this item can be retried."""
         return (
@@ -157,9 +216,8 @@ class VideoItem:
         if not self.duration:
             return "--:--"
 
-        hours = self.duration // 3600
-        minutes = (self.duration % 3600) // 60
-        seconds = self.duration % 60
+        hours, rest = divmod(self.duration, 3600)
+        minutes, seconds = divmod(rest, 60)
 
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -171,11 +229,10 @@ class VideoItem:
             return "Unknown"
 
         size = self.filesize
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        if size < 1024:
+            return f"{size:.1f} B"
+        idx = _unit_index(size)
+        return f"{size / _UNIT_DIVISORS[idx]:.1f} {_SIZE_UNITS[idx]}"
 
     def format_speed(self) -> str:
         """Format download speed."""
@@ -183,11 +240,10 @@ class VideoItem:
             return "--"
 
         speed = self.speed
-        for unit in ['B/s', 'KB/s', 'MB/s', 'GB/s']:
-            if speed < 1024:
-                return f"{speed:.1f} {unit}"
-            speed /= 1024
-        return f"{speed:.1f} TB/s"
+        if speed < 1024:
+            return f"{speed:.1f} B/s"
+        idx = _unit_index(speed)
+        return f"{speed / _UNIT_DIVISORS[idx]:.1f} {_SPEED_UNITS[idx]}"
 
     def format_eta(self) -> str:
         """Format ETA in human readable format."""
@@ -197,13 +253,11 @@ class VideoItem:
         if self.eta < 60:
             return f"{self.eta}s"
         elif self.eta < 3600:
-            minutes = self.eta // 60
-            seconds = self.eta % 60
+            minutes, seconds = divmod(self.eta, 60)
             return f"{minutes}m {seconds}s"
         else:
-            hours = self.eta // 3600
-            minutes = (self.eta % 3600) // 60
-            return f"{hours}h {minutes}m"
+            hours, rest = divmod(self.eta, 3600)
+            return f"{hours}h {rest // 60}m"
 
 
 class QueueManager:
@@ -220,11 +274,44 @@ class QueueManager:
         on_item_removed: Called when item is removed
         on_item_updated: Called when item status changes
         on_queue_cleared: Called when queue is cleared
+        on_items_added: Called once with all items added by add_multiple
+        on_items_removed: Called once with all items removed by
+            remove_multiple, clear_completed or clear_errors
+        on_items_updated: Called once with all items reset by retry_failed
+
+    When a batch callback is set it replaces the per-item callback for
+    those methods; otherwise the per-item callback runs for each item.
+
+    Additional listeners registered with add_queued_callback() are called
+    whenever an item becomes available for download (added, re-queued or
+    reset for retry).
     """
 
+    # update_progress only calls on_item_updated when this many seconds
+    # have passed or progress moved this many percent since the last call
+    PROGRESS_NOTIFY_INTERVAL = 0.1
+    PROGRESS_NOTIFY_STEP = 0.5
+
     def __init__(self, max_queue_size: int = 0):
         self._queue: OrderedDict[str, VideoItem] = OrderedDict()
-        self._lock = threading.RLock()
+        # URL -> IDs of the queued items with that URL in a non-final status,
+        # for O(1) duplicate checks. A retry can bring back a second live
+        # item with the same URL, so a key goes away only when its set does.
+        self._active_urls: Dict[str, Set[str]] = {}
+        # Items bucketed by status. Buckets are unordered; queue order comes
+        # from _rank, which increases from the head to the tail of _queue.
+        self._by_status: Dict[VideoStatus, Dict[str, VideoItem]] = {
+            status: {} for status in VideoStatus
+        }
+        self._rank: Dict[str, int] = {}
+        self._head_rank = 0
+        self._tail_rank = 0
+        # Running filesize totals for get_statistics
+        self._total_size = 0
+        self._completed_size = 0
+        # Plain (non-reentrant) lock: nothing called with it held takes it
+        # again, and callbacks always run after it is released
+        self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
         self.max_queue_size = max_queue_size
 
@@ -233,6 +320,10 @@ class QueueManager:
         self.on_item_removed: Optional[Callable[[VideoItem], None]] = None
         self.on_item_updated: Optional[Callable[[VideoItem], None]] = None
         self.on_queue_cleared: Optional[Callable[[], None]] = None
+        self.on_items_added: Optional[Callable[[List[VideoItem]], None]] = None
+        self.on_items_removed: Optional[Callable[[List[VideoItem]], None]] = None
+        self.on_items_updated: Optional[Callable[[List[VideoItem]], None]] = None
+        self._queued_callbacks: List[Callable[[], None]] = []
 
     def add(self, video: VideoItem) -> bool:
         """Add a video to the queue.
@@ -251,17 +342,17 @@ class QueueManager:
                 return False
 
             # Check for duplicates (same URL with non-final status)
-            for existing in self._queue.values():
-                if (existing.url == video.url and
-                    not existing.status.is_final()):
-                    return False
+            if self._is_duplicate(video):
+                return False
 
-            self._queue[video.id] = video
-            self._condition.notify_all()
+            self._insert(video)
+            if video.status == VideoStatus.QUEUED:
+                self._condition.notify()
 
         # Callback outside lock to prevent deadlocks
         if self.on_item_added:
             self.on_item_added(video)
+        self._notify_queued()
 
         return True
 
@@ -283,27 +374,120 @@ class QueueManager:
                     break
 
                 # Check for duplicates
-                is_duplicate = False
-                for existing in self._queue.values():
-                    if (existing.url == video.url and
-                        not existing.status.is_final()):
-                        is_duplicate = True
-                        break
-
-                if not is_duplicate:
-                    self._queue[video.id] = video
+                if not self._is_duplicate(video):
+                    self._insert(video)
                     added.append(video)
 
-            if added:
-                self._condition.notify_all()
+            # Wake one waiter per item that became available
+            queued = sum(1 for video in added if video.status == VideoStatus.QUEUED)
+            if queued:
+                self._condition.notify(queued)
 
         # Callbacks outside lock
-        for video in added:
-            if self.on_item_added:
-                self.on_item_added(video)
+        self._notify_items(added, self.on_items_added, self.on_item_added)
+        if added:
+            self._notify_queued()
 
         return added
 
+    def _is_duplicate(self, video: VideoItem) -> bool:
+        """Check whether a non-final item with the same URL is queued.
+
+        Must be called with the lock held.
+
+        Args:
+            video: The VideoItem about to be added
+
+        Returns:
+            True if the URL is already queued
+        """
+        return bool(self._active_urls.get(video.url))
+
+    def _insert(self, video: VideoItem):
+        """Append a video to the queue and its indexes.
+
+        Must be called with the lock held.
+        """
+        self._queue[video.id] = video
+        self._rank[video.id] = self._tail_rank
+        self._tail_rank += 1
+        self._by_status[video.status][video.id] = video
+        self._index_url(video)
+        size = video.filesize or 0
+        self._total_size += size
+        if video.status == VideoStatus.COMPLETED:
+            self._completed_size += size
+
+    def _pop(self, video_id: str) -> VideoItem:
+        """Remove a queued video from the queue and its indexes.
+
+        Must be called with the lock held.
+        """
+        video = self._queue.pop(video_id)
+        del self._rank[video_id]
+        self._by_status[video.status].pop(video_id, None)
+        self._unindex_url(video)
+        size = video.filesize or 0
+        self._total_size -= size
+        if video.status == VideoStatus.COMPLETED:
+            self._completed_size -= size
+        return video
+
+    def _set_status(self, video: VideoItem, status: VideoStatus):
+        """Change a queued video's status and move it to the new bucket.
+
+        Must be called with the lock held.
+        """
+        old_status = video.status
+        self._by_status[old_status].pop(video.id, None)
+        video.status = status
+        self._by_status[status][video.id] = video
+        self._index_url(video)
+        if (old_status == VideoStatus.COMPLETED) != (status == VideoStatus.COMPLETED):
+            size = video.filesize or 0
+            self._completed_size += size if status == VideoStatus.COMPLETED else -size
+
+    def _in_order(self, *statuses: VideoStatus) -> List[VideoItem]:
+        """Get the videos with the given statuses in queue order.
+
+        Must be called with the lock held.
+        """
+        buckets = [self._by_status[status] for status in statuses]
+        videos = [v for bucket in buckets for v in bucket.values()]
+        if len(buckets) > 1 or len(videos) > 1:
+            rank = self._rank
+            videos.sort(key=lambda v: rank[v.id])
+        return videos
+
+    def _next_queued(self) -> Optional[VideoItem]:
+        """Get the first QUEUED video in queue order (lock held)."""
+        queued = self._by_status[VideoStatus.QUEUED]
+        if not queued:
+            return None
+        rank = self._rank
+        return min(queued.values(), key=lambda v: rank[v.id])
+
+    def _index_url(self, video: VideoItem):
+        """Record a non-final item in the URL index.
+
+        Must be called with the lock held.
+        """
+        if video.status.is_final():
+            self._unindex_url(video)
+        else:
+            self._active_urls.setdefault(video.url, set()).add(video.id)
+
+    def _unindex_url(self, video: VideoItem):
+        """Drop an item from the URL index.
+
+        Must be called with the lock held.
+        """
+        video_ids = self._active_urls.get(video.url)
+        if video_ids is not None:
+            video_ids.discard(video.id)
+            if not video_ids:
+                del self._active_urls[video.url]
+
     def remove(self, video_id: str) -> Optional[VideoItem]:
         """Remove a video from the queue.
 
@@ -318,8 +502,7 @@ class QueueManager:
         removed = None
         with self._lock:
             if video_id in self._queue:
-                removed = self._queue.pop(video_id)
-                self._condition.notify_all()
+                removed = self._pop(video_id)
 
         if removed and self.on_item_removed:
             self.on_item_removed(removed)
@@ -341,14 +524,9 @@ class QueueManager:
         with self._lock:
             for video_id in video_ids:
                 if video_id in self._queue:
-                    removed.append(self._queue.pop(video_id))
-
-            if removed:
-                self._condition.notify_all()
+                    removed.append(self._pop(video_id))
 
-        for video in removed:
-            if self.on_item_removed:
-                self.on_item_removed(video)
+        self._notify_items(removed, self.on_items_removed, self.on_item_removed)
 
         return removed
 
@@ -378,6 +556,11 @@ class QueueManager:
         Thread-safe: Yes
         """
         with self._lock:
+            video_ids = self._active_urls.get(url)
+            if video_ids:
+                return self._queue[min(video_ids, key=self._rank.__getitem__)]
+
+            # Items in a final status are not indexed
             for video in self._queue.values():
                 if video.url == url:
                     return video
@@ -406,7 +589,7 @@ class QueueManager:
         Thread-safe: Yes
         """
         with self._lock:
-            return [v for v in self._queue.values() if v.status == status]
+            return self._in_order(status)
 
     def get_next_queued(self) -> Optional[VideoItem]:
         """Get the next video ready for download.
@@ -417,10 +600,7 @@ class QueueManager:
         Thread-safe: Yes
         """
         with self._lock:
-            for video in self._queue.values():
-                if video.status == VideoStatus.QUEUED:
-                    return video
-            return None
+            return self._next_queued()
 
     def get_active_downloads(self) -> List[VideoItem]:
         """Get all currently downloading videos.
@@ -431,7 +611,7 @@ class QueueManager:
         Thread-safe: Yes
         """
         with self._lock:
-            return [v for v in self._queue.values() if v.status.is_active()]
+            return self._in_order(*_ACTIVE_STATUSES)
 
     def update_status(
         self,
@@ -457,23 +637,26 @@ class QueueManager:
                 return False
 
             video = self._queue[video_id]
-            video.status = status
+            self._set_status(video, status)
 
             if status == VideoStatus.ERROR:
                 video.error_message = error_message
                 video.retry_count += 1
 
-            if status == VideoStatus.DOWNLOADING and not video.started_at:
-                video.started_at = datetime.now()
+            if status == VideoStatus.DOWNLOADING and not video.started_ts:
+                video.started_ts = time.time()
 
             if status == VideoStatus.COMPLETED:
-                video.completed_at = datetime.now()
+                video.completed_ts = time.time()
                 video.progress = 100.0
 
-            self._condition.notify_all()
+            if status == VideoStatus.QUEUED:
+                self._condition.notify()
 
         if video and self.on_item_updated:
             self.on_item_updated(video)
+        if status == VideoStatus.QUEUED:
+            self._notify_queued()
 
         return True
 
@@ -486,6 +669,10 @@ class QueueManager:
     ) -> bool:
         """Update download progress for a video.
 
+        The item is always updated, but on_item_updated is rate-limited
+        (see PROGRESS_NOTIFY_INTERVAL and PROGRESS_NOTIFY_STEP); reaching
+        100% is always reported.
+
         Args:
             video_id: ID of the video
             progress: Download progress (0-100)
@@ -498,6 +685,7 @@ class QueueManager:
         Thread-safe: Yes
         """
         video = None
+        notify = False
         with self._lock:
             if video_id not in self._queue:
                 return False
@@ -507,7 +695,16 @@ class QueueManager:
             video.speed = speed
             video.eta = eta
 
-        if video and self.on_item_updated:
+            # Coalesce rapid progress ticks into fewer UI updates
+            now = time.monotonic()
+            if (now - video._notified_at >= self.PROGRESS_NOTIFY_INTERVAL
+                    or abs(video.progress - video._notified_progress) >= self.PROGRESS_NOTIFY_STEP
+                    or video.progress >= 100.0):
+                video._notified_at = now
+                video._notified_progress = video.progress
+                notify = True
+
+        if notify and self.on_item_updated:
             self.on_item_updated(video)
 
         return True
@@ -548,7 +745,11 @@ class QueueManager:
             if duration is not None:
                 video.duration = duration
             if filesize is not None:
+                delta = (filesize or 0) - (video.filesize or 0)
                 video.filesize = filesize
+                self._total_size += delta
+                if video.status == VideoStatus.COMPLETED:
+                    self._completed_size += delta
             if thumbnail_url is not None:
                 video.thumbnail_url = thumbnail_url
             if metadata is not None:
@@ -575,32 +776,64 @@ class QueueManager:
             if video_id not in self._queue:
                 return False
 
-            # Get current order
-            items = list(self._queue.items())
-            current_index = next(
-                (i for i, (k, _) in enumerate(items) if k == video_id),
-                None
-            )
+            new_index = max(0, min(new_index, len(self._queue) - 1))
+            self._move(video_id, new_index)
+            return True
+
+    def _move(self, video_id: str, new_index: int):
+        """Move a queued video to a valid position in place.
 
-            if current_index is None:
-                return False
+        OrderedDict keeps its keys in a linked list, so moving keys to
+        either end is O(1). The item goes to whichever end is nearer
+        new_index, then only the keys between that end and new_index are
+        moved past it. Must be called with the lock held.
+
+        Args:
+            video_id: ID of a video in the queue
+            new_index: New position (0 to len - 1)
+        """
+        queue = self._queue
+        last = len(queue) - 1
 
-            # Remove and reinsert at new position
-            item = items.pop(current_index)
-            new_index = max(0, min(new_index, len(items)))
-            items.insert(new_index, item)
+        if new_index * 2 >= last:
+            self._move_to_end(video_id)
+            for key in list(islice(queue, new_index, last)):
+                self._move_to_end(key)
+        else:
+            self._move_to_end(video_id, last=False)
+            for key in reversed(list(islice(queue, 1, new_index + 1))):
+                self._move_to_end(key, last=False)
 
-            # Rebuild queue
-            self._queue = OrderedDict(items)
+    def _move_to_end(self, video_id: str, last: bool = True):
+        """Move a queued video to the tail (or head) of the queue.
 
-            return True
+        Must be called with the lock held.
+        """
+        self._queue.move_to_end(video_id, last=last)
+        if last:
+            self._rank[video_id] = self._tail_rank
+            self._tail_rank += 1
+        else:
+            self._head_rank -= 1
+            self._rank[video_id] = self._head_rank
+
+    def _index_of(self, video_id: str) -> int:
+        """Get the position of a queued video (lock held, ID present)."""
+        for index, key in enumerate(self._queue):
+            if key == video_id:
+                return index
+        raise ValueError(video_id)
 
     def move_to_top(self, video_id: str) -> bool:
         """Move a video to the top of the queue.
 
         Thread-safe: Yes
         """
-        return self.reorder(video_id, 0)
+        with self._lock:
+            if video_id not in self._queue:
+                return False
+            self._move_to_end(video_id, last=False)
+            return True
 
     def move_to_bottom(self, video_id: str) -> bool:
         """Move a video to the bottom of the queue.
@@ -608,7 +841,10 @@ class QueueManager:
         Thread-safe: Yes
         """
         with self._lock:
-            return self.reorder(video_id, len(self._queue))
+            if video_id not in self._queue:
+                return False
+            self._move_to_end(video_id)
+            return True
 
     def move_up(self, video_id: str) -> bool:
         """Move a video up one position.
@@ -616,13 +852,12 @@ class QueueManager:
         Thread-safe: Yes
         """
         with self._lock:
-            items = list(self._queue.keys())
-            try:
-                current_index = items.index(video_id)
-                if current_index > 0:
-                    return self.reorder(video_id, current_index - 1)
-            except ValueError:
-                pass
+            if video_id not in self._queue:
+                return False
+            current_index = self._index_of(video_id)
+            if current_index > 0:
+                self._move(video_id, current_index - 1)
+                return True
             return False
 
     def move_down(self, video_id: str) -> bool:
@@ -631,13 +866,12 @@ class QueueManager:
         Thread-safe: Yes
         """
         with self._lock:
-            items = list(self._queue.keys())
-            try:
-                current_index = items.index(video_id)
-                if current_index < len(items) - 1:
-                    return self.reorder(video_id, current_index + 1)
-            except ValueError:
-                pass
+            if video_id not in self._queue:
+                return False
+            current_index = self._index_of(video_id)
+            if current_index < len(self._queue) - 1:
+                self._move(video_id, current_index + 1)
+                return True
             return False
 
     def clear(self, keep_active: bool = True) -> List[VideoItem]:
@@ -660,12 +894,15 @@ class QueueManager:
                     if not v.status.is_active()
                 ]
                 for video_id in to_remove:
-                    removed.append(self._queue.pop(video_id))
+                    removed.append(self._pop(video_id))
             else:
                 removed = list(self._queue.values())
                 self._queue.clear()
-
-            self._condition.notify_all()
+                self._active_urls.clear()
+                self._rank.clear()
+                for bucket in self._by_status.values():
+                    bucket.clear()
+                self._total_size = self._completed_size = 0
 
         if self.on_queue_cleared:
             self.on_queue_cleared()
@@ -682,18 +919,10 @@ class QueueManager:
         """
         removed = []
         with self._lock:
-            to_remove = [
-                vid for vid, v in self._queue.items()
-                if v.status == VideoStatus.COMPLETED
-            ]
-            for video_id in to_remove:
-                removed.append(self._queue.pop(video_id))
+            for video in self._in_order(VideoStatus.COMPLETED):
+                removed.append(self._pop(video.id))
 
-            self._condition.notify_all()
-
-        for video in removed:
-            if self.on_item_removed:
-                self.on_item_removed(video)
+        self._notify_items(removed, self.on_items_removed, self.on_item_removed)
 
         return removed
 
@@ -707,18 +936,10 @@ class QueueManager:
         """
         removed = []
         with self._lock:
-            to_remove = [
-                vid for vid, v in self._queue.items()
-                if v.status == VideoStatus.ERROR
-            ]
-            for video_id in to_remove:
-                removed.append(self._queue.pop(video_id))
-
-            self._condition.notify_all()
+            for video in self._in_order(VideoStatus.ERROR):
+                removed.append(self._pop(video.id))
 
-        for video in removed:
-            if self.on_item_removed:
-                self.on_item_removed(video)
+        self._notify_items(removed, self.on_items_removed, self.on_item_removed)
 
         return removed
 
@@ -732,19 +953,19 @@ class QueueManager:
         """
         retried = []
         with self._lock:
-            for video in self._queue.values():
+            for video in self._in_order(VideoStatus.ERROR):
                 if video.can_retry():
-                    video.status = VideoStatus.QUEUED
+                    self._set_status(video, VideoStatus.QUEUED)
                     video.progress = 0.0
                     video.error_message = None
                     retried.append(video)
 
             if retried:
-                self._condition.notify_all()
+                self._condition.notify(len(retried))
 
-        for video in retried:
-            if self.on_item_updated:
-                self.on_item_updated(video)
+        self._notify_items(retried, self.on_items_updated, self.on_item_updated)
+        if retried:
+            self._notify_queued()
 
         return retried
 
@@ -768,19 +989,73 @@ class QueueManager:
             if not video.can_retry():
                 return False
 
-            video.status = VideoStatus.QUEUED
+            self._set_status(video, VideoStatus.QUEUED)
             video.progress = 0.0
             video.error_message = None
-            self._condition.notify_all()
+            self._condition.notify()
 
         if video and self.on_item_updated:
             self.on_item_updated(video)
+        self._notify_queued()
 
         return True
 
+    def add_queued_callback(self, callback: Callable[[], None]):
+        """Add a listener for items becoming available for download.
+
+        Args:
+            callback: Function called with no arguments, outside the lock
+        """
+        with self._lock:
+            self._queued_callbacks.append(callback)
+
+    def remove_queued_callback(self, callback: Callable[[], None]):
+        """Remove a queued-item listener.
+
+        Args:
+            callback: Callback to remove
+        """
+        with self._lock:
+            if callback in self._queued_callbacks:
+                self._queued_callbacks.remove(callback)
+
+    @staticmethod
+    def _notify_items(
+        videos: List[VideoItem],
+        batch_callback: Optional[Callable[[List[VideoItem]], None]],
+        item_callback: Optional[Callable[[VideoItem], None]]
+    ):
+        """Report a batch of changed items, once if possible.
+
+        Args:
+            videos: Items affected by one operation
+            batch_callback: Called once with the whole list, if set
+            item_callback: Called per item when there is no batch callback
+        """
+        if not videos:
+            return
+        if batch_callback:
+            batch_callback(videos)
+        elif item_callback:
+            for video in videos:
+                item_callback(video)
+
+    def _notify_queued(self):
+        """Notify listeners that an item is ready for download."""
+        with self._lock:
+            callbacks = list(self._queued_callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
     def wait_for_item(self, timeout: Optional[float] = None) -> Optional[VideoItem]:
         """Wait for a queued item to become available.
 
+        Waiters are only woken when items become QUEUED (one per item),
+        and each wakeup checks the QUEUED bucket rather than the queue.
+
         Args:
             timeout: Maximum time to wait in seconds
 
@@ -792,9 +1067,9 @@ class QueueManager:
         with self._condition:
             while True:
                 # Check for queued item
-                for video in self._queue.values():
-                    if video.status == VideoStatus.QUEUED:
-                        return video
+                video = self._next_queued()
+                if video is not None:
+                    return video
 
                 # Wait for notification
                 if not self._condition.wait(timeout):
@@ -825,22 +1100,16 @@ class QueueManager:
         """
         with self._lock:
             total = len(self._queue)
-            by_status = {}
-            total_size = 0
-            completed_size = 0
-
-            for video in self._queue.values():
-                status_name = video.status.name
-                by_status[status_name] = by_status.get(status_name, 0) + 1
-                total_size += video.filesize or 0
-                if video.status == VideoStatus.COMPLETED:
-                    completed_size += video.filesize or 0
+            by_status = {
+                status.name: len(bucket)
+                for status, bucket in self._by_status.items() if bucket
+            }
 
             return {
                 'total': total,
                 'by_status': by_status,
-                'total_size_bytes': total_size,
-                'completed_size_bytes': completed_size,
+                'total_size_bytes': self._total_size,
+                'completed_size_bytes': self._completed_size,
                 'queued': by_status.get('QUEUED', 0),
                 'downloading': by_status.get('DOWNLOADING', 0),
                 'completed': by_status.get('COMPLETED', 0),
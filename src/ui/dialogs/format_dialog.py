@@ -8,7 +8,7 @@ from tkinter import ttk
 from typing import Optional, Callable, List
 
 from src.core.format_selector import (
-    FormatSelector, FormatInfo, VideoFormats, FormatType
+    FetchHandle, FormatSelector, FormatInfo, VideoFormats, FormatType
 )
 from src.ui.styled_widgets import DRACULA
 
@@ -67,9 +67,18 @@ class FormatDialog(tk.Toplevel):
         # Center on parent
         self.transient(parent)
 
+        # In-flight fetch, cancelled if the dialog closes first
+        self._fetch_handle: Optional[FetchHandle] = None
+
         self._build_ui()
         self._fetch_formats()
 
+    def destroy(self):
+        """Cancel any in-flight fetch and close the dialog."""
+        if self._fetch_handle is not None:
+            self._fetch_handle.cancel()
+        super().destroy()
+
     def _build_ui(self):
         """Build the dialog UI."""
         self.columnconfigure(0, weight=1)
@@ -244,7 +253,7 @@ class FormatDialog(tk.Toplevel):
         self.progress.start(10)
 
         # Fetch async
-        self.format_selector.get_formats_async(
+        self._fetch_handle = self.format_selector.get_formats_async(
             self.url,
             on_complete=lambda result: self.after(0, lambda: self._on_formats_loaded(result)),
             on_progress=lambda msg: self.after(0, lambda: self.status_label.config(text=msg))
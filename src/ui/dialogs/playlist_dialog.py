@@ -10,6 +10,7 @@ from typing import Optional, Callable, List
 from src.core.playlist_filter import (
     PlaylistFilter, PlaylistInfo, PlaylistVideoInfo
 )
+from src.core.format_selector import FetchHandle
 from src.ui.styled_widgets import StyledEntry, DRACULA
 
 
@@ -35,6 +36,15 @@ class PlaylistDialog(tk.Toplevel):
         )
     """
 
+    # Duration filter choices -> (min_seconds, max_seconds), 0 = no bound
+    DURATION_FILTERS = {
+        "< 5 min": (0, 300),
+        "< 10 min": (0, 600),
+        "< 30 min": (0, 1800),
+        "> 30 min": (1800, 0),
+        "> 1 hour": (3600, 0),
+    }
+
     def __init__(
         self,
         parent,
@@ -68,9 +78,18 @@ class PlaylistDialog(tk.Toplevel):
         # Center on parent
         self.transient(parent)
 
+        # In-flight fetch, cancelled if the dialog closes first
+        self._fetch_handle: Optional[FetchHandle] = None
+
         self._build_ui()
         self._fetch_playlist()
 
+    def destroy(self):
+        """Cancel any in-flight fetch and close the dialog."""
+        if self._fetch_handle is not None:
+            self._fetch_handle.cancel()
+        super().destroy()
+
     def _build_ui(self):
         """Build the dialog UI."""
         self.columnconfigure(0, weight=1)
@@ -285,7 +304,7 @@ class PlaylistDialog(tk.Toplevel):
         self.progress.start(10)
 
         # Fetch async
-        self.playlist_filter.get_playlist_info_async(
+        self._fetch_handle = self.playlist_filter.get_playlist_info_async(
             self.url,
             on_complete=lambda result: self.after(0, lambda: self._on_playlist_loaded(result)),
             on_progress=lambda msg: self.after(0, lambda: self.status_label.config(text=msg))
@@ -321,35 +340,25 @@ class PlaylistDialog(tk.Toplevel):
         if not self._playlist_info:
             return
 
-        videos = self._playlist_info.videos
-
-        # Search filter
-        search_query = self.search_var.get().strip()
-        if search_query:
-            videos = self.playlist_filter.search_by_title(videos, search_query)
-
-        # Duration filter
-        duration_filter = self.duration_var.get()
-        if duration_filter == "< 5 min":
-            videos = self.playlist_filter.filter_by_duration(videos, max_seconds=300)
-        elif duration_filter == "< 10 min":
-            videos = self.playlist_filter.filter_by_duration(videos, max_seconds=600)
-        elif duration_filter == "< 30 min":
-            videos = self.playlist_filter.filter_by_duration(videos, max_seconds=1800)
-        elif duration_filter == "> 30 min":
-            videos = self.playlist_filter.filter_by_duration(videos, min_seconds=1800)
-        elif duration_filter == "> 1 hour":
-            videos = self.playlist_filter.filter_by_duration(videos, min_seconds=3600)
+        # Duration filter as (min_seconds, max_seconds)
+        min_seconds, max_seconds = self.DURATION_FILTERS.get(self.duration_var.get(), (0, 0))
 
         # Index range filter
         try:
             start = int(self.start_var.get()) if self.start_var.get() else 1
             end = int(self.end_var.get()) if self.end_var.get() else 0
-            videos = self.playlist_filter.filter_by_index(videos, start, end)
         except ValueError:
-            pass
-
-        self._filtered_videos = videos
+            start, end = 1, 0
+
+        # All filters in one pass
+        self._filtered_videos = self.playlist_filter.filter(
+            self._playlist_info.videos,
+            min_seconds=min_seconds,
+            max_seconds=max_seconds,
+            start=start,
+            end=end,
+            query=self.search_var.get().strip(),
+        )
         self._populate_table()
 
     def _populate_table(self):
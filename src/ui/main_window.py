@@ -239,6 +239,8 @@ class MainWindow:
         self.queue_manager.on_item_added = self._on_queue_item_added
         self.queue_manager.on_item_updated = self._on_queue_item_updated
         self.queue_manager.on_item_removed = self._on_queue_item_removed
+        self.queue_manager.on_items_added = self._on_queue_items_added
+        self.queue_manager.on_items_removed = self._on_queue_items_removed
 
         # Download manager callbacks
         self.download_manager.on_progress = self._on_download_progress
@@ -253,30 +255,44 @@ class MainWindow:
 
         # Process URLs in background
         def process():
-            for url in urls:
+            results = self.url_validator.validate_batch(urls)
+
+            valid_urls = []
+            for url, result in zip(urls, results):
+                if result.is_valid:
+                    valid_urls.append(url)
+                else:
+                    self.root.after(0, lambda u=url, e=result.error_message:
+                        self._log_error(f"Invalid URL: {u} - {e}"))
+
+            # Extract info for all valid URLs concurrently
+            infos = self.download_manager.extract_info_batch(valid_urls)
+
+            for url, info in zip(valid_urls, infos):
                 try:
-                    # Validate URL
-                    result = self.url_validator.validate(url)
-                    if not result.is_valid:
-                        self.root.after(0, lambda u=url, e=result.error:
-                            self._log_error(f"Invalid URL: {u} - {e}"))
-                        continue
-
-                    # Extract info
-                    info = self.download_manager.extract_info(url)
                     if info:
-                        video = VideoItem(
-                            id=info.get("id", ""),
-                            url=url,
-                            title=info.get("title", "Unknown"),
-                            duration=info.get("duration", 0),
-                            thumbnail_url=info.get("thumbnail", ""),
-                            uploader=info.get("uploader", "Unknown"),
-                            filesize=info.get("filesize", 0) or info.get("filesize_approx", 0)
-                        )
-                        self.queue_manager.add(video)
-                        self.root.after(0, lambda v=video:
-                            self.status_bar.info(f"Added: {v.title}"))
+                        videos = [
+                            VideoItem(
+                                url=entry.get("url") or url,
+                                title=entry.get("title", "Unknown"),
+                                duration=entry.get("duration") or 0,
+                                thumbnail_url=entry.get("thumbnail", ""),
+                                filesize=entry.get("filesize") or 0,
+                                playlist_title=entry.get("playlist_title"),
+                                playlist_index=entry.get("playlist_index"),
+                                metadata={"uploader": entry.get("uploader", "Unknown")}
+                            )
+                            for entry in info
+                        ]
+                        # One queue update (and one UI update) per URL,
+                        # however many playlist entries it expanded to
+                        added = self.queue_manager.add_multiple(videos)
+                        if len(added) == 1:
+                            self.root.after(0, lambda v=added[0]:
+                                self.status_bar.info(f"Added: {v.title}"))
+                        elif added:
+                            self.root.after(0, lambda n=len(added):
+                                self.status_bar.info(f"Added {n} videos"))
                     else:
                         self.root.after(0, lambda u=url:
                             self._log_error(f"Could not extract info from: {u}"))
@@ -304,9 +320,23 @@ class MainWindow:
         """Handle video updated in queue."""
         self.root.after(0, lambda: self.downloads_tab.update_queue_item(video))
 
-    def _on_queue_item_removed(self, video_id: str):
+    def _on_queue_item_removed(self, video: VideoItem):
         """Handle video removed from queue."""
-        self.root.after(0, lambda: self.downloads_tab.remove_from_queue(video_id))
+        self.root.after(0, lambda: self.downloads_tab.remove_from_queue(video.id))
+
+    def _on_queue_items_added(self, videos: List[VideoItem]):
+        """Handle several videos added to queue at once."""
+        def add_all():
+            for video in videos:
+                self.downloads_tab.add_to_queue(video)
+        self.root.after(0, add_all)
+
+    def _on_queue_items_removed(self, videos: List[VideoItem]):
+        """Handle several videos removed from queue at once."""
+        def remove_all():
+            for video in videos:
+                self.downloads_tab.remove_from_queue(video.id)
+        self.root.after(0, remove_all)
 
     # Download controls
 
@@ -343,7 +373,16 @@ class MainWindow:
 
     def _stop_downloads(self):
         """Stop all downloads."""
-        self.download_manager.stop()
+        # Running downloads wind down in the background; the UI is updated
+        # once they have
+        self.status_bar.info("Stopping downloads...")
+        self.download_manager.stop(
+            block=False,
+            on_stopped=lambda: self.root.after(0, self._on_downloads_stopped)
+        )
+
+    def _on_downloads_stopped(self):
+        """Handle the download manager finishing a stop."""
         self.downloads_tab.set_downloading_state(False)
         self.downloads_tab.reset_progress()
         self.status_bar.info("Downloads stopped")
@@ -450,8 +489,7 @@ class MainWindow:
 
     def _handle_remove_items(self, video_ids: List[str]):
         """Handle remove items request."""
-        for vid in video_ids:
-            self.queue_manager.remove(vid)
+        self.queue_manager.remove_multiple(video_ids)
 
     def _clear_queue(self):
         """Clear the download queue."""
@@ -473,17 +511,24 @@ class MainWindow:
 
     def _handle_settings_changed(self, key: str, value):
         """Handle settings change."""
+        if key == "max_concurrent_downloads":
+            self.download_manager.max_concurrent = value
+            return
+
         # Update download options if relevant
         if key == "download_path":
             self.download_options.output_path = value
-        elif key == "max_concurrent_downloads":
-            self.download_manager.max_concurrent = value
         elif key == "quality":
             self.download_options.quality = value
         elif key == "include_subtitles":
             self.download_options.include_subtitles = value
         elif key == "subtitle_language":
             self.download_options.subtitle_langs = [value]
+        else:
+            return
+
+        # Apply to the remaining downloads of a running queue
+        self.download_manager.update_options()
 
     # Menu actions
 
@@ -572,8 +617,8 @@ class MainWindow:
             ):
                 return
 
-            # Stop downloads
-            self.download_manager.stop()
+            # Stop downloads; close() below waits for them to wind down
+            self.download_manager.stop(block=False)
 
         # Check for unsaved settings
         if self.settings_tab.has_unsaved_changes():
@@ -596,6 +641,9 @@ class MainWindow:
 
         self.root.destroy()
 
+        # Wait for worker threads after the window is gone
+        self.download_manager.close()
+
     def run(self):
         """Run the application."""
         self.root.mainloop()
@@ -15,10 +15,42 @@ from collections import OrderedDict
 from typing import Any, Optional, Dict, Callable, TypeVar, Generic
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit
 
 
 T = TypeVar('T')
 
+# Query parameters that only record how or where a link was shared
+_TRACKING_PARAMS = frozenset({
+    'si', 'feature', 'pp', 't', 'fbclid', 'gclid',
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+})
+
+
+def canonical_url(url: str) -> str:
+    """Canonicalize a URL for use as a cache key.
+
+    Lowercases the scheme and host and drops the fragment and
+    share-tracking query parameters, so copies of the same link
+    map to one key.
+
+    Args:
+        url: URL to canonicalize
+
+    Returns:
+        Canonical URL string
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    query = '&'.join(
+        param for param in parts.query.split('&')
+        if param and param.split('=', 1)[0] not in _TRACKING_PARAMS
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
 
 @dataclass
 class CacheEntry(Generic[T]):
@@ -392,5 +424,5 @@ class VideoInfoCache(CacheManager):
             if match:
                 return f"video:{match.group(1)}"
 
-        # Fallback to hash
-        return hashlib.md5(url.encode()).hexdigest()
+        # Fallback to hash of the canonical URL
+        return hashlib.md5(canonical_url(url).encode()).hexdigest()
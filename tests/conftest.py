@@ -3,7 +3,9 @@
 import pytest
 import sys
 import os
+import subprocess
 import tempfile
+import threading
 import json
 
 # Add project root to path
@@ -84,6 +86,81 @@ def sample_video_info():
     }
 
 
+@pytest.fixture
+def fake_subprocess_run(monkeypatch):
+    """Replace subprocess.run with a stub.
+
+    Call the fixture with ``handler(cmd) -> (returncode, stdout)`` to
+    install (or swap) the answers. Returns the list of commands run.
+    """
+    calls = []
+
+    def install(handler):
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            returncode, stdout = handler(cmd)
+            return subprocess.CompletedProcess(cmd, returncode, stdout, None)
+
+        monkeypatch.setattr(subprocess, 'run', run)
+        return calls
+
+    return install
+
+
+@pytest.fixture
+def fake_youtube_dl(monkeypatch):
+    """Replace yt_dlp.YoutubeDL with a recording stub.
+
+    Call the fixture with ``extract_info(ydl, url, **kwargs) -> info`` to
+    install (or swap) the behaviour. Returns the stub class, whose
+    ``instances`` lists every YoutubeDL created and ``calls`` every URL
+    extracted. YoutubeDL instances cached per thread by FormatSelector and
+    PlaylistFilter are dropped so the stub is used.
+    """
+    import yt_dlp
+    from src.core.format_selector import FormatSelector
+    from src.core.playlist_filter import PlaylistFilter
+
+    class FakeYoutubeDL:
+        """Stand-in for yt_dlp.YoutubeDL."""
+
+        calls = []
+        instances = []
+        handler = None
+
+        def __init__(self, params=None):
+            self.params = params or {}
+            self.post_processed = []
+            self.closed = False
+            self.instances.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.close()
+            return False
+
+        def extract_info(self, url, download=False, **kwargs):
+            self.calls.append(url)
+            return type(self).handler(self, url, download=download, **kwargs)
+
+        def post_process(self, filename, info):
+            self.post_processed.append(filename)
+
+        def close(self):
+            self.closed = True
+
+    def install(extract_info):
+        FakeYoutubeDL.handler = staticmethod(extract_info)
+        return FakeYoutubeDL
+
+    monkeypatch.setattr(yt_dlp, 'YoutubeDL', FakeYoutubeDL)
+    monkeypatch.setattr(FormatSelector, '_tls', threading.local())
+    monkeypatch.setattr(PlaylistFilter, '_tls', threading.local())
+    return install
+
+
 # Skip markers for tests requiring network
 def pytest_configure(config):
     """Configure pytest markers."""
@@ -34,6 +34,15 @@ class TestConfigManager:
         if os.path.exists(temp_config_file):
             os.unlink(temp_config_file)
 
+    def test_load_missing_file_creates_default(self, tmp_path):
+        """Test that loading a missing file writes the default config."""
+        config_file = tmp_path / "config.json"
+        manager = ConfigManager(config_file=str(config_file))
+
+        assert manager.load()
+        assert config_file.exists()
+        assert manager.get("quality") == "best"
+
     def test_get_default_value(self, config_manager):
         """Test getting a value with default."""
         value = config_manager.get("nonexistent", "default_value")
@@ -45,12 +54,29 @@ class TestConfigManager:
         config_manager.update({"max_concurrent_downloads": 5})
         assert config_manager.get("max_concurrent_downloads") == 5
 
+    def test_set_validated_value(self, config_manager):
+        """Test that set() accepts a valid value for a schema key."""
+        assert config_manager.set("theme", "dark")
+        assert config_manager.get("theme") == "dark"
+
     def test_set_overwrites(self, config_manager):
         """Test that update overwrites existing values."""
         config_manager.update({"max_concurrent_downloads": 3})
         config_manager.update({"max_concurrent_downloads": 4})
         assert config_manager.get("max_concurrent_downloads") == 4
 
+    def test_update_ignores_unknown_keys(self, config_manager):
+        """Test that update skips unknown keys and notifies known ones."""
+        changes = []
+        config_manager.add_change_callback(
+            lambda key, old, new: changes.append((key, old, new))
+        )
+
+        config_manager.update({"unknown_key": 1, "max_concurrent_downloads": 3})
+
+        assert config_manager.get("unknown_key") is None
+        assert changes == [("max_concurrent_downloads", 2, 3)]
+
     def test_persistence(self, temp_config_file):
         """Test that config persists to file."""
         # Create and save
@@ -64,6 +90,20 @@ class TestConfigManager:
         manager2.load()
         assert manager2.get("max_concurrent_downloads") == 6
 
+    def test_non_ascii_values_saved_unescaped(self, temp_config_file):
+        """Test that non-ASCII values are written as UTF-8 and reload intact."""
+        manager = ConfigManager(config_file=temp_config_file)
+        manager.load()
+        manager.update({"proxy": "http://пример.рф:8080"})
+        manager.save()
+
+        with open(temp_config_file, 'r', encoding='utf-8') as f:
+            assert "пример" in f.read()
+
+        reloaded = ConfigManager(config_file=temp_config_file)
+        reloaded.load()
+        assert reloaded.get("proxy") == "http://пример.рф:8080"
+
     def test_get_all(self, config_manager):
         """Test getting all config values."""
         config_manager.update({
@@ -89,6 +129,11 @@ class TestConfigManager:
         # Default value should be restored
         assert config_manager.get("max_concurrent_downloads") == 2  # Default is 2
 
+    def test_subtitle_langs_exported_as_list(self, config_manager):
+        """Test that the shared tuple default is exported as a list."""
+        all_config = config_manager.get_all()
+        assert all_config["subtitle_langs"] == ["en"]
+
 
 class TestURLValidator:
     """Tests for URL validation."""
@@ -123,6 +168,58 @@ class TestURLValidator:
             result = URLValidator.validate(url)
             assert not result.is_valid, f"URL should be invalid: {url}"
 
+    def test_url_type_and_id(self):
+        """Test that each URL form is classified with the right type and ID."""
+        test_cases = [
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "video", "dQw4w9WgXcQ"),
+            ("https://youtu.be/dQw4w9WgXcQ", "video", "dQw4w9WgXcQ"),
+            ("https://youtube.com/live/dQw4w9WgXcQ", "video", "dQw4w9WgXcQ"),
+            ("https://www.youtube.com/playlist?list=PLabc123", "playlist", "PLabc123"),
+            ("https://www.youtube.com/@user.name", "channel", "user.name"),
+            ("https://www.youtube.com/user/legacy", "channel", "legacy"),
+        ]
+
+        for url, url_type, url_id in test_cases:
+            info = URLValidator.validate(url).sanitized_value
+            assert info['type'] == url_type, f"Wrong type for {url}"
+            assert info['id'] == url_id, f"Wrong id for {url}"
+
+    def test_cached_results_are_independent(self):
+        """Test that mutating a result does not affect later validations."""
+        url = "https://youtu.be/dQw4w9WgXcQ"
+        first = URLValidator.validate(url)
+        first.sanitized_value['id'] = "changed"
+
+        second = URLValidator.validate(url)
+        assert second.sanitized_value['id'] == "dQw4w9WgXcQ"
+
+    def test_validate_batch(self):
+        """Test batch validation keeps input order and matches validate()."""
+        urls = [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://vimeo.com/123456",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/playlist?list=PLabc123",
+        ]
+
+        results = URLValidator.validate_batch(urls)
+
+        assert [r.is_valid for r in results] == [True, False, True, True]
+        for url, result in zip(urls, results):
+            expected = URLValidator.validate(url)
+            assert result.sanitized_value == expected.sanitized_value
+            assert result.error_message == expected.error_message
+
+    def test_normalize_url(self):
+        """Test normalizing URLs to canonical forms."""
+        assert URLValidator.normalize_url("youtu.be/dQw4w9WgXcQ") == \
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        assert URLValidator.normalize_url("https://youtube.com/playlist?list=PLabc") == \
+            "https://www.youtube.com/playlist?list=PLabc"
+        assert URLValidator.normalize_url("https://www.youtube.com/@user") == \
+            "https://www.youtube.com/@user"
+        assert URLValidator.normalize_url("https://example.com") is None
+
     def test_extract_video_id(self):
         """Test video ID extraction."""
         test_cases = [
@@ -163,6 +260,10 @@ class TestURLValidator:
         playlist_id2 = URLValidator.extract_playlist_id(url2)
         assert playlist_id2 == "PLxyz123abc"
 
+        # Fragment and empty parameters are ignored
+        url3 = "https://youtube.com/watch?list=&v=dQw4w9WgXcQ&list=PLxyz#t=10"
+        assert URLValidator.extract_playlist_id(url3) == "PLxyz"
+
 
 class TestPathValidator:
     """Tests for path validation."""
@@ -179,6 +280,25 @@ class TestPathValidator:
         result = PathValidator.validate_directory("/nonexistent/path/that/doesnt/exist")
         assert not result.is_valid
 
+    def test_home_path_expanded(self):
+        """Test that '~' is expanded to an absolute path."""
+        result = PathValidator.validate_directory("~", check_writable=False, check_space=False)
+        assert result.is_valid
+        assert result.sanitized_value == os.path.abspath(os.path.expanduser("~"))
+
+    def test_probe_write(self, tmp_path):
+        """Test the optional write probe leaves no file behind."""
+        result = PathValidator.validate_directory(str(tmp_path), probe_write=True)
+        assert result.is_valid
+        assert list(tmp_path.iterdir()) == []
+
+    def test_file_is_not_directory(self, tmp_path):
+        """Test that a regular file is rejected."""
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("x")
+        result = PathValidator.validate_directory(str(file_path))
+        assert not result.is_valid
+
     def test_empty_path(self):
         """Test empty path."""
         result = PathValidator.validate_directory("")
@@ -202,6 +322,102 @@ class TestPathValidator:
                 assert char not in result
 
 
+    def test_get_unique_path(self, tmp_path):
+        """Test that numbered suffixes skip existing files."""
+        (tmp_path / "video.mp4").write_text("x")
+        (tmp_path / "video (1).mp4").write_text("x")
+
+        assert PathValidator.get_unique_path(str(tmp_path / "new.mp4")) == str(tmp_path / "new.mp4")
+        assert PathValidator.get_unique_path(str(tmp_path / "video.mp4")) == str(tmp_path / "video (2).mp4")
+
+    def test_sanitize_filename_control_chars(self):
+        """Test that null bytes are dropped and control chars replaced."""
+        assert PathValidator.sanitize_filename("a\x00b\x01c.mp4") == "ab_c.mp4"
+        assert PathValidator.sanitize_filename("a<>|b.mp4") == "a_b.mp4"
+        assert PathValidator.sanitize_filename("a<>b", replacement="-") == "a-b"
+
+    def test_sanitize_filename_reserved_names(self):
+        """Test that Windows reserved device names are prefixed."""
+        assert PathValidator.sanitize_filename("con.mp4") == "_con.mp4"
+        assert PathValidator.sanitize_filename("NUL.tar.gz") == "_NUL.tar.gz"
+        assert PathValidator.sanitize_filename("console.mp4") == "console.mp4"
+
+    def test_sanitize_filename_non_ascii(self):
+        """Test that non-ASCII titles are sanitized the same way."""
+        assert PathValidator.sanitize_filename("ünï<>code\x00.mp4") == "ünï_code.mp4"
+
+
+class TestConfigValidator:
+    """Tests for configuration validation."""
+
+    def test_defaults_for_missing_keys(self):
+        """Test that missing optional keys get schema defaults."""
+        result = ConfigValidator.validate_config({
+            "download_path": tempfile.gettempdir(),
+            "quality": "720p",
+        })
+        assert result.is_valid
+        assert result.sanitized_value["theme"] == "system"
+        assert result.sanitized_value["max_concurrent_downloads"] == 2
+
+    def test_range_clamping_and_allowed_values(self):
+        """Test that numbers are clamped and unknown choices reset."""
+        result = ConfigValidator.validate_config({
+            "download_path": tempfile.gettempdir(),
+            "quality": "best",
+            "max_concurrent_downloads": 50,
+            "theme": "neon",
+        })
+        assert result.sanitized_value["max_concurrent_downloads"] == 10
+        assert result.sanitized_value["theme"] == "system"
+        assert len(result.warnings) == 2
+
+    def test_cached_result_not_shared(self):
+        """Test that repeated validation returns independent results."""
+        config = {"download_path": tempfile.gettempdir(), "quality": "best"}
+        first = ConfigValidator.validate_config(config)
+        first.sanitized_value["subtitle_langs"].append("fr")
+
+        second = ConfigValidator.validate_config(config)
+        assert second.sanitized_value["subtitle_langs"] == ["en"]
+
+    def test_bool_and_int_not_confused(self):
+        """Test that True and 1 are validated separately."""
+        base = {"download_path": tempfile.gettempdir(), "quality": "best"}
+        as_int = ConfigValidator.validate_config({**base, "retry_attempts": 1})
+        as_bool = ConfigValidator.validate_config({**base, "retry_attempts": True})
+        assert type(as_int.sanitized_value["retry_attempts"]) is int
+        assert type(as_bool.sanitized_value["retry_attempts"]) is bool
+
+    def test_no_warnings_is_none(self):
+        """Test that results without warnings do not allocate a list."""
+        result = ConfigValidator.validate_config({
+            "download_path": tempfile.gettempdir(),
+            "quality": "best",
+        })
+        assert result.warnings is None
+
+        result.add_warning("first")
+        assert result.warnings == ["first"]
+
+    def test_validate_single_checks_only_its_key(self):
+        """Test that single-value validation ignores other required keys."""
+        assert ConfigValidator.validate_single("theme", "dark").is_valid
+
+        clamped = ConfigValidator.validate_single("retry_attempts", 99)
+        assert clamped.is_valid
+        assert clamped.sanitized_value == 10
+
+        bad_type = ConfigValidator.validate_single("retry_attempts", "many")
+        assert not bad_type.is_valid
+
+    def test_missing_required_key(self):
+        """Test that a missing required key is an error."""
+        result = ConfigValidator.validate_config({})
+        assert not result.is_valid
+        assert "download_path" in result.error_message
+
+
 class TestDefaults:
     """Tests for default configuration values."""
 
@@ -1,8 +1,10 @@
 """Unit tests for FormatSelector."""
 
+import threading
+
 import pytest
 from src.core.format_selector import (
-    FormatSelector, FormatInfo, VideoFormats, FormatType
+    FetchExecutor, FormatSelector, FormatInfo, VideoFormats, FormatType
 )
 
 
@@ -212,7 +214,229 @@ class TestFormatSelector:
         best = selector.get_best_format(sample_formats, quality="720p")
         assert best is not None
 
+    def test_get_worst_format(self, selector, sample_formats):
+        """Test getting the lowest quality format."""
+        worst = selector.get_best_format(sample_formats, quality="worst", prefer_audio=False)
+        assert worst.height == 0
+
+    def test_get_best_format_closest_height(self, selector):
+        """Test the closest height wins, ties going to the higher one."""
+        formats = [
+            FormatInfo("a", "mp4", height=480, has_video=True, has_audio=True),
+            FormatInfo("b", "mp4", height=720, fps=30, has_video=True, has_audio=True),
+            FormatInfo("c", "mp4", height=720, fps=60, has_video=True, has_audio=True),
+            FormatInfo("d", "mp4", height=960, has_video=True, has_audio=True),
+        ]
+        assert selector.get_best_format(formats, quality="700p").format_id == "c"
+        assert selector.get_best_format(formats, quality="600p").format_id == "c"
+        assert selector.get_best_format(formats, quality="2160p").format_id == "d"
+        assert selector.get_best_format(formats, quality="144p").format_id == "a"
+
     def test_get_best_format_empty_list(self, selector):
         """Test getting best format from empty list."""
         best = selector.get_best_format([], quality="best")
         assert best is None
+
+
+class TestFormatSelectorFetch:
+    """Tests for FormatSelector.get_formats with a fake yt-dlp."""
+
+    @staticmethod
+    def _extract_info(ydl, url, **kwargs):
+        """Answer like yt-dlp for a single video ('broken' URLs fail)."""
+        if 'broken' in url:
+            raise RuntimeError("unavailable")
+        return {
+            'id': 'dQw4w9WgXcQ',
+            'title': 'Test Video',
+            'formats': [
+                {'format_id': '22', 'ext': 'mp4', 'vcodec': 'avc1',
+                 'acodec': 'mp4a', 'height': 720},
+            ],
+        }
+
+    @pytest.fixture
+    def fake_ydl(self, fake_youtube_dl):
+        """Stub out yt-dlp and start from an empty cache."""
+        FormatSelector.clear_cache()
+        yield fake_youtube_dl(self._extract_info)
+        FormatSelector.clear_cache()
+
+    def test_get_formats_cached(self, fake_ydl):
+        """Test repeated fetches of a URL reuse the first result."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        first = FormatSelector().get_formats(url)
+        second = FormatSelector().get_formats(url)
+
+        assert first.error is None
+        assert second is first
+        assert fake_ydl.calls == [url]
+
+    def test_get_formats_error_not_cached(self, fake_ydl):
+        """Test failed fetches are retried on the next call."""
+        url = "https://www.youtube.com/watch?v=broken00000"
+        selector = FormatSelector()
+
+        assert selector.get_formats(url).error == "unavailable"
+        assert selector.get_formats(url).error == "unavailable"
+        assert len(fake_ydl.calls) == 2
+
+    def test_youtubedl_shared_between_fetches(self, fake_ydl):
+        """Test one YoutubeDL instance serves every selector on a thread."""
+        FormatSelector().get_formats("https://www.youtube.com/watch?v=aaaaaaaaaaa")
+        FormatSelector().get_formats("https://www.youtube.com/watch?v=bbbbbbbbbbb")
+
+        assert len(fake_ydl.calls) == 2
+        assert len(fake_ydl.instances) == 1
+
+    def test_fetches_on_other_threads_do_not_wait(self, fake_ydl, fake_youtube_dl):
+        """Test a slow fetch does not hold up a fetch on another thread."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_extract_info(ydl, url, **kwargs):
+            if 'slow' in url:
+                started.set()
+                release.wait(5)
+            return self._extract_info(ydl, url, **kwargs)
+
+        fake_youtube_dl(slow_extract_info)
+        slow = threading.Thread(
+            target=FormatSelector().get_formats,
+            args=("https://www.youtube.com/watch?v=slowslowslo",)
+        )
+        slow.start()
+        try:
+            assert started.wait(5)
+            result = FormatSelector().get_formats(
+                "https://www.youtube.com/watch?v=fffffffffff"
+            )
+            assert result.error is None
+            assert len(fake_ydl.instances) == 2
+        finally:
+            release.set()
+            slow.join(5)
+
+    def test_get_formats_async_runs_on_executor(self, fake_ydl):
+        """Test async fetches run on the shared executor."""
+        results = []
+        thread_names = []
+
+        def on_complete(result):
+            thread_names.append(threading.current_thread().name)
+            results.append(result)
+
+        handle = FormatSelector().get_formats_async(
+            "https://www.youtube.com/watch?v=ccccccccccc", on_complete
+        )
+        handle.result(timeout=5)
+
+        assert results[0].title == "Test Video"
+        assert thread_names[0].startswith("format-fetch")
+
+    def test_get_formats_async_daemon_worker(self, fake_ydl):
+        """Test async fetches run on daemon threads, so they never block exit."""
+        daemon = []
+
+        handle = FormatSelector().get_formats_async(
+            "https://www.youtube.com/watch?v=eeeeeeeeeee",
+            lambda result: daemon.append(threading.current_thread().daemon)
+        )
+        handle.result(timeout=5)
+
+        assert daemon == [True]
+
+    def test_get_formats_async_cancelled(self, fake_ydl, fake_youtube_dl):
+        """Test a cancelled fetch does not call its completion callback."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_extract_info(ydl, url, **kwargs):
+            started.set()
+            release.wait(5)
+            return self._extract_info(ydl, url, **kwargs)
+
+        fake_youtube_dl(slow_extract_info)
+        results = []
+
+        handle = FormatSelector().get_formats_async(
+            "https://www.youtube.com/watch?v=ddddddddddd", results.append
+        )
+        assert started.wait(5)
+        handle.cancel()
+        release.set()
+        handle.result(timeout=5)
+
+        assert handle.cancelled
+        assert results == []
+
+    def test_get_formats_cache_ignores_share_params(self, fake_ydl):
+        """Test copies of a link differing only in tracking/share details hit the cache."""
+        selector = FormatSelector()
+        selector.get_formats("https://www.youtube.com/watch?v=dQw4w9WgXcQ&si=abc")
+        selector.get_formats("https://youtu.be/dQw4w9WgXcQ?t=42")
+        selector.get_formats("https://example.com/video?id=1&utm_source=x")
+        selector.get_formats("https://EXAMPLE.com/video?id=1#comments")
+
+        assert len(fake_ydl.calls) == 2
+
+
+class TestFetchExecutor:
+    """Tests for the daemon fetch pool."""
+
+    def test_results_and_exceptions(self):
+        """Test submitted calls report their result or exception."""
+        executor = FetchExecutor(max_workers=2, thread_name_prefix="test-fetch")
+
+        def fail():
+            raise ValueError("boom")
+
+        assert executor.submit(lambda a, b: a + b, 2, 3).result(timeout=5) == 5
+        with pytest.raises(ValueError):
+            executor.submit(fail).result(timeout=5)
+
+    def test_bounded_and_queued_cancel(self):
+        """Test the pool never exceeds max_workers and drops cancelled calls."""
+        executor = FetchExecutor(max_workers=2, thread_name_prefix="test-fetch")
+        release = threading.Event()
+        running = []
+        ran = []
+
+        def block(i):
+            running.append(threading.current_thread().name)
+            release.wait(5)
+            ran.append(i)
+
+        futures = [executor.submit(block, i) for i in range(4)]
+        futures[3].cancel()
+        release.set()
+        for future in futures[:3]:
+            future.result(timeout=5)
+
+        assert sorted(ran) == [0, 1, 2]
+        assert futures[3].cancelled()
+        assert executor._num_threads == 2
+        assert len(set(running)) <= 2
+
+
+class TestFormatInfoDisplayCache:
+    """Tests for cached FormatInfo display strings."""
+
+    def test_display_strings_cached(self):
+        """Test display strings are computed once and kept."""
+        info = FormatInfo("22", "mp4", height=720, has_video=True, has_audio=True,
+                          filesize=80 * 1024 * 1024, tbr=1500)
+
+        assert info.quality_label == "720p"
+        assert info.size_str == "80.0 MB"
+        assert info.bitrate_str == "1.5 Mbps"
+        assert info._quality_label == "720p"
+        assert info._size_str == "80.0 MB"
+
+    def test_cache_ignored_by_equality(self):
+        """Test cached strings do not affect equality."""
+        a = FormatInfo("22", "mp4", height=720, has_video=True)
+        b = FormatInfo("22", "mp4", height=720, has_video=True)
+        a.quality_label
+        assert a == b
+        assert not hasattr(a, '__dict__')
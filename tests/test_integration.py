@@ -9,9 +9,11 @@ import os
 import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
 
 from src.core.queue_manager import QueueManager, VideoItem, VideoStatus
-from src.core.download_manager import DownloadManager, DownloadOptions
+from src.core.download_manager import DownloadManager, DownloadOptions, DownloadState
 from src.config.config_manager import ConfigManager
 from src.core.format_selector import FormatSelector
 from src.core.playlist_filter import PlaylistFilter
@@ -62,6 +64,168 @@ class TestQueueDownloadIntegration:
         next_video2 = queue_manager.get_next_queued()
         assert next_video2.id != next_video.id
 
+    def test_download_loop_wakes_on_enqueue(self, queue_manager, download_manager):
+        """Test that queued items are dispatched without polling delay."""
+        started = threading.Event()
+        download_manager._download_video = lambda video, slot: started.set() or True
+
+        download_manager.start()
+        try:
+            # Let the loop go idle on the condition first
+            time.sleep(0.1)
+            queue_manager.add(VideoItem(url="https://youtube.com/watch?v=wake"))
+            assert started.wait(timeout=1.0)
+        finally:
+            download_manager.stop()
+
+    def test_download_slots_limit_concurrency(self, queue_manager, download_manager):
+        """Test that a finished download hands its slot to the next video."""
+        release = threading.Event()
+        started = []
+
+        def fake_download(video, slot):
+            started.append(video.url)
+            release.wait(timeout=2.0)
+            return True
+
+        download_manager.max_concurrent = 1
+        download_manager._download_video = fake_download
+        queue_manager.add(VideoItem(url="https://youtube.com/watch?v=one"))
+        queue_manager.add(VideoItem(url="https://youtube.com/watch?v=two"))
+
+        download_manager.start()
+        try:
+            time.sleep(0.2)
+            assert len(started) == 1
+
+            release.set()
+            deadline = time.monotonic() + 2.0
+            while len(started) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(started) == 2
+        finally:
+            download_manager.stop()
+
+    def test_completions_handled_by_reaper(self, queue_manager, download_manager):
+        """Test that completion handling runs on the reaper thread."""
+        done = threading.Event()
+        threads = []
+
+        def on_complete(video, success):
+            threads.append(threading.current_thread())
+            if len(threads) == 3:
+                done.set()
+
+        download_manager.max_concurrent = 3
+        download_manager._download_video = lambda video, slot: True
+        download_manager.on_complete = on_complete
+        for i in range(3):
+            queue_manager.add(VideoItem(url=f"https://youtube.com/watch?v=r{i}"))
+
+        download_manager.start()
+        try:
+            assert done.wait(timeout=2.0)
+            assert set(threads) == {download_manager._reaper_thread}
+            assert all(
+                v.status == VideoStatus.COMPLETED for v in queue_manager.get_all()
+            )
+        finally:
+            download_manager.stop()
+
+    def test_stop_keeps_finished_and_requeues_aborted(
+        self, queue_manager, download_manager
+    ):
+        """Test that stop() records finished downloads and requeues the rest."""
+        finish = threading.Event()
+        running = threading.Barrier(3)
+
+        def fake_download(video, slot):
+            running.wait(timeout=2.0)
+            if video.url.endswith("done"):
+                finish.wait(timeout=2.0)
+                return True
+            while not download_manager._stop_event.is_set():
+                time.sleep(0.01)
+            return False
+
+        download_manager._download_video = fake_download
+        download_manager.on_complete = lambda video, ok: None
+        done = VideoItem(url="https://youtube.com/watch?v=done")
+        aborted = VideoItem(url="https://youtube.com/watch?v=aborted")
+        queue_manager.add(done)
+        queue_manager.add(aborted)
+
+        download_manager.start()
+        running.wait(timeout=2.0)
+
+        # Let one download finish as the stop request comes in
+        download_manager.on_state_change = (
+            lambda state: finish.set() if state.name == "STOPPING" else None
+        )
+        download_manager.stop()
+
+        assert queue_manager.get(done.id).status == VideoStatus.COMPLETED
+        assert queue_manager.get(aborted.id).status == VideoStatus.QUEUED
+
+    def test_stop_without_blocking(self, queue_manager, download_manager):
+        """Test that stop(block=False) returns while downloads wind down."""
+        running = threading.Event()
+        release = threading.Event()
+        stopped = threading.Event()
+
+        def fake_download(video, slot):
+            running.set()
+            release.wait(timeout=2.0)
+            return False
+
+        download_manager._download_video = fake_download
+        video = VideoItem(url="https://youtube.com/watch?v=slow")
+        queue_manager.add(video)
+
+        download_manager.start()
+        assert running.wait(timeout=2.0)
+        download_manager.stop(block=False, on_stopped=stopped.set)
+
+        assert download_manager.state == DownloadState.STOPPING
+        assert not stopped.is_set()
+        download_manager.start()
+        assert download_manager.state == DownloadState.STOPPING
+
+        release.set()
+        assert stopped.wait(timeout=5.0)
+        assert download_manager.state == DownloadState.IDLE
+        assert queue_manager.get(video.id).status == VideoStatus.QUEUED
+
+    def test_executor_reused_across_runs(self, download_manager):
+        """Test that stop/start keeps the same thread pool."""
+        download_manager.start()
+        executor = download_manager._executor
+        download_manager.stop()
+
+        download_manager.start()
+        assert download_manager._executor is executor
+        download_manager.stop()
+
+        download_manager.max_concurrent = 3
+        download_manager.start()
+        assert download_manager._executor is not executor
+
+        download_manager.close()
+        assert download_manager._executor is None
+
+    def test_queued_callback_on_retry(self, queue_manager):
+        """Test that queued listeners fire when an item is re-queued."""
+        calls = []
+        queue_manager.add_queued_callback(lambda: calls.append(1))
+
+        video = VideoItem(url="https://youtube.com/watch?v=retry")
+        queue_manager.add(video)
+        queue_manager.update_status(video.id, VideoStatus.ERROR, "boom")
+        assert len(calls) == 1
+
+        assert queue_manager.retry_single(video.id)
+        assert len(calls) == 2
+
     def test_concurrent_queue_access(self, queue_manager):
         """Test concurrent access to queue."""
         errors = []
@@ -103,6 +267,457 @@ class TestQueueDownloadIntegration:
         assert len(queue_manager) == 50  # 5 workers * 10 videos
 
 
+class TestDownloadManagerExtraction:
+    """Test info extraction with a stubbed yt-dlp."""
+
+    @staticmethod
+    def _extract_info(ydl, url, **kwargs):
+        """Answer like yt-dlp, listing a playlist for URLs ending in 'list'."""
+        if url.endswith('list'):
+            return {
+                'title': 'My List',
+                'entries': [
+                    {'url': 'https://youtube.com/watch?v=a'},
+                    None,
+                    {'url': 'https://youtube.com/watch?v=b'},
+                ],
+            }
+        return {'webpage_url': url, 'title': url[-1]}
+
+    @pytest.fixture
+    def fake_ydl(self, fake_youtube_dl):
+        """Stub out yt-dlp."""
+        return fake_youtube_dl(self._extract_info)
+
+    @pytest.fixture
+    def manager(self, temp_dir, fake_ydl):
+        """Create DownloadManager with yt-dlp stubbed out."""
+        return DownloadManager(QueueManager(), DownloadOptions(output_path=temp_dir))
+
+    def test_playlist_entries_resolved(self, manager, fake_ydl):
+        """Test that flat playlist entries are resolved in order."""
+        videos = manager.extract_info('https://youtube.com/list')
+
+        assert [v['title'] for v in videos] == ['a', 'b']
+        assert [v['playlist_index'] for v in videos] == [1, 3]
+        assert all(v['playlist_title'] == 'My List' for v in videos)
+        listing = fake_ydl.instances[fake_ydl.calls.index('https://youtube.com/list')]
+        assert listing.params['extract_flat'] == 'in_playlist'
+
+    def test_extract_info_batch_preserves_order(self, manager):
+        """Test batch extraction returns one result per URL in order."""
+        urls = [f'https://youtube.com/watch?v={c}' for c in 'xyz']
+        results = manager.extract_info_batch(urls)
+
+        assert [r[0]['title'] for r in results] == ['x', 'y', 'z']
+        assert manager.extract_info_batch([]) == []
+
+
+class TestDownloadManagerOptions:
+    """Test yt-dlp option building."""
+
+    @pytest.fixture
+    def fake_ydl(self, fake_youtube_dl):
+        """Stub out yt-dlp, recording (URL, output template) per download."""
+        downloads = []
+
+        def extract_info(ydl, url, **kwargs):
+            downloads.append((url, ydl.params['outtmpl']['default']))
+            return {'requested_downloads': [{'filepath': url + '.mp4'}]}
+
+        fake = fake_youtube_dl(extract_info)
+        fake.downloads = downloads
+        return fake
+
+    def test_options_template_built_once(self, temp_dir, monkeypatch):
+        """Test that invariant options are built once per run."""
+        cookies = os.path.join(temp_dir, "cookies.txt")
+        open(cookies, "w").close()
+        options = DownloadOptions(
+            output_path=temp_dir, quality="720p", cookies_file=cookies
+        )
+        manager = DownloadManager(QueueManager(), options)
+
+        checks = []
+        real_exists = os.path.exists
+        monkeypatch.setattr(
+            "src.core.download_manager.os.path.exists",
+            lambda p: checks.append(p) or real_exists(p)
+        )
+
+        template = manager._build_ydl_options_template()
+
+        assert checks == [cookies]
+        assert template['format'] == DownloadManager.QUALITY_MAP['720p']
+        assert template['cookiefile'] == cookies
+        assert 'outtmpl' not in template
+        assert template['http_chunk_size'] == 10 * 1024 * 1024
+        assert template['buffersize'] == 1024 * 1024
+
+    def test_youtubedl_reused_per_thread(self, temp_dir, fake_ydl):
+        """Test that a worker thread reuses its YoutubeDL across videos."""
+        manager = DownloadManager(QueueManager(), DownloadOptions(output_path=temp_dir))
+
+        assert manager._download_video(VideoItem(url="u1", title="One")) is True
+        assert manager._download_video(
+            VideoItem(url="u2", playlist_title="List", playlist_index=2)
+        ) is True
+
+        assert len(fake_ydl.instances) == 1
+        ydl = fake_ydl.instances[0]
+        assert fake_ydl.downloads == [
+            ("u1", os.path.join(temp_dir, '%(title)s.%(ext)s')),
+            ("u2", os.path.join(temp_dir, 'List', '002 - %(title)s.%(ext)s')),
+        ]
+        assert ydl.params['progress_hooks'] == [manager._thread_progress_hook]
+
+        # New options on the next run replace the instance
+        manager._opts_generation += 1
+        manager._download_video(VideoItem(url="u3"))
+        assert len(fake_ydl.instances) == 2
+        assert ydl.closed
+
+        manager.close()
+        assert fake_ydl.instances[1].closed
+
+    def test_update_options_applies_to_next_video(self, temp_dir, fake_ydl):
+        """Test that options changed mid-run reach the next download."""
+        options = DownloadOptions(output_path=temp_dir, quality="best")
+        manager = DownloadManager(QueueManager(), options)
+        manager.update_options()
+        manager._download_video(VideoItem(url="u1"))
+
+        options.quality = "720p"
+        options.include_subtitles = True
+        manager.update_options()
+        manager._download_video(VideoItem(url="u2"))
+
+        first, second = fake_ydl.instances
+        assert first.closed
+        assert first.params['format'] == DownloadManager.QUALITY_MAP['best']
+        assert second.params['format'] == DownloadManager.QUALITY_MAP['720p']
+        assert second.params['writesubtitles'] is True
+        manager.close()
+
+    def test_post_processing_runs_on_separate_pool(self, temp_dir, fake_ydl):
+        """Test that FFmpeg post-processing is handed off after download."""
+        queue = QueueManager()
+        video = VideoItem(url="https://youtube.com/watch?v=pp")
+        queue.add(video)
+        manager = DownloadManager(
+            queue, DownloadOptions(output_path=temp_dir, add_metadata=True)
+        )
+        statuses = []
+        done = threading.Event()
+        queue.on_item_updated = lambda v: statuses.append(v.status)
+        manager.on_complete = lambda v, ok: done.set()
+
+        manager.start()
+        try:
+            assert done.wait(timeout=2.0)
+        finally:
+            manager.stop()
+
+        assert 'postprocessors' not in manager._ydl_opts_template
+        assert VideoStatus.POST_PROCESSING in statuses
+        assert queue.get(video.id).status == VideoStatus.COMPLETED
+        pp_ydl = [y for y in fake_ydl.instances if 'postprocessors' in y.params]
+        assert pp_ydl[0].post_processed == [video.url + '.mp4']
+        manager.close()
+
+    def test_playlist_folder_created_once(self, temp_dir, monkeypatch):
+        """Test that playlist folders are sanitized and created once."""
+        manager = DownloadManager(QueueManager(), DownloadOptions(output_path=temp_dir))
+        made = []
+        real_makedirs = os.makedirs
+        monkeypatch.setattr(
+            "src.core.download_manager.os.makedirs",
+            lambda p, exist_ok=False: made.append(p) or real_makedirs(p, exist_ok=exist_ok)
+        )
+
+        templates = [
+            manager._get_output_template(VideoItem(
+                url=f"u{i}", playlist_title="My: List", playlist_index=i
+            ))
+            for i in (1, 2)
+        ]
+
+        folder = os.path.join(temp_dir, "My_ List")
+        assert made == [folder]
+        assert os.path.isdir(folder)
+        assert templates[1] == os.path.join(folder, "002 - %(title)s.%(ext)s")
+
+    def test_non_retryable_error_not_retried(self, temp_dir, fake_youtube_dl):
+        """Test that permanent errors return without retrying."""
+        import src.core.download_manager as dm
+
+        def extract_info(ydl, url, **kwargs):
+            raise dm.yt_dlp.utils.DownloadError("ERROR: Private Video")
+
+        attempts = fake_youtube_dl(extract_info).calls
+        manager = DownloadManager(QueueManager(), DownloadOptions(output_path=temp_dir))
+
+        result = manager._download_video(VideoItem(url="u", title="t"))
+
+        assert result == "ERROR: Private Video"
+        assert len(attempts) == 1
+
+    def test_retry_backoff_capped_with_jitter(
+        self, temp_dir, monkeypatch, fake_youtube_dl
+    ):
+        """Test that retry delays are jittered and never exceed the cap."""
+        import src.core.download_manager as dm
+
+        def extract_info(ydl, url, **kwargs):
+            raise dm.yt_dlp.utils.DownloadError("HTTP Error 503")
+
+        fake_youtube_dl(extract_info)
+        sleeps = []
+        monkeypatch.setattr(dm.time, 'sleep', sleeps.append)
+        monkeypatch.setattr(dm.random, 'random', lambda: 0.999)
+
+        options = DownloadOptions(
+            output_path=temp_dir, max_retries=4, retry_delay=2.0, retry_delay_max=5.0
+        )
+        manager = DownloadManager(QueueManager(), options)
+
+        assert manager._download_video(VideoItem(url="u", title="t")) == "HTTP Error 503"
+        assert [round(d, 2) for d in sleeps] == [3.0, 5.0, 5.0, 5.0]
+        assert all(d <= options.retry_delay_max for d in sleeps)
+
+
+class TestDownloadManagerAutoConcurrency:
+    """Test throughput-driven concurrency tuning."""
+
+    @pytest.fixture
+    def manager(self, temp_dir):
+        """Create a manager with auto concurrency and queued work."""
+        queue = QueueManager()
+        queue.add(VideoItem(url="https://youtube.com/watch?v=pending"))
+        options = DownloadOptions(
+            output_path=temp_dir, auto_concurrency=True, max_auto_concurrent=4
+        )
+        manager = DownloadManager(queue, options, max_concurrent=2)
+        manager._tune_last_ts = 0.0
+        return manager
+
+    def _sample(self, manager, now, total_bytes):
+        manager._bytes_total = total_bytes
+        manager._autotune(now)
+
+    def test_grows_while_throughput_improves(self, manager):
+        """Test that the limit climbs while more slots pay off."""
+        assert manager.concurrency_limit == 2
+
+        self._sample(manager, 5.0, 5_000)      # baseline -> probe up
+        assert manager.concurrency_limit == 3
+        self._sample(manager, 10.0, 15_000)    # 1000 -> 2000 B/s
+        assert manager.concurrency_limit == 4
+        self._sample(manager, 15.0, 30_000)    # capped at max_auto_concurrent
+        assert manager.concurrency_limit == 4
+
+    def test_backs_off_when_throughput_drops(self, manager):
+        """Test that a throughput drop reverses direction and retires a slot."""
+        self._sample(manager, 5.0, 10_000)     # 2000 B/s, probe up to 3
+        self._sample(manager, 10.0, 15_000)    # 1000 B/s, worse -> back off
+        assert manager.concurrency_limit == 2
+
+        # The retired slot goes to the spare pool instead of back in use
+        slot = manager._slots.get()
+        manager._release_slot(manager._slots, slot)
+        assert slot in manager._spare_slots
+
+    def test_holds_on_plateau(self, manager):
+        """Test that small throughput changes leave the limit alone."""
+        self._sample(manager, 5.0, 5_000)
+        self._sample(manager, 10.0, 10_200)
+        assert manager.concurrency_limit == 3
+
+    def test_pause_resume_keeps_limit(self, manager):
+        """Test that pausing and resuming does not ratchet the limit up."""
+        self._sample(manager, 5.0, 5_000)      # baseline -> probe up to 3
+        assert manager.concurrency_limit == 3
+
+        for cycle in range(3):
+            start = 10.0 + cycle * 20.0
+            total = manager._bytes_total
+            manager._pause_event.clear()
+            self._sample(manager, start, total)
+            manager._pause_event.set()
+            self._sample(manager, start + 5.0, total + 2_000)   # straddles the resume
+            self._sample(manager, start + 10.0, total + 7_000)  # re-seeds the baseline
+            self._sample(manager, start + 15.0, total + 12_000) # same rate -> hold
+            assert manager.concurrency_limit == 3
+
+    def test_disabled_by_default(self, temp_dir):
+        """Test that without auto concurrency only max_concurrent slots exist."""
+        manager = DownloadManager(
+            QueueManager(), DownloadOptions(output_path=temp_dir), max_concurrent=2
+        )
+        assert manager.concurrency_limit == 2
+        assert manager._spare_slots == []
+        assert len(manager._slot_dirty) == 2
+
+
+class TestDownloadManagerConcurrencyLimit:
+    """Test changing max_concurrent on a live manager."""
+
+    @pytest.fixture
+    def manager(self, temp_dir):
+        """Create a manager allowing three downloads."""
+        return DownloadManager(
+            QueueManager(), DownloadOptions(output_path=temp_dir), max_concurrent=3
+        )
+
+    def _free_slots(self, manager):
+        """Get the free slot indexes, leaving them free."""
+        slots = []
+        while True:
+            try:
+                slots.append(manager._slots.get_nowait())
+            except Empty:
+                break
+        for slot in slots:
+            manager._slots.put(slot)
+        return slots
+
+    def test_lowering_withholds_free_slots_at_once(self, manager):
+        """Test that free slots are withheld as soon as the limit drops."""
+        manager.max_concurrent = 1
+
+        assert manager.max_concurrent == 1
+        assert manager.concurrency_limit == 1
+        assert len(self._free_slots(manager)) == 1
+
+        manager.max_concurrent = 2
+        assert manager.concurrency_limit == 2
+        assert len(self._free_slots(manager)) == 2
+
+    def test_lowering_retires_busy_slots_as_they_finish(self, manager):
+        """Test that busy slots beyond the new limit are not handed out again."""
+        busy = [manager._slots.get() for _ in range(3)]
+
+        manager.max_concurrent = 1
+        for slot in busy:
+            manager._release_slot(manager._slots, slot)
+
+        assert self._free_slots(manager) == [busy[2]]
+        assert sorted(manager._spare_slots) == sorted(busy[:2])
+
+    def test_slot_taken_by_loop_is_retired(self, manager):
+        """Test that a slot held while waiting for work honours a lower limit."""
+        held = [manager._slots.get() for _ in range(3)]
+        manager.max_concurrent = 2
+
+        assert manager._retire_slot(manager._slots, held[0]) is True
+        assert manager._retire_slot(manager._slots, held[1]) is False
+
+    def test_raising_past_capacity_adds_slots_and_threads(self, manager, monkeypatch):
+        """Test that raising the limit mid-run allocates slots and grows the pool."""
+        manager._executor = ThreadPoolExecutor(max_workers=3)
+        manager._executor_workers = 3
+        monkeypatch.setattr(manager, '_download_video', lambda video, slot: True)
+
+        manager.max_concurrent = 5
+
+        assert manager.concurrency_limit == 5
+        assert len(manager._slot_progress) == 5
+        assert len(manager._slot_dirty) == 5
+        assert sorted(self._free_slots(manager)) == [0, 1, 2, 3, 4]
+
+        video = VideoItem(url="https://youtube.com/watch?v=more")
+        manager.queue.add(video)
+        slot = manager._slots.get()
+        manager._start_download(video, manager._slots, slot)
+
+        assert manager._executor_workers == 5
+        manager.close()
+
+
+class TestDownloadManagerProgress:
+    """Test progress hook handling."""
+
+    def test_progress_ticks_coalesced(self, temp_dir):
+        """Test that rapid ticks are reported once per emit, finish at once."""
+        queue = QueueManager()
+        video = VideoItem(url="https://youtube.com/watch?v=fast")
+        queue.add(video)
+        manager = DownloadManager(queue, DownloadOptions(output_path=temp_dir))
+
+        events = []
+        manager.on_progress = lambda p: events.append((p.status, p.progress))
+
+        for downloaded in range(1, 51):
+            manager._progress_hook(
+                {'status': 'downloading', 'total_bytes': 100,
+                 'downloaded_bytes': downloaded},
+                video.id
+            )
+        assert events == []
+
+        manager._emit_progress()
+        manager._emit_progress()
+        assert events == [('downloading', 50.0)]
+        assert queue.get(video.id).progress == 50.0
+
+        manager._progress_hook({'status': 'finished'}, video.id)
+        assert events[-1] == ('finished', 100.0)
+        assert queue.get(video.id).progress == 100.0
+
+    def test_progress_batch_callback(self, temp_dir):
+        """Test that one batch callback covers all updated slots."""
+        manager = DownloadManager(
+            QueueManager(), DownloadOptions(output_path=temp_dir), max_concurrent=2
+        )
+        batches = []
+        manager.on_progress_batch = lambda b: batches.append(
+            [(p.video_id, p.progress) for p in b]
+        )
+
+        tick = {'status': 'downloading', 'total_bytes': 200, 'downloaded_bytes': 50}
+        manager._progress_hook(tick, "first", slot=0)
+        manager._progress_hook(tick, "second", slot=1)
+        manager._emit_progress()
+
+        assert batches == [[("first", 25.0), ("second", 25.0)]]
+
+    def test_progress_object_reused_per_slot(self, temp_dir):
+        """Test that each slot reuses its own progress object."""
+        manager = DownloadManager(
+            QueueManager(), DownloadOptions(output_path=temp_dir), max_concurrent=2
+        )
+        seen = []
+        manager.on_progress = seen.append
+
+        tick = {'status': 'downloading', 'total_bytes': 100, 'downloaded_bytes': 1}
+        for _ in range(2):
+            manager._progress_hook(tick, "first", slot=0)
+            manager._progress_hook(tick, "second", slot=1)
+            manager._emit_progress()
+
+        assert seen[0] is seen[2]
+        assert seen[1] is seen[3]
+        assert seen[0] is not seen[1]
+
+    def test_emitter_reports_while_running(self, temp_dir):
+        """Test that the emitter thread delivers progress during a run."""
+        queue = QueueManager()
+        manager = DownloadManager(queue, DownloadOptions(output_path=temp_dir))
+        reported = threading.Event()
+        manager.on_progress = lambda p: reported.set()
+
+        manager.start()
+        try:
+            manager._progress_hook(
+                {'status': 'downloading', 'total_bytes': 10, 'downloaded_bytes': 5},
+                "vid"
+            )
+            assert reported.wait(timeout=1.0)
+        finally:
+            manager.stop()
+        assert manager._emitter_thread is None
+
+
 class TestConfigIntegration:
     """Test configuration integration with other components."""
 
@@ -354,3 +969,47 @@ class TestEndToEndWorkflow:
 
         completed_list = queue.get_by_status(VideoStatus.COMPLETED)
         assert len(completed_list) == 1
+
+
+class TestCorePackageImports:
+    """Test the lazy-loading src.core package."""
+
+    def _run(self, code):
+        """Run code in a fresh interpreter from the project root."""
+        import subprocess
+        import sys
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout.strip()
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing src.core loads no submodules."""
+        output = self._run(
+            "import sys, src.core; "
+            "print('src.core.post_processor' in sys.modules)"
+        )
+        assert output == "False"
+
+    def test_attribute_access_loads_only_its_module(self):
+        """Test that accessing a name imports just its submodule."""
+        output = self._run(
+            "import sys, src.core; src.core.PostProcessor; "
+            "print('src.core.post_processor' in sys.modules, "
+            "'src.core.download_manager' in sys.modules)"
+        )
+        assert output == "True False"
+
+    def test_public_names_resolve(self):
+        """Test that every name in __all__ resolves."""
+        import src.core
+
+        for name in src.core.__all__:
+            assert getattr(src.core, name) is not None
+
+        with pytest.raises(AttributeError):
+            src.core.NotAName
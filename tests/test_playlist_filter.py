@@ -1,5 +1,7 @@
 """Unit tests for PlaylistFilter."""
 
+import threading
+
 import pytest
 from src.core.playlist_filter import (
     PlaylistFilter, PlaylistInfo, PlaylistVideoInfo
@@ -54,6 +56,38 @@ class TestPlaylistVideoInfo:
         )
         assert info.formatted_date == "invalid"
 
+    def test_formatted_date_out_of_range(self):
+        """Test an 8-digit value that is not a date is shown as-is."""
+        info = PlaylistVideoInfo(
+            index=1, video_id="id", url="url", title="Test",
+            upload_date="20241399"
+        )
+        assert info.formatted_date == "20241399"
+
+    def test_none_title(self):
+        """Test a missing title does not break creation or search."""
+        info = PlaylistVideoInfo(
+            index=1, video_id="id", url="url", title=None
+        )
+        assert info.title is None
+        assert PlaylistFilter().search_by_title([info], "test") == []
+
+    def test_formatted_date_impossible_day(self):
+        """Test a day that does not exist in its month is shown as-is."""
+        info = PlaylistVideoInfo(
+            index=1, video_id="id", url="url", title="Test",
+            upload_date="20230231"
+        )
+        assert info.formatted_date == "20230231"
+
+    def test_formatted_date_none(self):
+        """Test a missing upload date."""
+        info = PlaylistVideoInfo(
+            index=1, video_id="id", url="url", title="Test",
+            upload_date=None
+        )
+        assert info.formatted_date == "Unknown"
+
     def test_formatted_views_millions(self):
         """Test formatted views in millions."""
         info = PlaylistVideoInfo(
@@ -103,6 +137,15 @@ class TestPlaylistInfo:
         info = PlaylistInfo("pl", videos=videos)
         assert info.total_duration == 1050  # 300 + 600 + 150
 
+    def test_total_duration_invalidate(self):
+        """Test total duration is recomputed after invalidate_cache."""
+        info = PlaylistInfo("pl", videos=[PlaylistVideoInfo(1, "v1", "url1", "Video 1", duration=300)])
+        assert info.total_duration == 300
+
+        info.videos.append(PlaylistVideoInfo(2, "v2", "url2", "Video 2", duration=60))
+        info.invalidate_cache()
+        assert info.total_duration == 360
+
     def test_total_duration_str(self):
         """Test total duration string."""
         videos = [
@@ -198,6 +241,13 @@ class TestPlaylistFilter:
         assert len(filtered) == 3
         assert all(v.index >= 3 for v in filtered)
 
+    def test_filter_by_index_with_gaps(self, filter, sample_videos):
+        """Test index filtering on an already filtered (non-contiguous) list."""
+        videos = [sample_videos[0], sample_videos[2], sample_videos[4]]
+        assert [v.index for v in filter.filter_by_index(videos, 2, 4)] == [3]
+        assert [v.index for v in filter.filter_by_index(videos, 3)] == [3, 5]
+        assert filter.filter_by_index(videos, 4, 2) == []
+
     def test_search_by_title(self, filter, sample_videos):
         """Test searching by title."""
         filtered = filter.search_by_title(sample_videos, "Python")
@@ -213,6 +263,11 @@ class TestPlaylistFilter:
         filtered = filter.search_by_title(sample_videos, "python", case_sensitive=True)
         assert len(filtered) == 0  # No exact lowercase match
 
+    def test_search_by_title_casefold(self, filter):
+        """Test case-insensitive search uses full Unicode case folding."""
+        videos = [PlaylistVideoInfo(1, "v1", "url1", "Die Straße")]
+        assert len(filter.search_by_title(videos, "STRASSE")) == 1
+
     def test_get_available_videos(self, filter, sample_videos):
         """Test getting only available videos."""
         available = filter.get_available_videos(sample_videos)
@@ -223,3 +278,130 @@ class TestPlaylistFilter:
         """Test empty search returns all."""
         filtered = filter.search_by_title(sample_videos, "")
         assert len(filtered) == len(sample_videos)
+
+    def test_get_playlist_info_cached(self, filter, fake_youtube_dl):
+        """Test repeated fetches of a playlist reuse the first result."""
+        fake_ydl = fake_youtube_dl(lambda ydl, url, **kwargs: {
+            'title': 'Playlist', 'entries': [{'id': 'v1', 'title': 'One'}]
+        })
+        PlaylistFilter.clear_cache()
+        try:
+            url = "https://www.youtube.com/playlist?list=PLcached"
+            first = filter.get_playlist_info(url)
+            second = PlaylistFilter().get_playlist_info(url)
+        finally:
+            PlaylistFilter.clear_cache()
+
+        assert first.video_count == 1
+        assert second is first
+        assert fake_ydl.calls == [url]
+
+    def test_get_playlist_info_none_title_entry(self, filter, fake_youtube_dl):
+        """Test an entry whose title is None does not fail the fetch."""
+        fake_youtube_dl(lambda ydl, url, **kwargs: {'title': 'Playlist', 'entries': [
+            {'id': 'v1', 'title': None},
+            {'id': 'v2', 'title': 'Two'},
+        ]})
+        PlaylistFilter.clear_cache()
+        try:
+            info = filter.get_playlist_info("https://www.youtube.com/playlist?list=PLnotitle")
+        finally:
+            PlaylistFilter.clear_cache()
+
+        assert info.error is None
+        assert [v.video_id for v in info.videos] == ['v1', 'v2']
+        assert [v.video_id for v in filter.search_by_title(info.videos, "two")] == ['v2']
+
+    def test_hydrate_videos(self, filter, sample_videos, fake_youtube_dl):
+        """Test hydration fills metadata and keeps order and unavailable entries."""
+        def extract_info(ydl, url, process=True, **kwargs):
+            assert process is False
+            return {'id': url, 'title': url.upper(), 'duration': 42, 'view_count': 7}
+
+        fake_youtube_dl(extract_info)
+        hydrated = filter.hydrate_videos(sample_videos, max_workers=4)
+
+        assert [v.index for v in hydrated] == [1, 2, 3, 4, 5]
+        assert [v.title for v in hydrated[:4]] == ["URL1", "URL2", "URL3", "URL4"]
+        assert all(v.duration == 42 and v.url for v in hydrated[:4])
+        assert hydrated[4] is sample_videos[4]
+        assert sample_videos[0].duration == 300
+
+    def test_iter_playlist_info_streams_entries(self, filter, fake_youtube_dl):
+        """Test entries are yielded lazily and URL results are followed."""
+        listed = []
+
+        def entries():
+            for i in range(1, 4):
+                listed.append(i)
+                yield {'id': f'v{i}', 'title': f'Video {i}', 'duration': 60}
+
+        def extract_info(ydl, url, process=True, **kwargs):
+            assert process is False
+            if 'watch' in url:
+                return {'_type': 'url', 'url': 'https://www.youtube.com/playlist?list=PLx'}
+            return {'_type': 'playlist', 'title': 'Playlist', 'entries': entries()}
+
+        instances = fake_youtube_dl(extract_info).instances
+
+        videos = filter.iter_playlist_info("https://www.youtube.com/watch?v=abc&list=PLx")
+        first = next(videos)
+        assert (first.index, first.video_id) == (1, 'v1')
+        assert listed == [1]
+
+        # A fetch on the same thread while the iterator is suspended
+        other = filter._fetch_playlist_info("https://www.youtube.com/playlist?list=PLy")
+        assert other.error is None
+        assert len(instances) == 2
+
+        assert [v.video_id for v in videos] == ['v2', 'v3']
+        assert instances[0].closed
+        assert not instances[1].closed
+
+    def test_combined_filter_matches_chained_filters(self, filter, sample_videos):
+        """Test the single-pass filter gives the same result as chaining."""
+        chained = filter.search_by_title(
+            filter.filter_by_date(
+                filter.filter_by_duration(
+                    filter.filter_by_index(sample_videos, 2, 5), max_seconds=1200
+                ),
+                after="20240110",
+            ),
+            "p",
+        )
+        combined = filter.filter(
+            sample_videos, max_seconds=1200, after="20240110", start=2, end=5, query="p"
+        )
+        assert combined == chained
+        assert [v.index for v in combined] == [2, 3, 4]
+
+    def test_combined_filter_defaults_keep_everything(self, filter, sample_videos):
+        """Test the single-pass filter with no criteria returns all videos."""
+        assert filter.filter(sample_videos) == sample_videos
+
+    def test_get_playlist_info_cancelled(self, filter, fake_youtube_dl):
+        """Test setting the cancel event stops listing and skips the cache."""
+        import itertools
+
+        def extract_info(ydl, url, **kwargs):
+            endless = ({'id': f'v{i}', 'title': 'Video'} for i in itertools.count(1))
+            return {'_type': 'playlist', 'title': 'Endless', 'entries': endless}
+
+        fake_youtube_dl(extract_info)
+        PlaylistFilter.clear_cache()
+
+        cancel = threading.Event()
+        listed = []
+
+        def on_video(video):
+            listed.append(video)
+            if len(listed) == 3:
+                cancel.set()
+
+        result = filter.get_playlist_info(
+            "https://www.youtube.com/playlist?list=PLendless", on_video, cancel
+        )
+
+        assert result.error == "Cancelled"
+        assert len(listed) == 3
+        assert len(PlaylistFilter._info_cache) == 0
@@ -0,0 +1,454 @@
+"""Unit tests for PostProcessor and FFmpegHelper."""
+
+import json
+import os
+
+import pytest
+from src.core import post_processor
+from src.core.post_processor import FFmpegHelper, PostProcessor, PostProcessingOptions
+
+
+def ffmpeg_answers(hwaccels=(), working=()):
+    """Build a fake_subprocess_run handler for FFmpeg capability queries.
+
+    Args:
+        hwaccels: Methods listed by `ffmpeg -hwaccels`
+        working: Encoders, or (encoder, VAAPI device) pairs, whose test
+            encode succeeds
+    """
+    def handler(cmd):
+        if '-hwaccels' in cmd:
+            return 0, "Hardware acceleration methods:\n" + "".join(f"{m}\n" for m in hwaccels)
+        encoder = cmd[cmd.index('-c:v') + 1]
+        device = cmd[cmd.index('-vaapi_device') + 1] if '-vaapi_device' in cmd else None
+        ok = encoder in working or (encoder, device) in working
+        return (0 if ok else 1), b""
+    return handler
+
+
+def encode_commands(calls):
+    """Get the recorded commands that ran a test encode."""
+    return [cmd for cmd in calls if 'lavfi' in cmd]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Forget cached FFmpeg lookups between tests."""
+    PostProcessor.invalidate_path_cache()
+    FFmpegHelper.clear_probe_cache()
+    yield
+    PostProcessor.invalidate_path_cache()
+    FFmpegHelper.clear_probe_cache()
+
+
+class TestHardwareAcceleration:
+    """Tests for the hardware encoder selection."""
+
+    @pytest.fixture
+    def processor(self, tmp_path, monkeypatch):
+        """Create a post-processor whose VAAPI nodes live in tmp_path."""
+        monkeypatch.setattr(PostProcessor, '_VAAPI_DEVICE_GLOB', str(tmp_path / 'renderD*'))
+        return PostProcessor(ffmpeg_path='/opt/ffmpeg/bin/ffmpeg')
+
+    @pytest.fixture
+    def ffmpeg(self, fake_subprocess_run):
+        """Answer FFmpeg capability queries; returns the recorded commands."""
+        return lambda **kwargs: fake_subprocess_run(ffmpeg_answers(**kwargs))
+
+    def convert_args(self, processor, **kwargs):
+        """Get the postprocessor_args for an MP4 conversion."""
+        options = PostProcessingOptions(convert_to="mp4", **kwargs)
+        return processor.get_ydl_opts(options).get('postprocessor_args', {})
+
+    def test_compiled_in_method_without_device_stays_on_cpu(self, processor, ffmpeg):
+        """Test methods FFmpeg lists but cannot use are skipped."""
+        ffmpeg(hwaccels=('cuda', 'vaapi', 'qsv'))
+
+        args = self.convert_args(processor)
+
+        assert 'videoconvertor+ffmpeg_i' not in args
+        assert args['videoconvertor+ffmpeg_o'] == [
+            '-threads', str(PostProcessor.CONVERT_THREADS), '-preset', 'veryfast'
+        ]
+
+    def test_auto_picks_first_working_method(self, processor, ffmpeg):
+        """Test "auto" uses the first method whose test encode works."""
+        ffmpeg(hwaccels=('cuda', 'qsv'), working=('h264_qsv',))
+
+        args = self.convert_args(processor)
+
+        assert args == {
+            'videoconvertor+ffmpeg_i': ['-hwaccel', 'qsv', '-hwaccel_output_format', 'qsv'],
+            'videoconvertor+ffmpeg_o': [
+                '-threads', str(PostProcessor.CONVERT_THREADS), '-c:v', 'h264_qsv'
+            ],
+        }
+
+    def test_cuda_args(self, processor, ffmpeg):
+        """Test the NVENC input and output args."""
+        ffmpeg(hwaccels=('cuda',), working=('h264_nvenc',))
+
+        args = self.convert_args(processor)
+
+        assert args['videoconvertor+ffmpeg_i'] == [
+            '-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'
+        ]
+        assert args['videoconvertor+ffmpeg_o'][2:] == ['-c:v', 'h264_nvenc', '-preset', 'p4']
+
+    def test_vaapi_uses_working_render_node(self, processor, tmp_path, ffmpeg):
+        """Test VAAPI uses the first render node that encodes."""
+        (tmp_path / 'renderD128').touch()
+        (tmp_path / 'renderD129').touch()
+        node = str(tmp_path / 'renderD129')
+        ffmpeg(hwaccels=('vaapi',), working=(('h264_vaapi', node),))
+
+        args = self.convert_args(processor)
+
+        assert args['videoconvertor+ffmpeg_i'] == [
+            '-hwaccel', 'vaapi', '-hwaccel_output_format', 'vaapi', '-vaapi_device', node
+        ]
+        assert args['videoconvertor+ffmpeg_o'][2:] == [
+            '-vf', 'format=nv12|vaapi,hwupload', '-c:v', 'h264_vaapi'
+        ]
+
+    def test_vaapi_without_render_node_stays_on_cpu(self, processor, ffmpeg):
+        """Test VAAPI is skipped without a render node."""
+        calls = ffmpeg(hwaccels=('vaapi',), working=('h264_vaapi',))
+
+        args = self.convert_args(processor)
+
+        assert 'videoconvertor+ffmpeg_i' not in args
+        assert encode_commands(calls) == []
+
+    def test_explicit_method_not_working(self, processor, ffmpeg):
+        """Test a requested method that fails its test encode is not used."""
+        ffmpeg(hwaccels=('cuda', 'qsv'), working=('h264_nvenc',))
+
+        args = self.convert_args(processor, hwaccel="qsv")
+
+        assert 'videoconvertor+ffmpeg_i' not in args
+
+    def test_none_skips_detection(self, processor, ffmpeg):
+        """Test "none" never runs FFmpeg."""
+        calls = ffmpeg(hwaccels=('cuda',), working=('h264_nvenc',))
+
+        args = self.convert_args(processor, hwaccel="none")
+
+        assert 'videoconvertor+ffmpeg_i' not in args
+        assert calls == []
+
+    def test_test_encode_is_cached(self, processor, ffmpeg):
+        """Test the test encode runs once per method."""
+        calls = ffmpeg(hwaccels=('cuda',), working=('h264_nvenc',))
+
+        first = self.convert_args(processor)
+        second = self.convert_args(processor)
+
+        assert first == second
+        assert len(encode_commands(calls)) == 1
+
+
+class TestFFmpegHelperQueries:
+    """Tests for the narrow FFprobe queries."""
+
+    @pytest.fixture
+    def probe_output(self, fake_subprocess_run, monkeypatch):
+        """Make FFprobe print the given stdout; returns the recorded commands."""
+        output = {'stdout': "", 'returncode': 0}
+        monkeypatch.setattr(post_processor, '_which_ffprobe', lambda: '/usr/bin/ffprobe')
+        calls = fake_subprocess_run(lambda cmd: (output['returncode'], output['stdout']))
+
+        def set_output(stdout, returncode=0):
+            output.update(stdout=stdout, returncode=returncode)
+            return calls
+        return set_output
+
+    def test_duration(self, probe_output):
+        """Test the container duration is parsed from the CSV output."""
+        calls = probe_output("212.345000\n")
+        assert FFmpegHelper.get_duration("missing.mp4") == pytest.approx(212.345)
+        assert calls[0][-5:] == [
+            '-show_entries', 'format=duration', '-of', 'csv=p=0', 'missing.mp4'
+        ]
+
+    def test_duration_empty_output(self, probe_output):
+        """Test an empty duration field reads as zero."""
+        probe_output("")
+        assert FFmpegHelper.get_duration("missing.mp4") == 0.0
+
+    def test_duration_not_available(self, probe_output):
+        """Test an unknown ("N/A") duration reads as zero."""
+        probe_output("N/A\n")
+        assert FFmpegHelper.get_duration("missing.mp4") == 0.0
+
+    def test_duration_garbage(self, probe_output):
+        """Test unparseable output gives None."""
+        probe_output("abc\n")
+        assert FFmpegHelper.get_duration("missing.mp4") is None
+
+    def test_duration_ffprobe_failed(self, probe_output):
+        """Test a failed FFprobe run gives None."""
+        probe_output("", returncode=1)
+        assert FFmpegHelper.get_duration("missing.mp4") is None
+
+    def test_duration_without_ffprobe(self, monkeypatch):
+        """Test that no duration is reported without FFprobe."""
+        monkeypatch.setattr(post_processor, '_which_ffprobe', lambda: None)
+        assert FFmpegHelper.get_duration("missing.mp4") is None
+
+    def test_resolution(self, probe_output):
+        """Test the first video stream size is parsed."""
+        probe_output("1920x1080\n")
+        assert FFmpegHelper.get_video_resolution("missing.mp4") == (1920, 1080)
+
+    def test_resolution_extra_fields(self, probe_output):
+        """Test trailing fields after WxH are ignored."""
+        probe_output("1280x720x\n")
+        assert FFmpegHelper.get_video_resolution("missing.mp4") == (1280, 720)
+
+    def test_resolution_repeated_lines(self, probe_output):
+        """Test only the first line of repeated output is used."""
+        probe_output("640x360\n640x360\n")
+        assert FFmpegHelper.get_video_resolution("missing.mp4") == (640, 360)
+
+    def test_resolution_empty_output(self, probe_output):
+        """Test a file without video has no resolution."""
+        probe_output("")
+        assert FFmpegHelper.get_video_resolution("missing.mp4") is None
+
+    def test_resolution_not_available(self, probe_output):
+        """Test an unknown ("N/A") size gives None."""
+        probe_output("N/AxN/A\n")
+        assert FFmpegHelper.get_video_resolution("missing.mp4") is None
+
+    def test_resolution_zero(self, probe_output):
+        """Test a zero size gives None."""
+        probe_output("0x0\n")
+        assert FFmpegHelper.get_video_resolution("missing.mp4") is None
+
+
+class TestFFmpegHelperCache:
+    """Tests for the probe cache and parallel probing."""
+
+    @pytest.fixture
+    def ffprobe_calls(self, fake_subprocess_run, monkeypatch):
+        """Answer FFprobe with JSON naming the probed file; returns the commands."""
+        def handler(cmd):
+            if cmd[-1].endswith("broken.mp4"):
+                return 1, b""
+            return 0, json.dumps({'format': {'filename': cmd[-1]}}).encode()
+
+        monkeypatch.setattr(post_processor, '_which_ffprobe', lambda: '/usr/bin/ffprobe')
+        return fake_subprocess_run(handler)
+
+    @pytest.fixture
+    def media_file(self, tmp_path):
+        """Create a small media file."""
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"0" * 16)
+        return path
+
+    def test_cache_hit_skips_ffprobe(self, ffprobe_calls, media_file):
+        """Test a second probe of an unchanged file does not run FFprobe."""
+        first = FFmpegHelper.get_media_info(str(media_file))
+        second = FFmpegHelper.get_media_info(str(media_file))
+
+        assert first == {'format': {'filename': str(media_file)}}
+        assert second is first
+        assert len(ffprobe_calls) == 1
+
+    def test_changed_mtime_reprobes(self, ffprobe_calls, media_file):
+        """Test a file touched since the last probe is probed again."""
+        FFmpegHelper.get_media_info(str(media_file))
+        st = media_file.stat()
+        os.utime(media_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        FFmpegHelper.get_media_info(str(media_file))
+
+        assert len(ffprobe_calls) == 2
+
+    def test_changed_size_reprobes(self, ffprobe_calls, media_file):
+        """Test a file whose size changed is probed again."""
+        FFmpegHelper.get_media_info(str(media_file))
+        st = media_file.stat()
+        media_file.write_bytes(b"0" * 32)
+        os.utime(media_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        FFmpegHelper.get_media_info(str(media_file))
+
+        assert len(ffprobe_calls) == 2
+
+    def test_narrow_queries_cached_separately(self, ffprobe_calls, media_file,
+                                              fake_subprocess_run):
+        """Test each narrow query has its own cache entry."""
+        fake_subprocess_run(
+            lambda cmd: (0, "12.5\n" if 'format=duration' in cmd else "640x360\n")
+        )
+
+        for _ in range(2):
+            assert FFmpegHelper.get_duration(str(media_file)) == 12.5
+            assert FFmpegHelper.get_video_resolution(str(media_file)) == (640, 360)
+
+        assert len(ffprobe_calls) == 2
+
+    def test_failures_not_cached(self, ffprobe_calls, tmp_path):
+        """Test a failed probe is retried on the next call."""
+        path = tmp_path / "broken.mp4"
+        path.write_bytes(b"")
+
+        assert FFmpegHelper.get_media_info(str(path)) is None
+        assert FFmpegHelper.get_media_info(str(path)) is None
+        assert len(ffprobe_calls) == 2
+
+    def test_probe_many_keeps_input_order(self, ffprobe_calls, tmp_path):
+        """Test probe_many returns one result per path, in order."""
+        paths = []
+        for name in ("a.mp4", "broken.mp4", "c.mp4", "d.mp4"):
+            (tmp_path / name).write_bytes(b"0")
+            paths.append(str(tmp_path / name))
+
+        results = FFmpegHelper.probe_many(paths)
+
+        assert results == [
+            {'format': {'filename': paths[0]}},
+            None,
+            {'format': {'filename': paths[2]}},
+            {'format': {'filename': paths[3]}},
+        ]
+        assert len(ffprobe_calls) == 4
+
+    def test_probe_many_uses_cache(self, ffprobe_calls, media_file):
+        """Test probe_many reuses cached results."""
+        FFmpegHelper.get_media_info(str(media_file))
+        results = FFmpegHelper.probe_many([str(media_file), str(media_file)])
+
+        assert results[0] == results[1] == {'format': {'filename': str(media_file)}}
+        assert len(ffprobe_calls) == 1
+
+
+class TestYdlPostprocessors:
+    """Tests for the yt-dlp postprocessor list and options."""
+
+    METADATA = {'key': 'FFmpegMetadata', 'add_chapters': True, 'add_metadata': True}
+
+    @pytest.fixture
+    def processor(self):
+        """Create a post-processor."""
+        return PostProcessor()
+
+    def keys(self, postprocessors):
+        """Get the postprocessor keys in order."""
+        return [pp['key'] for pp in postprocessors]
+
+    def test_default_options(self, processor):
+        """Test the defaults only add metadata."""
+        assert processor.get_ydl_postprocessors(PostProcessingOptions()) == [self.METADATA]
+
+    def test_all_embeds_in_order(self, processor):
+        """Test embeds run before metadata, in the original order."""
+        options = PostProcessingOptions(embed_subtitles=True, embed_thumbnail=True)
+
+        assert processor.get_ydl_postprocessors(options) == [
+            {'key': 'FFmpegEmbedSubtitle', 'already_have_subtitle': False},
+            {'key': 'EmbedThumbnail', 'already_have_thumbnail': False},
+            self.METADATA,
+        ]
+
+    def test_convert_takes_precedence_over_remux(self, processor):
+        """Test only the conversion runs when both convert and remux are set."""
+        options = PostProcessingOptions(add_metadata=False, convert_to="mkv", remux_video="mp4")
+
+        assert processor.get_ydl_postprocessors(options) == [
+            {'key': 'FFmpegVideoConvertor', 'preferedformat': 'mkv'},
+        ]
+
+    def test_remux_without_convert(self, processor):
+        """Test remux runs when no conversion is requested."""
+        options = PostProcessingOptions(add_metadata=False, remux_video="mp4")
+
+        assert processor.get_ydl_postprocessors(options) == [
+            {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'},
+        ]
+
+    def test_extract_audio_suppresses_convert_and_remux(self, processor):
+        """Test audio extraction replaces video conversion and remux."""
+        options = PostProcessingOptions(
+            extract_audio=True, audio_format="flac", audio_quality="0",
+            convert_to="mkv", remux_video="mp4"
+        )
+
+        assert processor.get_ydl_postprocessors(options) == [
+            self.METADATA,
+            {'key': 'FFmpegExtractAudio', 'preferredcodec': 'flac',
+             'preferredquality': '0', 'nopostoverwrites': False},
+        ]
+
+    def test_sponsorblock_remove(self, processor):
+        """Test segment removal adds SponsorBlock and ModifyChapters."""
+        options = PostProcessingOptions(add_metadata=False, sponsorblock_remove=["sponsor"])
+
+        assert processor.get_ydl_postprocessors(options) == [
+            {'key': 'SponsorBlock', 'when': 'after_filter', 'categories': ['sponsor']},
+            {'key': 'ModifyChapters', 'force_keyframes': False,
+             'remove_sponsor_segments': ['sponsor']},
+        ]
+
+    def test_sponsorblock_remove_takes_precedence_over_mark(self, processor):
+        """Test marking is skipped when segments are removed."""
+        options = PostProcessingOptions(
+            add_metadata=False, sponsorblock_remove=["sponsor"], sponsorblock_mark=["intro"]
+        )
+
+        postprocessors = processor.get_ydl_postprocessors(options)
+
+        assert self.keys(postprocessors) == ['SponsorBlock', 'ModifyChapters']
+        assert postprocessors[0]['categories'] == ['sponsor']
+        assert 'sponsorblock_chapter_title' not in postprocessors[1]
+
+    def test_sponsorblock_mark(self, processor):
+        """Test marking segments as chapters."""
+        options = PostProcessingOptions(add_metadata=False, sponsorblock_mark=["intro"])
+
+        assert processor.get_ydl_postprocessors(options) == [
+            {'key': 'SponsorBlock', 'when': 'after_filter', 'categories': ['intro']},
+            {'key': 'ModifyChapters', 'force_keyframes': False,
+             'sponsorblock_chapter_title': '[SponsorBlock]: %(category_names)l'},
+        ]
+
+    def test_templates_not_mutated(self, processor):
+        """Test changing a returned entry does not leak into later calls."""
+        options = PostProcessingOptions(convert_to="mkv", sponsorblock_mark=["intro"])
+
+        first = processor.get_ydl_postprocessors(options)
+        for pp in first:
+            pp['key'] = 'Changed'
+            pp['extra'] = True
+        default = processor.get_ydl_postprocessors(PostProcessingOptions())
+        default[0]['add_metadata'] = False
+
+        assert self.keys(processor.get_ydl_postprocessors(options)) == [
+            'FFmpegMetadata', 'FFmpegVideoConvertor', 'SponsorBlock', 'ModifyChapters'
+        ]
+        assert processor.get_ydl_postprocessors(PostProcessingOptions()) == [self.METADATA]
+
+    def test_software_h264_convert_args(self, processor):
+        """Test a CPU conversion to H.264 uses all threads and a fast preset."""
+        opts = processor.get_ydl_opts(PostProcessingOptions(convert_to="mp4", hwaccel="none"))
+
+        assert opts['postprocessor_args'] == {
+            'videoconvertor+ffmpeg_o': [
+                '-threads', str(PostProcessor.CONVERT_THREADS), '-preset', 'veryfast'
+            ],
+        }
+
+    def test_non_h264_convert_args(self, processor):
+        """Test conversions to other codecs only set the thread count."""
+        opts = processor.get_ydl_opts(PostProcessingOptions(convert_to="webm"))
+
+        assert opts['postprocessor_args'] == {
+            'videoconvertor+ffmpeg_o': ['-threads', str(PostProcessor.CONVERT_THREADS)],
+        }
+
+    def test_no_convert_args_without_conversion(self, processor):
+        """Test no encoder args are set when nothing is converted."""
+        assert 'postprocessor_args' not in processor.get_ydl_opts(PostProcessingOptions())
+        options = PostProcessingOptions(convert_to="mp4", extract_audio=True)
+        assert 'postprocessor_args' not in processor.get_ydl_opts(options)
@@ -94,6 +94,35 @@ class TestQueueManager:
         assert result is False
         assert len(queue_manager) == 1
 
+    def test_duplicate_url_allowed_once_final_or_removed(self, queue_manager):
+        """Test that a URL can be queued again after its item finishes or is removed."""
+        assert queue_manager.add(VideoItem(url="url1", id="v1"))
+        assert not queue_manager.add_multiple([VideoItem(url="url1", id="v2")])
+
+        queue_manager.update_status("v1", VideoStatus.COMPLETED)
+        assert queue_manager.add(VideoItem(url="url1", id="v2"))
+        assert queue_manager.get_by_url("url1").id == "v2"
+
+        queue_manager.remove("v2")
+        assert queue_manager.get_by_url("url1").id == "v1"
+        assert queue_manager.add(VideoItem(url="url1", id="v3"))
+        assert not queue_manager.add(VideoItem(url="url1", id="v4"))
+
+    def test_duplicate_url_tracked_across_retry(self, queue_manager):
+        """Test that a retried item keeps its URL taken after a newer copy finishes."""
+        queue_manager.add(VideoItem(url="url1", id="v1"))
+        queue_manager.update_status("v1", VideoStatus.ERROR)
+        assert queue_manager.add(VideoItem(url="url1", id="v2"))
+
+        assert queue_manager.retry_single("v1")
+        queue_manager.update_status("v2", VideoStatus.COMPLETED)
+
+        assert not queue_manager.add(VideoItem(url="url1", id="v3"))
+        assert queue_manager.get_by_url("url1").id == "v1"
+
+        queue_manager.update_status("v1", VideoStatus.COMPLETED)
+        assert queue_manager.add(VideoItem(url="url1", id="v3"))
+
     def test_remove_video(self, queue_manager, sample_video):
         """Test removing a video from the queue."""
         queue_manager.add(sample_video)
@@ -137,6 +166,39 @@ class TestQueueManager:
         assert video.progress == 75.5
         assert video.speed == 2000000.0
 
+    def test_update_progress_notifications_are_coalesced(self, queue_manager, sample_video):
+        """Test that rapid small progress ticks trigger few callbacks."""
+        updates = []
+        queue_manager.on_item_updated = lambda video: updates.append(video.progress)
+        queue_manager.add(sample_video)
+
+        for i in range(20):
+            queue_manager.update_progress("sample123", progress=10 + i * 0.01)
+        queue_manager.update_progress("sample123", progress=100.0)
+
+        assert updates[0] == 10
+        assert updates[-1] == 100.0
+        assert len(updates) < 5
+        assert queue_manager.get("sample123").progress == 100.0
+
+    def test_batch_callbacks_replace_per_item_callbacks(self, queue_manager):
+        """Test that batch operations report through the batch callbacks."""
+        events = []
+        queue_manager.on_item_added = lambda video: events.append(("added", video.id))
+        queue_manager.on_item_removed = lambda video: events.append(("removed", video.id))
+        queue_manager.on_items_removed = lambda videos: events.append(
+            ("removed_batch", [v.id for v in videos])
+        )
+
+        queue_manager.add_multiple([VideoItem(url=f"url{i}", id=f"v{i}") for i in range(3)])
+        queue_manager.remove_multiple(["v0", "v2", "missing"])
+        queue_manager.remove_multiple(["missing"])
+
+        assert events == [
+            ("added", "v0"), ("added", "v1"), ("added", "v2"),
+            ("removed_batch", ["v0", "v2"]),
+        ]
+
     def test_get_next_queued(self, queue_manager):
         """Test getting the next queued video."""
         video1 = VideoItem(url="url1", id="v1", title="Video 1")
@@ -153,6 +215,21 @@ class TestQueueManager:
         next_video = queue_manager.get_next_queued()
         assert next_video.id == "v2"
 
+    def test_wait_for_item(self, queue_manager):
+        """Test that a waiting thread is woken when an item is queued."""
+        assert queue_manager.wait_for_item(timeout=0.01) is None
+
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(queue_manager.wait_for_item(timeout=5))
+        )
+        waiter.start()
+        time.sleep(0.05)
+        queue_manager.add(VideoItem(url="url1", id="v1"))
+        waiter.join(timeout=5)
+
+        assert [v.id for v in results] == ["v1"]
+
     def test_get_all(self, queue_manager):
         """Test getting all videos."""
         video1 = VideoItem(url="url1", id="v1", title="Video 1")
@@ -182,6 +259,48 @@ class TestQueueManager:
         assert len(queued) == 1
         assert queued[0].id == "v1"
 
+    def test_reorder(self, queue_manager):
+        """Test moving videos within the queue."""
+        queue_manager.add_multiple([
+            VideoItem(url=f"url{i}", id=f"v{i}") for i in range(5)
+        ])
+
+        def order():
+            return [v.id for v in queue_manager.get_all()]
+
+        assert queue_manager.reorder("v0", 3)
+        assert order() == ["v1", "v2", "v3", "v0", "v4"]
+        assert queue_manager.reorder("v4", 1)
+        assert order() == ["v1", "v4", "v2", "v3", "v0"]
+        assert queue_manager.move_to_top("v0")
+        assert queue_manager.move_to_bottom("v1")
+        assert order() == ["v0", "v4", "v2", "v3", "v1"]
+        assert queue_manager.move_up("v2")
+        assert queue_manager.move_down("v0")
+        assert order() == ["v2", "v0", "v4", "v3", "v1"]
+        assert not queue_manager.move_up("v2")
+        assert not queue_manager.move_down("v1")
+        assert not queue_manager.reorder("missing", 0)
+
+    def test_status_queries_follow_queue_order(self, queue_manager):
+        """Test that status lookups return items in queue order after moves."""
+        queue_manager.add_multiple([
+            VideoItem(url=f"url{i}", id=f"v{i}") for i in range(4)
+        ])
+        queue_manager.update_status("v0", VideoStatus.ERROR)
+        queue_manager.move_to_bottom("v1")
+        queue_manager.retry_single("v0")
+
+        assert queue_manager.get_next_queued().id == "v0"
+        assert [v.id for v in queue_manager.get_by_status(VideoStatus.QUEUED)] == ["v0", "v2", "v3", "v1"]
+
+        queue_manager.update_status("v3", VideoStatus.DOWNLOADING)
+        queue_manager.update_status("v2", VideoStatus.EXTRACTING)
+        assert [v.id for v in queue_manager.get_active_downloads()] == ["v2", "v3"]
+        assert queue_manager.get_statistics()['by_status'] == {
+            'QUEUED': 2, 'EXTRACTING': 1, 'DOWNLOADING': 1,
+        }
+
     def test_clear_queue(self, queue_manager):
         """Test clearing the queue."""
         video1 = VideoItem(url="url1", id="v1", title="Video 1")